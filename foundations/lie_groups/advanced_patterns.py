@@ -12,16 +12,20 @@ physically realistic features for regenerative systems modeling.
 """
 
 import numpy as np
-from typing import List, Tuple, Optional, Callable
+from typing import List, Tuple, Optional, Callable, Union, Dict
 from dataclasses import dataclass
-from scipy.spatial.transform import Rotation as R
 
+from lie_kernels import hat, vee, so3_exp, so3_log
 from se3_double_scale import (
     SE3Pose,
     SE3Trajectory,
     compose_se3,
     compose_trajectory,
-    frobenius_distance_to_identity
+    frobenius_distance_to_identity,
+    RandomSource,
+    as_generator,
+    IntegratorType,
+    lie_group_step
 )
 
 
@@ -74,13 +78,13 @@ def compute_berry_phase(trajectory: SE3Trajectory, closed_loop: bool = True) ->
         # (This is the "return" operation)
         inverse_rotation = total.rotation.T
         inverse_translation = -inverse_rotation @ total.translation
-        closing = SE3Pose(rotation=inverse_rotation, translation=inverse_translation)
+        closing = SE3Pose._trusted(inverse_rotation, inverse_translation)
         closed_total = compose_se3(total, closing)
     else:
         closed_total = total
 
     # Extract geometric phase from deviation from identity
-    rotation_phase = R.from_matrix(closed_total.rotation).as_rotvec()
+    rotation_phase = so3_log(closed_total.rotation)
     translation_phase = closed_total.translation
 
     # Estimate loop area (using translation path length as proxy)
@@ -135,7 +139,7 @@ class HysteresisTracker:
         if previous is not None:
             # Relative transformation
             rel_rotation = previous.rotation.T @ pose.rotation
-            rel_rotvec = R.from_matrix(rel_rotation).as_rotvec()
+            rel_rotvec = so3_log(rel_rotation)
 
             rel_translation = pose.translation - previous.translation
 
@@ -185,7 +189,9 @@ class OrnsteinUhlenbeckProcess:
         target: SE3Pose,
         reversion_strength: float = 0.5,
         noise_amplitude: float = 0.1,
-        dt: float = 0.01
+        dt: float = 0.01,
+        rng: RandomSource = None,
+        integrator: Optional[Union[str, IntegratorType]] = None
     ):
         """
         Initialize OU process.
@@ -195,12 +201,33 @@ class OrnsteinUhlenbeckProcess:
             reversion_strength: Mean reversion rate θ
             noise_amplitude: Noise strength σ
             dt: Time step for integration
+            rng: Generator or seed for the process's private noise stream
+            integrator: Lie group scheme for the mean-reverting drift (see
+                lie_group_step), with noise applied by splitting; None keeps
+                the legacy Euler–Maruyama update in rotation-vector coordinates
         """
         self.target = target
         self.theta = reversion_strength
         self.sigma = noise_amplitude
         self.dt = dt
         self.current = SE3Pose.identity()
+        self.rng = as_generator(rng)
+        self.integrator = None if integrator is None else IntegratorType(integrator)
+
+    def drift(self, rotations: np.ndarray, translations: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean-reverting drift -θ(X - μ) as (ω, v) for lie_group_step.
+
+        Args:
+            rotations: (..., 3, 3) rotations
+            translations: (..., 3) translations
+
+        Returns:
+            (body angular velocity, translational velocity)
+        """
+        omega = self.theta * so3_log(np.swapaxes(rotations, -1, -2) @ self.target.rotation)
+        velocity = self.theta * (self.target.translation - translations)
+        return omega, velocity
 
     def step(self) -> SE3Pose:
         """
@@ -209,33 +236,56 @@ class OrnsteinUhlenbeckProcess:
         Returns:
             New SE(3) state after stochastic evolution
         """
+        # Stochastic noise (Brownian motion)
+        rot_noise = self.rng.normal(0, self.sigma, 3)
+        trans_noise = self.rng.normal(0, self.sigma, 3)
+        return self._advance(rot_noise, trans_noise)
+
+    def _advance(self, rot_noise: np.ndarray, trans_noise: np.ndarray) -> SE3Pose:
+        """Euler-Maruyama (or integrator + splitting) step with pre-drawn noise"""
+        rotation, translation = self._step_arrays(
+            self.current.rotation, self.current.translation, rot_noise, trans_noise
+        )
+        self.current = SE3Pose._trusted(rotation, translation)
+        return self.current
+
+    def _step_arrays(
+        self,
+        rotations: np.ndarray,
+        translations: np.ndarray,
+        rot_noise: np.ndarray,
+        trans_noise: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """One step on (..., 3, 3) / (..., 3) state arrays with pre-drawn noise"""
+        if self.integrator is not None:
+            rotations, translations = lie_group_step(
+                rotations, translations, self.drift, self.dt, self.integrator
+            )
+            return (rotations @ so3_exp(np.sqrt(self.dt) * rot_noise),
+                    translations + np.sqrt(self.dt) * trans_noise)
+
         # Compute relative transformation to target (logarithmic map)
-        rel_rotation = self.current.rotation.T @ self.target.rotation
-        rel_rotvec = R.from_matrix(rel_rotation).as_rotvec()
+        rel_rotation = np.swapaxes(rotations, -1, -2) @ self.target.rotation
+        rel_rotvec = so3_log(rel_rotation)
 
-        rel_translation = self.target.translation - self.current.translation
+        rel_translation = self.target.translation - translations
 
         # Mean reversion force (deterministic)
         rot_drift = self.theta * rel_rotvec
         trans_drift = self.theta * rel_translation
 
-        # Stochastic noise (Brownian motion)
-        rot_noise = np.random.normal(0, self.sigma, 3)
-        trans_noise = np.random.normal(0, self.sigma, 3)
-
         # Update via Euler-Maruyama scheme [5.1]
-        current_rotvec = self.current.to_rotation_vector()
+        current_rotvec = so3_log(rotations)
         new_rotvec = current_rotvec + self.dt * rot_drift + np.sqrt(self.dt) * rot_noise
-        new_rotation = R.from_rotvec(new_rotvec).as_matrix()
+        new_rotation = so3_exp(new_rotvec)
 
         new_translation = (
-            self.current.translation +
+            translations +
             self.dt * trans_drift +
             np.sqrt(self.dt) * trans_noise
         )
 
-        self.current = SE3Pose(rotation=new_rotation, translation=new_translation)
-        return self.current
+        return new_rotation, new_translation
 
     def simulate_trajectory(self, T: int) -> SE3Trajectory:
         """
@@ -247,15 +297,104 @@ class OrnsteinUhlenbeckProcess:
         Returns:
             SE(3) trajectory showing mean-reverting behavior
         """
-        poses = []
-        for _ in range(T):
-            pose = self.step()
-            poses.append(SE3Pose(
-                rotation=pose.rotation.copy(),
-                translation=pose.translation.copy()
-            ))
+        # Draw the whole noise path at once
+        noise = self.rng.normal(0, self.sigma, (T, 2, 3))
+        rotations = np.empty((T, 3, 3))
+        translations = np.empty((T, 3))
+        for t in range(T):
+            pose = self._advance(noise[t, 0], noise[t, 1])
+            rotations[t], translations[t] = pose.rotation, pose.translation
+
+        return SE3Trajectory.from_arrays(rotations, translations, bounded=False, validate=False)
+
+    def stationary_std(self) -> float:
+        """Per-axis standard deviation σ/√(2θ) of the stationary distribution"""
+        assert self.theta > 0, "Stationary distribution requires reversion_strength > 0"
+        return self.sigma / np.sqrt(2.0 * self.theta)
+
+    def simulate_ensemble(
+        self,
+        n_paths: int,
+        T: int,
+        exact: bool = True,
+        stationary_start: bool = False,
+        rng: RandomSource = None,
+        out: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate M independent OU paths over T steps as arrays [5.1]
+
+        With exact=True each step uses the exact OU transition instead of
+        Euler–Maruyama, so dt is not limited by stability (θ·dt may be ≫ 1):
 
-        return SE3Trajectory(poses, bounded=False)
+            x ← μ + e^{-θ dt} (x - μ) + σ √((1 - e^{-2θ dt}) / (2θ)) ξ
+
+        Translations follow this formula directly, so their transitions are
+        exact. Rotations apply it to the exponential coordinates
+        x = log(μ_R^T R) centered on the target. That reproduces the exact
+        geodesic contraction of the drift θ log(R^T μ_R), and it treats the
+        noise as additive in those coordinates. With exact=False the paths use
+        this process's step (Euler–Maruyama or its Lie group integrator),
+        vectorized over paths.
+
+        Args:
+            n_paths: Number of independent paths M
+            T: Number of time steps
+            exact: Use the exact transition (otherwise the step scheme)
+            stationary_start: Draw initial states from the stationary
+                distribution N(μ, σ²/(2θ)) instead of starting at self.current
+            rng: Generator or seed (default: this process's generator)
+            out: Optional preallocated ((M, T, 3, 3), (M, T, 3)) arrays to fill
+
+        Returns:
+            (rotations, translations) with shapes (M, T, 3, 3) and (M, T, 3)
+
+        Example:
+            >>> ou = OrnsteinUhlenbeckProcess(target, reversion_strength=0.5, dt=1.0)
+            >>> rotations, translations = ou.simulate_ensemble(5000, 200, stationary_start=True)
+        """
+        rng = self.rng if rng is None else as_generator(rng)
+        if out is None:
+            rotations_out = np.empty((n_paths, T, 3, 3))
+            translations_out = np.empty((n_paths, T, 3))
+        else:
+            rotations_out, translations_out = out
+            assert rotations_out.shape == (n_paths, T, 3, 3), "out[0] must be (M, T, 3, 3)"
+            assert translations_out.shape == (n_paths, T, 3), "out[1] must be (M, T, 3)"
+
+        target_rotation, target_translation = self.target.rotation, self.target.translation
+
+        # Initial state as deviation from the target: rotation chart x, translation offset d
+        if stationary_start:
+            std = self.stationary_std()
+            x = std * rng.standard_normal((n_paths, 3))
+            d = std * rng.standard_normal((n_paths, 3))
+        else:
+            x = np.broadcast_to(so3_log(target_rotation.T @ self.current.rotation), (n_paths, 3)).copy()
+            d = np.broadcast_to(self.current.translation - target_translation, (n_paths, 3)).copy()
+
+        if exact:
+            decay = np.exp(-self.theta * self.dt)
+            if self.theta > 0:
+                scale = self.sigma * np.sqrt(-np.expm1(-2.0 * self.theta * self.dt) / (2.0 * self.theta))
+            else:
+                scale = self.sigma * np.sqrt(self.dt)
+            for t in range(T):
+                noise = rng.standard_normal((2, n_paths, 3))
+                x = decay * x + scale * noise[0]
+                d = decay * d + scale * noise[1]
+                rotations_out[:, t] = target_rotation @ so3_exp(x)
+                translations_out[:, t] = target_translation + d
+        else:
+            rotations = target_rotation @ so3_exp(x)
+            translations = target_translation + d
+            for t in range(T):
+                noise = self.sigma * rng.standard_normal((2, n_paths, 3))
+                rotations, translations = self._step_arrays(rotations, translations, noise[0], noise[1])
+                rotations_out[:, t] = rotations
+                translations_out[:, t] = translations
+
+        return rotations_out, translations_out
 
 
 class ReturnQualityCalibrator:
@@ -485,27 +624,27 @@ def skew_symmetric(v: np.ndarray) -> np.ndarray:
            [ v3    0  -v1 ]
            [-v2   v1    0 ]
 
+    Also accepts stacks of vectors (..., 3) → (..., 3, 3); see lie_kernels.hat.
+
     Args:
         v: 3D vector
 
     Returns:
         3x3 skew-symmetric matrix
     """
-    return np.array([
-        [0, -v[2], v[1]],
-        [v[2], 0, -v[0]],
-        [-v[1], v[0], 0]
-    ])
+    return hat(v)
 
 
 def unskew_symmetric(M: np.ndarray) -> np.ndarray:
     """
     Convert skew-symmetric matrix to 3D vector.
 
+    Also accepts stacks of matrices (..., 3, 3) → (..., 3); see lie_kernels.vee.
+
     Args:
         M: 3x3 skew-symmetric matrix
 
     Returns:
         3D vector
     """
-    return np.array([M[2, 1], M[0, 2], M[1, 0]])
+    return vee(M)
@@ -0,0 +1,231 @@
+"""
+Streaming λ-Attractor Statistics
+
+VALIDATION_PROTOCOLS.md defines the λ Attractor Frequency
+#(λ ∈ attractor_range)/N and accepts a run when ≥ 40% of trials land
+near φ. Large sweeps produce more optimized λ values than should be kept in
+memory, so this module aggregates them as they stream in:
+
+- Nearest-resonance counts (same rule as ResonanceDetector: a value counts
+  toward its nearest constant c when |λ - c| ≤ tolerance · c)
+- A histogram on geometrically spaced bins, from which quantiles are read
+  with a known relative error (one bin ratio)
+- Count, mean, variance, min and max
+
+Memory is constant in the number of values, and two aggregators built with
+the same configuration merge exactly, so worker processes can each keep
+their own and the parent combines them.
+
+Example:
+    >>> stats = AttractorStatistics()
+    >>> for lambdas in batches:
+    ...     stats.update(lambdas)
+    >>> print(stats.frequencies()['golden_ratio'], stats.quantile(0.5))
+"""
+
+import numpy as np
+from typing import Dict, Optional, Tuple, Union
+
+from resonance_aware import ResonanceDetector
+
+
+def classify_attractors(
+    lambdas: np.ndarray,
+    detector: Optional[ResonanceDetector] = None
+) -> np.ndarray:
+    """
+    Index of the resonance constant each λ is attributed to.
+
+    Args:
+        lambdas: (N,) λ values
+        detector: Supplies constants and tolerance (default: ResonanceDetector())
+
+    Returns:
+        (N,) indices into detector.resonance_constants (in dict order),
+        -1 where λ lies within tolerance of no constant
+    """
+    detector = detector if detector is not None else ResonanceDetector()
+    lambdas = np.asarray(lambdas, dtype=float).reshape(-1)
+    constants = np.array(list(detector.resonance_constants.values()))
+
+    distances = np.abs(lambdas[:, None] - constants[None, :])
+    nearest = np.argmin(distances, axis=1) if len(constants) else np.zeros(len(lambdas), dtype=int)
+    within = distances[np.arange(len(lambdas)), nearest] <= detector.tolerance * constants[nearest]
+    return np.where(within, nearest, -1)
+
+
+class AttractorStatistics:
+    """
+    Constant-memory, mergeable aggregate of optimized λ values.
+
+    Attributes:
+        names: Resonance constant names (ResonanceDetector order)
+        constants: Values of the constants
+        tolerance: Relative resonance tolerance
+        bin_edges: Geometric histogram edges over lambda_range
+        histogram: Counts per bin, plus underflow [0] and overflow [-1]
+        resonance_counts: Counts per constant, plus 'none' at [-1]
+        count: Number of values seen
+        total: Sum of values
+        total_sq: Sum of squared values
+        minimum: Smallest value seen
+        maximum: Largest value seen
+    """
+
+    def __init__(
+        self,
+        detector: Optional[ResonanceDetector] = None,
+        lambda_range: Tuple[float, float] = (0.01, 100.0),
+        n_bins: int = 4096
+    ):
+        """
+        Initialize an empty aggregate.
+
+        Args:
+            detector: Supplies constants and tolerance (default: ResonanceDetector())
+            lambda_range: Histogram range (λ > 0); values outside are counted
+                in the under/overflow bins
+            n_bins: Number of geometric bins (relative quantile resolution
+                (λ_max/λ_min)^(1/n_bins) - 1, ≈ 0.23% by default)
+        """
+        detector = detector if detector is not None else ResonanceDetector()
+        assert 0 < lambda_range[0] < lambda_range[1], "lambda_range must be positive and increasing"
+        self.names = tuple(detector.resonance_constants)
+        self.constants = np.array(list(detector.resonance_constants.values()))
+        self.tolerance = detector.tolerance
+        self.bin_edges = np.geomspace(lambda_range[0], lambda_range[1], n_bins + 1)
+        self.histogram = np.zeros(n_bins + 2, dtype=np.int64)
+        self.resonance_counts = np.zeros(len(self.names) + 1, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    def _detector(self) -> ResonanceDetector:
+        detector = ResonanceDetector(tolerance=self.tolerance)
+        detector.resonance_constants = dict(zip(self.names, self.constants))
+        return detector
+
+    def update(self, lambdas: Union[float, np.ndarray]) -> 'AttractorStatistics':
+        """
+        Add a batch of λ values.
+
+        Args:
+            lambdas: Scalar or array of optimized λ values
+
+        Returns:
+            self (for chaining)
+        """
+        lambdas = np.asarray(lambdas, dtype=float).reshape(-1)
+        if lambdas.size == 0:
+            return self
+
+        bins = np.searchsorted(self.bin_edges, lambdas, side='right')
+        bins[lambdas == self.bin_edges[-1]] = len(self.bin_edges) - 1
+        self.histogram += np.bincount(bins, minlength=len(self.histogram))
+
+        attractors = classify_attractors(lambdas, self._detector())
+        self.resonance_counts += np.bincount(
+            np.where(attractors < 0, len(self.names), attractors),
+            minlength=len(self.resonance_counts)
+        )
+
+        self.count += lambdas.size
+        self.total += float(lambdas.sum())
+        self.total_sq += float(np.dot(lambdas, lambdas))
+        self.minimum = min(self.minimum, float(lambdas.min()))
+        self.maximum = max(self.maximum, float(lambdas.max()))
+        return self
+
+    def merge(self, other: 'AttractorStatistics') -> 'AttractorStatistics':
+        """
+        Fold another aggregate into this one (exact).
+
+        Args:
+            other: Aggregate built with the same constants, tolerance and bins
+
+        Returns:
+            self (for chaining)
+        """
+        assert self.names == other.names and np.array_equal(self.constants, other.constants), \
+            "Cannot merge aggregates over different resonance constants"
+        assert self.tolerance == other.tolerance, "Cannot merge aggregates with different tolerances"
+        assert np.array_equal(self.bin_edges, other.bin_edges), \
+            "Cannot merge aggregates with different histogram bins"
+
+        self.histogram += other.histogram
+        self.resonance_counts += other.resonance_counts
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else float('nan')
+
+    @property
+    def std(self) -> float:
+        if not self.count:
+            return float('nan')
+        return float(np.sqrt(max(self.total_sq / self.count - self.mean ** 2, 0.0)))
+
+    def frequencies(self) -> Dict[str, float]:
+        """
+        λ Attractor Frequency per constant (and 'none' for the remainder).
+
+        Returns:
+            Dictionary mapping constant name (and 'none') to frequency
+        """
+        total = max(self.count, 1)
+        frequencies = {
+            name: float(count) / total
+            for name, count in zip(self.names, self.resonance_counts[:-1])
+        }
+        frequencies['none'] = float(self.resonance_counts[-1]) / total
+        return frequencies
+
+    def meets_acceptance(self, constant: str = 'golden_ratio', threshold: float = 0.4) -> bool:
+        """VALIDATION_PROTOCOLS.md criterion: ≥ threshold of trials near `constant`"""
+        return self.frequencies()[constant] >= threshold
+
+    def quantile(self, q: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Approximate quantile(s) from the histogram.
+
+        Inside the histogram range the result is interpolated geometrically
+        within the bin holding the quantile, so its relative error is below
+        one bin ratio. Levels 0 and 1, and quantiles falling in the
+        under/overflow bins, return the observed minimum/maximum.
+
+        Args:
+            q: Quantile level(s) in [0, 1]
+
+        Returns:
+            Quantile value(s)
+        """
+        q = np.asarray(q, dtype=float)
+        assert np.all((q >= 0) & (q <= 1)), "Quantile levels must lie in [0, 1]"
+        if self.count == 0:
+            return np.full(q.shape, np.nan) if q.ndim else float('nan')
+
+        cumulative = np.cumsum(self.histogram)
+        rank = q * (self.count - 1) + 1
+        bins = np.minimum(np.searchsorted(cumulative, rank, side='left'), len(self.histogram) - 1)
+        inner = np.clip(bins, 1, len(self.bin_edges) - 1)
+
+        below = np.where(bins > 0, cumulative[np.maximum(bins - 1, 0)], 0)
+        fraction = np.clip((rank - below) / np.maximum(self.histogram[bins], 1), 0.0, 1.0)
+        lower, upper = self.bin_edges[inner - 1], self.bin_edges[inner]
+        values = lower * (upper / lower) ** fraction
+
+        values = np.where((bins == 0) | (q == 0), self.minimum, values)
+        values = np.where((bins == len(self.histogram) - 1) | (q == 1), self.maximum, values)
+        values = np.clip(values, self.minimum, self.maximum)
+        return float(values) if q.ndim == 0 else values
@@ -0,0 +1,209 @@
+"""
+Lockstep Batch Optimization of the Scaling Factor λ
+
+VALIDATION_METHODOLOGY.md Phase 1 needs λ_opt for N ≥ 1000 random
+trajectories. Calling optimize_scaling_factor N times runs N separate
+scipy loops of ~20-40 Python-level evaluations each. This module runs one
+vectorized bounded Brent search (golden section + parabolic steps, the
+algorithm behind scipy's `minimize_scalar(method='bounded')`) for all N
+trajectories in lockstep:
+
+- Every iteration evaluates all still-active members in one batched call
+- Each member converges on its own tolerance and is masked out
+- Results are arrays of λ_opt, error, iteration and evaluation counts
+
+Because the per-member arithmetic follows scipy's implementation step by
+step, each member's result matches optimize_scaling_factor on the same
+trajectory up to floating-point rounding of the cost evaluations.
+"""
+
+import numpy as np
+from typing import Callable, Sequence, Tuple, Union
+from dataclasses import dataclass
+
+from se3_double_scale import SE3Trajectory, SE3TrajectoryBatch, BatchReturnPlan
+
+
+@dataclass
+class BatchOptimizeResult:
+    """
+    Result of a lockstep batch optimization.
+
+    Attributes:
+        x: (N,) optimal λ per member
+        fun: (N,) return error at x
+        nit: (N,) Brent iterations per member
+        nfev: (N,) cost evaluations per member
+        converged: (N,) True where the tolerance was met before maxiter
+    """
+    x: np.ndarray
+    fun: np.ndarray
+    nit: np.ndarray
+    nfev: np.ndarray
+    converged: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+def minimize_scalar_bounded_batch(
+    func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    n: int,
+    bounds: Tuple[Union[float, np.ndarray], Union[float, np.ndarray]],
+    xatol: float = 1e-5,
+    maxiter: int = 500
+) -> BatchOptimizeResult:
+    """
+    Vectorized bounded Brent minimization of n scalar functions.
+
+    Port of scipy.optimize's bounded method with every branch turned into
+    a mask, so all members advance together.
+
+    Args:
+        func: Batched cost func(x, members) → f, where x and members are (M,)
+            arrays holding the trial points and indices of the active members
+        n: Number of independent problems
+        bounds: (lower, upper), scalars or (n,) arrays
+        xatol: Absolute tolerance on x (as in scipy)
+        maxiter: Maximum function evaluations per member (as in scipy)
+
+    Returns:
+        BatchOptimizeResult with per-member optima and counters
+    """
+    a = np.array(np.broadcast_to(bounds[0], (n,)), dtype=float)
+    b = np.array(np.broadcast_to(bounds[1], (n,)), dtype=float)
+    assert np.all(a <= b), "Lower bounds must not exceed upper bounds"
+
+    sqrt_eps = np.sqrt(2.2e-16)
+    golden_mean = 0.5 * (3.0 - np.sqrt(5.0))
+
+    fulc = a + golden_mean * (b - a)
+    nfc = fulc.copy()
+    xf = fulc.copy()
+    rat = np.zeros(n)
+    e = np.zeros(n)
+    fx = np.asarray(func(xf.copy(), np.arange(n)), dtype=float)
+    num = np.ones(n, dtype=int)
+    ffulc = fx.copy()
+    fnfc = fx.copy()
+
+    xm = 0.5 * (a + b)
+    tol1 = sqrt_eps * np.abs(xf) + xatol / 3.0
+    tol2 = 2.0 * tol1
+    active = np.abs(xf - xm) > (tol2 - 0.5 * (b - a))
+    converged = ~active
+
+    while np.any(active):
+        i = np.flatnonzero(active)
+        a_i, b_i, xf_i, fx_i = a[i], b[i], xf[i], fx[i]
+        nfc_i, fnfc_i, fulc_i, ffulc_i = nfc[i], fnfc[i], fulc[i], ffulc[i]
+        e_i, rat_i, xm_i, tol1_i, tol2_i = e[i], rat[i], xm[i], tol1[i], tol2[i]
+
+        # Parabolic fit through the three best points
+        r = (xf_i - nfc_i) * (fx_i - ffulc_i)
+        q = (xf_i - fulc_i) * (fx_i - fnfc_i)
+        p = (xf_i - fulc_i) * q - (xf_i - nfc_i) * r
+        q = 2.0 * (q - r)
+        p = np.where(q > 0.0, -p, p)
+        q = np.abs(q)
+        accept = (
+            (np.abs(e_i) > tol1_i)
+            & (np.abs(p) < np.abs(0.5 * q * e_i))
+            & (p > q * (a_i - xf_i))
+            & (p < q * (b_i - xf_i))
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rat_parabolic = np.where(accept, p / np.where(accept, q, 1.0), 0.0)
+        x_parabolic = xf_i + rat_parabolic
+        too_close = ((x_parabolic - a_i) < tol2_i) | ((b_i - x_parabolic) < tol2_i)
+        toward_middle = np.sign(xm_i - xf_i) + ((xm_i - xf_i) == 0)
+        rat_parabolic = np.where(too_close, tol1_i * toward_middle, rat_parabolic)
+
+        # Golden-section step wherever the parabola was rejected
+        e_golden = np.where(xf_i >= xm_i, a_i - xf_i, b_i - xf_i)
+        new_e = np.where(accept, rat_i, e_golden)
+        new_rat = np.where(accept, rat_parabolic, golden_mean * e_golden)
+
+        step_sign = np.sign(new_rat) + (new_rat == 0)
+        x = xf_i + step_sign * np.maximum(np.abs(new_rat), tol1_i)
+        fu = np.asarray(func(x, i), dtype=float)
+        num[i] += 1
+
+        # Shrink the bracket and rotate the three best points
+        improved = fu <= fx_i
+        right = x >= xf_i
+        new_a = np.where(improved, np.where(right, xf_i, a_i), np.where(right, a_i, x))
+        new_b = np.where(improved, np.where(right, b_i, xf_i), np.where(right, x, b_i))
+
+        second = ~improved & ((fu <= fnfc_i) | (nfc_i == xf_i))
+        third = ~improved & ~second & (
+            (fu <= ffulc_i) | (fulc_i == xf_i) | (fulc_i == nfc_i))
+
+        fulc[i] = np.where(improved | second, nfc_i, np.where(third, x, fulc_i))
+        ffulc[i] = np.where(improved | second, fnfc_i, np.where(third, fu, ffulc_i))
+        nfc[i] = np.where(improved, xf_i, np.where(second, x, nfc_i))
+        fnfc[i] = np.where(improved, fx_i, np.where(second, fu, fnfc_i))
+        xf[i] = np.where(improved, x, xf_i)
+        fx[i] = np.where(improved, fu, fx_i)
+        a[i], b[i], e[i], rat[i] = new_a, new_b, new_e, new_rat
+
+        xm[i] = 0.5 * (new_a + new_b)
+        tol1[i] = sqrt_eps * np.abs(xf[i]) + xatol / 3.0
+        tol2[i] = 2.0 * tol1[i]
+
+        done = np.abs(xf[i] - xm[i]) <= (tol2[i] - 0.5 * (new_b - new_a))
+        converged[i] = done
+        active[i] = ~done & (num[i] < maxiter)
+
+    return BatchOptimizeResult(
+        x=xf,
+        fun=fx,
+        nit=num - 1,
+        nfev=num,
+        converged=converged
+    )
+
+
+def optimize_scaling_factors(
+    trajectories: Union[Sequence[SE3Trajectory], SE3TrajectoryBatch, BatchReturnPlan],
+    lambda_bounds: Tuple[float, float] = (0.1, 2.0),
+    double: bool = True,
+    xatol: float = 1e-5,
+    maxiter: int = 500
+) -> BatchOptimizeResult:
+    """
+    Find optimal λ for many trajectories in lockstep [2.3]
+
+    Batch counterpart of optimize_scaling_factor: solves
+    argmin_λ ||G_λ^2 - I||_F independently for every trajectory, with one
+    vectorized cost evaluation per Brent iteration.
+
+    Args:
+        trajectories: SE(3) trajectories (any lengths), an SE3TrajectoryBatch,
+            or a compiled BatchReturnPlan
+        lambda_bounds: Search bounds for λ, shared or as (N,) arrays
+        double: Whether to use double-and-scale (ignored for a BatchReturnPlan)
+        xatol: Absolute tolerance on λ
+        maxiter: Maximum cost evaluations per trajectory
+
+    Returns:
+        BatchOptimizeResult with arrays of λ_opt, error and iteration counts
+
+    Example:
+        >>> batch = generate_random_trajectories(1000, T=10)
+        >>> result = optimize_scaling_factors(batch)
+        >>> print(result.x.mean(), result.nit.max())
+    """
+    if isinstance(trajectories, BatchReturnPlan):
+        plan = trajectories
+    elif isinstance(trajectories, SE3TrajectoryBatch):
+        plan = trajectories.return_plan(double=double)
+    else:
+        plan = BatchReturnPlan(trajectories, double=double)
+    return minimize_scalar_bounded_batch(
+        plan.error,
+        len(plan),
+        lambda_bounds,
+        xatol=xatol,
+        maxiter=maxiter
+    )
@@ -0,0 +1,318 @@
+"""
+Chebyshev Surrogate of the Return-Error Landscape E(λ)
+
+ResonanceAwareOptimizer.optimize_with_bias, multi_resonance_search and
+ReturnQualityCalibrator.calibrate all search the same 1-D function
+E(λ) = ||G_λ^n - I||_F of one trajectory. This module fits E once on an
+interval with an adaptive piecewise Chebyshev interpolant and answers
+value, minimum, window and threshold queries from the fit alone.
+
+Construction:
+- The interval is split into pieces; every piece is interpolated at the
+  Chebyshev points of the first kind (degree `degree`)
+- Each piece is checked against E on an independent, twice as dense grid of
+  Chebyshev points; pieces whose deviation exceeds `tol` are bisected
+- All pending pieces of one refinement round are evaluated in a single
+  batched ReturnPlan call
+
+Error estimate:
+- `error_estimate` is the largest deviation |E - S| observed on the check
+  grids, or the magnitude of the trailing Chebyshev coefficients if larger
+- Pieces that reach `min_width` without meeting `tol` (near-cusp minima)
+  are kept and their larger deviation is reported in `error_estimate`
+- It is an a-posteriori estimate, not a bound: E has V-shaped kinks where
+  the rotation of G_λ^n passes through the identity, and a piece can deviate
+  more between check points (up to ~1.3x the estimate on 200k-point grids)
+
+Queries (no further E evaluations):
+- surrogate(λ): value(s)
+- surrogate.minimum(lower, upper): (λ, E) of the lowest point in a window
+- surrogate.intervals_below(threshold): λ intervals with E ≤ threshold
+  (for a return quality Q = exp(-E), use threshold = -ln Q)
+
+Example:
+    >>> surrogate = build_landscape_surrogate(trajectory, (0.1, 10.0))
+    >>> lam, err = surrogate.minimum(0.7 * 0.618, 1.4 * 0.618)
+    >>> print(surrogate.error_estimate)
+"""
+
+import numpy as np
+from numpy.polynomial import chebyshev
+from typing import List, Optional, Tuple, Union
+from bisect import bisect_right
+from dataclasses import dataclass, field
+
+from se3_double_scale import SE3Trajectory, ReturnPlan
+
+
+@dataclass
+class LandscapeSurrogate:
+    """
+    Piecewise Chebyshev approximation of E(λ) on [breakpoints[0], breakpoints[-1]].
+
+    Attributes:
+        breakpoints: (P + 1,) sorted piece boundaries
+        coefficients: (P, degree + 1) Chebyshev coefficients per piece
+            (in the piece's local variable t ∈ [-1, 1])
+        error_estimate: Estimated max |E - S| (see module docstring; not a bound)
+        n_evaluations: Number of E evaluations spent on the fit
+        critical_lambdas: Interior stationary points of every piece
+        critical_errors: Value of each owning piece at critical_lambdas
+        endpoint_errors: (P, 2) value of each piece at its own start and end
+        piece_min: (P,) minimum of each piece's polynomial over the piece
+        piece_max: (P,) maximum of each piece's polynomial over the piece
+    """
+    breakpoints: np.ndarray
+    coefficients: np.ndarray
+    error_estimate: float
+    n_evaluations: int
+    critical_lambdas: np.ndarray
+    critical_errors: np.ndarray
+    endpoint_errors: np.ndarray
+    piece_min: np.ndarray
+    piece_max: np.ndarray
+    _breakpoint_list: Optional[List[float]] = field(default=None, repr=False, compare=False)
+    _coefficient_lists: Optional[List[List[float]]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def interval(self) -> Tuple[float, float]:
+        """Fitted λ interval"""
+        return float(self.breakpoints[0]), float(self.breakpoints[-1])
+
+    @property
+    def n_pieces(self) -> int:
+        return self.coefficients.shape[0]
+
+    def __call__(self, lambda_scale: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Surrogate value S(λ).
+
+        Args:
+            lambda_scale: Scaling factor(s) inside the fitted interval
+
+        Returns:
+            Float for scalar input, array of the same shape otherwise
+        """
+        lower, upper = self.interval
+        if isinstance(lambda_scale, (float, int)):
+            assert lower <= lambda_scale <= upper, \
+                f"λ outside the fitted interval [{lower}, {upper}]"
+            return self._value(float(lambda_scale))
+
+        lam = np.asarray(lambda_scale, dtype=float)
+        assert np.all((lam >= lower) & (lam <= upper)), \
+            f"λ outside the fitted interval [{lower}, {upper}]"
+        if lam.ndim == 0:
+            return self._value(float(lam))
+
+        flat = lam.reshape(-1)
+        piece = np.clip(np.searchsorted(self.breakpoints, flat, side='right') - 1,
+                        0, self.n_pieces - 1)
+        a, b = self.breakpoints[piece], self.breakpoints[piece + 1]
+        t = (2.0 * flat - a - b) / (b - a)
+
+        # Clenshaw recurrence, vectorized over points with per-point coefficients
+        c = self.coefficients[piece]
+        b1 = np.zeros_like(t)
+        b2 = np.zeros_like(t)
+        for j in range(c.shape[1] - 1, 0, -1):
+            b1, b2 = 2.0 * t * b1 - b2 + c[:, j], b1
+        values = t * b1 - b2 + c[:, 0]
+
+        return values.reshape(lam.shape)
+
+    def _value(self, lam: float) -> float:
+        """Scalar S(λ) by Clenshaw on Python floats (interactive fast path)"""
+        if self._coefficient_lists is None:
+            self._breakpoint_list = self.breakpoints.tolist()
+            self._coefficient_lists = [c[::-1].tolist() for c in self.coefficients]
+        k = min(max(bisect_right(self._breakpoint_list, lam) - 1, 0), self.n_pieces - 1)
+        a, b = self._breakpoint_list[k], self._breakpoint_list[k + 1]
+        t = (2.0 * lam - a - b) / (b - a)
+        reversed_coefficients = self._coefficient_lists[k]
+        b1 = b2 = 0.0
+        for c in reversed_coefficients[:-1]:
+            b1, b2 = 2.0 * t * b1 - b2 + c, b1
+        return t * b1 - b2 + reversed_coefficients[-1]
+
+    def minimum(
+        self,
+        lower: Optional[float] = None,
+        upper: Optional[float] = None
+    ) -> Tuple[float, float]:
+        """
+        Lowest surrogate point in a window [lower, upper].
+
+        The true minimum of E in the window is expected within about
+        error_estimate of the returned value (an estimate, not a guarantee).
+
+        Args:
+            lower: Window start (default: start of the fitted interval)
+            upper: Window end (default: end of the fitted interval)
+
+        Returns:
+            (λ, S(λ))
+        """
+        lo, hi = self.interval
+        lower = lo if lower is None else max(lower, lo)
+        upper = hi if upper is None else min(upper, hi)
+        assert lower <= upper, "Empty window"
+
+        inside = (self.critical_lambdas >= lower) & (self.critical_lambdas <= upper)
+        # Piece ends inside the window, each valued by its own polynomial
+        ends = np.stack([self.breakpoints[:-1], self.breakpoints[1:]], axis=1)
+        ends_inside = (ends >= lower) & (ends <= upper)
+        candidates = np.concatenate([self.critical_lambdas[inside], ends[ends_inside], [lower, upper]])
+        values = np.concatenate([self.critical_errors[inside], self.endpoint_errors[ends_inside],
+                                 [self._value(lower), self._value(upper)]])
+        best = int(np.argmin(values))
+        return float(candidates[best]), float(values[best])
+
+    def argmin(self, lower: Optional[float] = None, upper: Optional[float] = None) -> float:
+        """λ of the lowest surrogate point in a window"""
+        return self.minimum(lower, upper)[0]
+
+    def intervals_below(self, threshold: float) -> List[Tuple[float, float]]:
+        """
+        Maximal λ intervals on which S(λ) ≤ threshold.
+
+        Args:
+            threshold: Error level (e.g. -ln Q for a target quality Q)
+
+        Returns:
+            Sorted list of disjoint (start, end) intervals
+        """
+        # Breakpoints split segments where adjacent pieces disagree slightly
+        crossings = list(self.breakpoints)
+        # Only pieces whose range straddles the threshold can cross it
+        straddling = np.flatnonzero((self.piece_min <= threshold) & (self.piece_max >= threshold))
+        for k in straddling:
+            a, b = self.breakpoints[k], self.breakpoints[k + 1]
+            shifted = self.coefficients[k].copy()
+            shifted[0] -= threshold
+            roots = chebyshev.chebroots(shifted)
+            roots = roots.real[(np.abs(roots.imag) < 1e-9) & (np.abs(roots.real) <= 1.0)]
+            crossings.extend(0.5 * (a + b) + 0.5 * (b - a) * roots)
+        crossings = np.unique(crossings)
+
+        # Classify each segment between consecutive crossings by its midpoint
+        below = self(0.5 * (crossings[:-1] + crossings[1:])) <= threshold
+        intervals: List[Tuple[float, float]] = []
+        for start, end, inside in zip(crossings[:-1], crossings[1:], below):
+            if not inside:
+                continue
+            if intervals and intervals[-1][1] == start:
+                intervals[-1] = (intervals[-1][0], float(end))
+            else:
+                intervals.append((float(start), float(end)))
+        return intervals
+
+
+def _chebyshev_nodes(n: int) -> np.ndarray:
+    """Chebyshev points of the first kind on [-1, 1], ascending"""
+    return np.cos(np.pi * (np.arange(n) + 0.5) / n)[::-1]
+
+
+def build_landscape_surrogate(
+    trajectory: Union[SE3Trajectory, ReturnPlan],
+    lambda_range: Tuple[float, float] = (0.1, 10.0),
+    tol: float = 1e-8,
+    degree: int = 24,
+    initial_pieces: int = 8,
+    min_width: float = 1e-6,
+    max_pieces: int = 2048,
+    double: bool = True
+) -> LandscapeSurrogate:
+    """
+    Fit a piecewise Chebyshev surrogate of E(λ) [2.3]
+
+    Args:
+        trajectory: SE(3) trajectory, or an already compiled plan
+            (any object with a batched error(λ))
+        lambda_range: Interval (λ_min, λ_max) to fit
+        tol: Target max deviation |E - S| per piece
+        degree: Polynomial degree per piece
+        initial_pieces: Equal pieces the interval is first split into
+        min_width: Pieces narrower than this are accepted regardless of tol
+        max_pieces: Hard cap on the number of pieces
+        double: Whether to double the trajectory (ignored for a plan)
+
+    Returns:
+        LandscapeSurrogate (see error_estimate for its accuracy)
+    """
+    plan = ReturnPlan(trajectory, double) if isinstance(trajectory, SE3Trajectory) else trajectory
+    lower, upper = lambda_range
+    assert lower < upper, "lambda_range must be increasing"
+
+    n = degree + 1
+    nodes = _chebyshev_nodes(n)
+    checks = _chebyshev_nodes(2 * n + 1)
+    # Interpolation matrix: coefficients = values @ transform
+    j = np.arange(n)
+    transform = (2.0 / n) * np.cos(np.outer(np.arccos(nodes), j))
+    transform[:, 0] *= 0.5
+    check_basis = np.cos(np.outer(np.arccos(checks), j))
+
+    edges = np.linspace(lower, upper, initial_pieces + 1)
+    pending = list(zip(edges[:-1], edges[1:]))
+    accepted: List[Tuple[float, float, np.ndarray, float]] = []
+    n_evaluations = 0
+
+    while pending:
+        a = np.array([piece[0] for piece in pending])[:, None]
+        b = np.array([piece[1] for piece in pending])[:, None]
+        points = np.concatenate([
+            0.5 * (a + b) + 0.5 * (b - a) * nodes,
+            0.5 * (a + b) + 0.5 * (b - a) * checks
+        ], axis=1)
+        values = plan.error(points.ravel()).reshape(points.shape)
+        n_evaluations += points.size
+
+        coefficients = values[:, :n] @ transform
+        deviation = np.max(np.abs(coefficients @ check_basis.T - values[:, n:]), axis=1)
+        tail = np.sum(np.abs(coefficients[:, -2:]), axis=1)
+        bounds = np.maximum(deviation, tail)
+
+        splits = []
+        for k, (lo, hi) in enumerate(pending):
+            full = len(accepted) + len(splits) + len(pending) - k >= max_pieces
+            if bounds[k] <= tol or (hi - lo) <= min_width or full:
+                accepted.append((lo, hi, coefficients[k], bounds[k]))
+            else:
+                mid = 0.5 * (lo + hi)
+                splits.extend([(lo, mid), (mid, hi)])
+        pending = splits
+
+    accepted.sort(key=lambda piece: piece[0])
+    breakpoints = np.array([piece[0] for piece in accepted] + [accepted[-1][1]])
+    coefficients = np.array([piece[2] for piece in accepted])
+
+    # Stationary points and value range of each piece, precomputed for queries.
+    # Every piece is valued by its own polynomial, at both of its ends too.
+    critical, critical_values = [], []
+    endpoint_errors = np.empty((len(accepted), 2))
+    piece_min = np.empty(len(accepted))
+    piece_max = np.empty(len(accepted))
+    for k, c in enumerate(coefficients):
+        roots = chebyshev.chebroots(chebyshev.chebder(c)) if degree > 1 else np.zeros(0)
+        roots = roots.real[(np.abs(roots.imag) < 1e-9) & (np.abs(roots.real) <= 1.0)]
+        a, b = breakpoints[k], breakpoints[k + 1]
+        root_values = chebyshev.chebval(roots, c)
+        endpoint_errors[k] = chebyshev.chebval([-1.0, 1.0], c)
+        piece_min[k] = min(endpoint_errors[k].min(), root_values.min(initial=np.inf))
+        piece_max[k] = max(endpoint_errors[k].max(), root_values.max(initial=-np.inf))
+        critical.extend(0.5 * (a + b) + 0.5 * (b - a) * roots)
+        critical_values.extend(root_values)
+    order = np.argsort(critical, kind='stable')
+
+    return LandscapeSurrogate(
+        breakpoints=breakpoints,
+        coefficients=coefficients,
+        error_estimate=float(max(piece[3] for piece in accepted)),
+        n_evaluations=n_evaluations,
+        critical_lambdas=np.array(critical)[order],
+        critical_errors=np.array(critical_values)[order],
+        endpoint_errors=endpoint_errors,
+        piece_min=piece_min,
+        piece_max=piece_max
+    )
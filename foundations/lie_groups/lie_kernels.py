@@ -0,0 +1,283 @@
+"""
+Batched Lie-Algebra Kernels for SO(3) and SE(3)
+
+Closed-form hat/vee, exponential, logarithm and left Jacobian maps that
+operate on whole stacks of rotations at once. Every function accepts
+arrays with arbitrary leading batch dimensions: (..., 3) vectors and
+(..., 3, 3) matrices, so a single call handles one pose, a trajectory
+(T, 3, 3) or a batch of trajectories (K, T, 3, 3).
+
+These kernels are the hot path underneath scaling, walker steps and noise
+trials in se3_double_scale.py, advanced_patterns.py and resonance_aware.py.
+They replace per-pose round-trips through scipy's Rotation object.
+
+Numerical notes [2.3]:
+- Small angles (θ < 1e-4) use Taylor expansions of the Rodrigues
+  coefficients so no division by θ ever happens near the identity.
+- The logarithm near θ = π recovers the axis from the symmetric part of R,
+  where the antisymmetric part carries no usable information.
+
+SE(3) conventions follow the rest of the package: twists are 6-vectors
+ξ = (ω, ρ) with the rotation part first, and the group element is
+g = [R p; 0 1] with R = exp([ω]×) and p = J(ω) ρ.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+# Below this angle the Rodrigues coefficients switch to Taylor series
+SMALL_ANGLE = 1e-4
+
+# Within this distance of π the logarithm uses the symmetric-part branch
+NEAR_PI = 1e-3
+
+
+def hat(v: np.ndarray) -> np.ndarray:
+    """
+    Map vectors to skew-symmetric matrices: (..., 3) → (..., 3, 3)
+
+    [v]× = [  0  -v3   v2 ]
+           [ v3    0  -v1 ]
+           [-v2   v1    0 ]
+
+    Args:
+        v: Array of 3D vectors
+
+    Returns:
+        Array of so(3) elements
+    """
+    v = np.asarray(v, dtype=float)
+    M = np.zeros(v.shape[:-1] + (3, 3))
+    M[..., 0, 1] = -v[..., 2]
+    M[..., 0, 2] = v[..., 1]
+    M[..., 1, 0] = v[..., 2]
+    M[..., 1, 2] = -v[..., 0]
+    M[..., 2, 0] = -v[..., 1]
+    M[..., 2, 1] = v[..., 0]
+    return M
+
+
+def vee(M: np.ndarray) -> np.ndarray:
+    """
+    Map skew-symmetric matrices to vectors: (..., 3, 3) → (..., 3)
+
+    Inverse of `hat`. Only the lower-triangular entries are read, matching
+    the single-matrix convention of advanced_patterns.unskew_symmetric.
+
+    Args:
+        M: Array of so(3) elements
+
+    Returns:
+        Array of 3D vectors
+    """
+    M = np.asarray(M, dtype=float)
+    return np.stack([M[..., 2, 1], M[..., 0, 2], M[..., 1, 0]], axis=-1)
+
+
+def _angles(v: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Rotation angles θ, θ² and a mask of small-angle entries"""
+    theta_sq = np.sum(v * v, axis=-1)
+    theta = np.sqrt(theta_sq)
+    return theta, theta_sq, theta < SMALL_ANGLE
+
+
+def _rodrigues_coefficients(v: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    A = sin θ / θ and B = (1 - cos θ) / θ², with Taylor branches near 0.
+    """
+    theta, theta_sq, small = _angles(v)
+    safe = np.where(small, 1.0, theta)
+    A = np.where(small, 1.0 - theta_sq / 6.0 + theta_sq ** 2 / 120.0,
+                 np.sin(safe) / safe)
+    B = np.where(small, 0.5 - theta_sq / 24.0 + theta_sq ** 2 / 720.0,
+                 (1.0 - np.cos(safe)) / safe ** 2)
+    return A, B
+
+
+def so3_exp(v: np.ndarray) -> np.ndarray:
+    """
+    Rodrigues exponential map so(3) → SO(3): (..., 3) → (..., 3, 3) [2.3]
+
+    R = I + A [v]× + B [v]×²
+
+    Args:
+        v: Array of rotation vectors (axis-angle)
+
+    Returns:
+        Array of rotation matrices
+    """
+    v = np.asarray(v, dtype=float)
+    A, B = _rodrigues_coefficients(v)
+    K = hat(v)
+    return np.eye(3) + A[..., None, None] * K + B[..., None, None] * (K @ K)
+
+
+def so3_log(Rm: np.ndarray) -> np.ndarray:
+    """
+    Logarithm map SO(3) → so(3): (..., 3, 3) → (..., 3) [2.3]
+
+    Returns rotation vectors with angle in [0, π], matching
+    scipy.spatial.transform.Rotation.as_rotvec.
+
+    Args:
+        Rm: Array of rotation matrices
+
+    Returns:
+        Array of rotation vectors (axis-angle)
+    """
+    Rm = np.asarray(Rm, dtype=float)
+    # Antisymmetric part: vee(R - Rᵀ) = 2 sin θ · n
+    w = vee(Rm - np.swapaxes(Rm, -1, -2))
+    sin_theta = 0.5 * np.linalg.norm(w, axis=-1)
+    cos_theta = 0.5 * (np.trace(Rm, axis1=-2, axis2=-1) - 1.0)
+    theta = np.arctan2(sin_theta, cos_theta)
+
+    small = theta < SMALL_ANGLE
+    safe_sin = np.where(small, 1.0, sin_theta)
+    # θ / (2 sin θ) with Taylor branch 1/2 + θ²/12 near the identity
+    factor = np.where(small, 0.5 + theta ** 2 / 12.0, theta / (2.0 * safe_sin))
+    rot_vecs = factor[..., None] * w
+
+    near_pi = theta > np.pi - NEAR_PI
+    if np.any(near_pi):
+        rot_vecs[near_pi] = _log_near_pi(Rm[near_pi], theta[near_pi], w[near_pi])
+    return rot_vecs
+
+
+def _log_near_pi(Rm: np.ndarray, theta: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """
+    Axis recovery near θ = π from the symmetric part of R.
+
+    (R + Rᵀ)/2 - cos θ · I = (1 - cos θ) n nᵀ, so the row with the largest
+    diagonal entry gives a well-conditioned multiple of the axis n. The sign
+    is fixed by the (small) antisymmetric part, which is proportional to n.
+    """
+    cos_theta = np.cos(theta)
+    S = 0.5 * (Rm + np.swapaxes(Rm, -1, -2)) - cos_theta[:, None, None] * np.eye(3)
+    rows = np.argmax(np.diagonal(S, axis1=-2, axis2=-1), axis=-1)
+    axis = S[np.arange(len(rows)), rows]
+    axis /= np.linalg.norm(axis, axis=-1, keepdims=True)
+    sign = np.where(np.sum(axis * w, axis=-1) < 0.0, -1.0, 1.0)
+    return (sign * theta)[:, None] * axis
+
+
+def so3_left_jacobian(v: np.ndarray) -> np.ndarray:
+    """
+    Left Jacobian of SO(3): (..., 3) → (..., 3, 3)
+
+    J(v) = I + B [v]× + C [v]×²,  C = (θ - sin θ) / θ³
+
+    Relates perturbations of the rotation vector to left-multiplied
+    rotations: exp(v + δ) ≈ exp(J(v) δ) exp(v). Also the V-matrix of the
+    SE(3) exponential, p = J(ω) ρ.
+
+    Args:
+        v: Array of rotation vectors
+
+    Returns:
+        Array of 3x3 Jacobians
+    """
+    v = np.asarray(v, dtype=float)
+    theta, theta_sq, small = _angles(v)
+    safe = np.where(small, 1.0, theta)
+    B = np.where(small, 0.5 - theta_sq / 24.0 + theta_sq ** 2 / 720.0,
+                 (1.0 - np.cos(safe)) / safe ** 2)
+    C = np.where(small, 1.0 / 6.0 - theta_sq / 120.0 + theta_sq ** 2 / 5040.0,
+                 (safe - np.sin(safe)) / safe ** 3)
+    K = hat(v)
+    return np.eye(3) + B[..., None, None] * K + C[..., None, None] * (K @ K)
+
+
+def so3_left_jacobian_inverse(v: np.ndarray) -> np.ndarray:
+    """
+    Inverse left Jacobian of SO(3): (..., 3) → (..., 3, 3)
+
+    J⁻¹(v) = I - ½ [v]× + D [v]×²,  D = (1 - θ sin θ / (2 (1 - cos θ))) / θ²
+
+    The right Jacobian inverse is obtained as so3_left_jacobian_inverse(-v).
+
+    Args:
+        v: Array of rotation vectors (|v| < 2π)
+
+    Returns:
+        Array of 3x3 inverse Jacobians
+    """
+    v = np.asarray(v, dtype=float)
+    theta, theta_sq, small = _angles(v)
+    safe = np.where(small, 1.0, theta)
+    D = np.where(
+        small,
+        1.0 / 12.0 + theta_sq / 720.0 + theta_sq ** 2 / 30240.0,
+        (1.0 - safe * np.sin(safe) / (2.0 * (1.0 - np.cos(safe)))) / safe ** 2
+    )
+    K = hat(v)
+    return np.eye(3) - 0.5 * K + D[..., None, None] * (K @ K)
+
+
+def se3_hat(xi: np.ndarray) -> np.ndarray:
+    """
+    Map twists to 4x4 se(3) matrices: (..., 6) → (..., 4, 4)
+
+    Args:
+        xi: Array of twists (ω, ρ), rotation part first
+
+    Returns:
+        Array of se(3) elements [[ω]× ρ; 0 0]
+    """
+    xi = np.asarray(xi, dtype=float)
+    M = np.zeros(xi.shape[:-1] + (4, 4))
+    M[..., :3, :3] = hat(xi[..., :3])
+    M[..., :3, 3] = xi[..., 3:]
+    return M
+
+
+def se3_vee(M: np.ndarray) -> np.ndarray:
+    """
+    Map 4x4 se(3) matrices to twists: (..., 4, 4) → (..., 6)
+
+    Args:
+        M: Array of se(3) elements
+
+    Returns:
+        Array of twists (ω, ρ)
+    """
+    M = np.asarray(M, dtype=float)
+    return np.concatenate([vee(M[..., :3, :3]), M[..., :3, 3]], axis=-1)
+
+
+def se3_exp(xi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exponential map se(3) → SE(3): (..., 6) → ((..., 3, 3), (..., 3))
+
+    R = exp([ω]×),  p = J(ω) ρ
+
+    Args:
+        xi: Array of twists (ω, ρ)
+
+    Returns:
+        (rotations, translations)
+    """
+    xi = np.asarray(xi, dtype=float)
+    omega, rho = xi[..., :3], xi[..., 3:]
+    J = so3_left_jacobian(omega)
+    return so3_exp(omega), np.einsum('...ij,...j->...i', J, rho)
+
+
+def se3_log(Rm: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """
+    Logarithm map SE(3) → se(3): ((..., 3, 3), (..., 3)) → (..., 6)
+
+    ω = log(R),  ρ = J(ω)⁻¹ p
+
+    Args:
+        Rm: Array of rotation matrices
+        p: Array of translations
+
+    Returns:
+        Array of twists (ω, ρ)
+    """
+    omega = so3_log(Rm)
+    J_inv = so3_left_jacobian_inverse(omega)
+    rho = np.einsum('...ij,...j->...i', J_inv, np.asarray(p, dtype=float))
+    return np.concatenate([omega, rho], axis=-1)
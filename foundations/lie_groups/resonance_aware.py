@@ -34,19 +34,30 @@ Current use cases:
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
-from scipy.optimize import minimize_scalar, basinhopping
+from typing import Dict, List, Tuple, Optional, Any, Sequence, Union
+import time
+from dataclasses import dataclass, field
+from scipy.optimize import minimize_scalar
+from concurrent.futures import ProcessPoolExecutor
+
+from lie_kernels import so3_exp, so3_log
 
 from se3_double_scale import (
     SE3Pose,
     SE3Trajectory,
+    SE3TrajectoryBatch,
     compose_trajectory,
-    scale_trajectory,
-    double_trajectory,
     frobenius_distance_to_identity,
-    compute_return_error
+    BatchReturnPlan,
+    scan_return_landscape,
+    ReturnLandscape,
+    global_scaling_search,
+    RandomSource,
+    as_generator
 )
+from return_cache import ReturnErrorCache, get_return_cache, return_cache_scope
+from batch_optimize import minimize_scalar_bounded_batch
+from landscape_surrogate import LandscapeSurrogate
 
 
 @dataclass
@@ -56,6 +67,37 @@ class ResonanceResult:
     best_error: float
     all_resonances: Dict[str, float]
     is_natural: bool  # True if system prefers mathematical constant over arbitrary value
+    optimal_lambda: Optional[float] = None  # λ of the optimum compared against
+    optimal_error: Optional[float] = None
+
+
+class _TestScalingPlan:
+    """Plan-like adapter routing E(λ) through a detector's test_scaling"""
+
+    def __init__(self, detector: 'ResonanceDetector', trajectory: SE3Trajectory):
+        self.detector = detector
+        self.trajectory = trajectory
+
+    def error(self, lambdas):
+        values = np.array([
+            self.detector.test_scaling(self.trajectory, float(lam)) for lam in np.ravel(lambdas)
+        ])
+        return values.reshape(np.shape(lambdas)) if np.ndim(lambdas) else float(values[0])
+
+
+class _TestScalingBatchPlan:
+    """BatchReturnPlan-like adapter over per-trajectory _TestScalingPlans"""
+
+    def __init__(self, plans: List[_TestScalingPlan]):
+        self.plans = plans
+
+    def __len__(self) -> int:
+        return len(self.plans)
+
+    def error(self, lambdas: np.ndarray, members: Optional[np.ndarray] = None) -> np.ndarray:
+        lam = np.asarray(lambdas, dtype=float)
+        members = np.arange(len(self)) if members is None else np.asarray(members)
+        return np.array([self.plans[m].error(row) for m, row in zip(members, lam)]).reshape(lam.shape)
 
 
 class ResonanceDetector:
@@ -111,9 +153,13 @@ class ResonanceDetector:
         Returns:
             Return error (lower is better)
         """
-        return compute_return_error(trajectory, lambda_test, double=True)
+        return get_return_cache().error(trajectory, lambda_test, double=True)
 
-    def detect_natural_scaling(self, trajectory: SE3Trajectory) -> ResonanceResult:
+    def detect_natural_scaling(
+        self,
+        trajectory: SE3Trajectory,
+        method: str = 'bounded'
+    ) -> ResonanceResult:
         """
         Test if system prefers mathematical constants [Opus insight]
 
@@ -123,39 +169,178 @@ class ResonanceDetector:
 
         Args:
             trajectory: SE(3) trajectory to analyze
+            method: 'bounded' (Brent over (0.1, 10.0), may stop in a local
+                basin) or 'global' (scan plus top-k basin refinement)
 
         Returns:
             ResonanceResult with best resonance and comparison
         """
-        # Test all resonance constants
-        results = {}
-        for name, ratio in self.resonance_constants.items():
-            error = self.test_scaling(trajectory, ratio)
-            results[name] = error
+        plan = self._return_plan(trajectory)
 
-        # Find best natural resonance
+        # Test all resonance constants in one batched evaluation
+        names = list(self.resonance_constants)
+        errors = plan.error(np.array([self.resonance_constants[n] for n in names]))
+        results = {name: float(value) for name, value in zip(names, errors)}
+
+        # Compare best natural resonance to optimized value (unbounded optimization)
+        if method == 'global':
+            opt_result = global_scaling_search(plan, (0.1, 10.0))
+        else:
+            opt_result = minimize_scalar(
+                plan.error,
+                bounds=(0.1, 10.0),
+                method='bounded'
+            )
+
+        return self._resonance_result(results, opt_result.x, opt_result.fun)
+
+    def _return_plan(self, trajectory: SE3Trajectory):
+        """
+        Batched E(λ) behind detect_natural_scaling.
+
+        Subclasses that override test_scaling are honoured: the override is
+        called once per λ. Otherwise one shared, memoized plan serves every
+        constant and the optimizer.
+        """
+        if not self._overrides_test_scaling():
+            return get_return_cache().plan(trajectory, double=True)
+        return _TestScalingPlan(self, trajectory)
+
+    def _batch_return_plan(
+        self,
+        trajectories: Union[Sequence[SE3Trajectory], SE3TrajectoryBatch]
+    ):
+        """
+        Batched E(λ) over many trajectories behind detect_many.
+
+        With an overridden test_scaling, every member falls back to its own
+        per-trajectory plan.
+        """
+        if self._overrides_test_scaling():
+            return _TestScalingBatchPlan([
+                _TestScalingPlan(self, trajectories[k]) for k in range(len(trajectories))
+            ])
+        if isinstance(trajectories, SE3TrajectoryBatch):
+            return trajectories.return_plan()
+        return BatchReturnPlan(trajectories)
+
+    def _overrides_test_scaling(self) -> bool:
+        return type(self).test_scaling is not ResonanceDetector.test_scaling
+
+    def _resonance_result(
+        self,
+        results: Dict[str, float],
+        optimal_lambda: float,
+        optimal_error: float
+    ) -> ResonanceResult:
+        """Compare the best constant against an optimum"""
         best_resonance = min(results, key=results.get)
         best_error = results[best_resonance]
 
-        # Compare to optimized value (unbounded optimization)
-        from scipy.optimize import minimize_scalar
-        opt_result = minimize_scalar(
-            lambda lam: self.test_scaling(trajectory, lam),
-            bounds=(0.1, 10.0),
-            method='bounded'
-        )
-        optimal_error = opt_result.fun
-
         # System prefers natural constant if within tolerance of optimal
-        is_natural = best_error <= optimal_error * (1 + self.tolerance)
+        is_natural = bool(best_error <= optimal_error * (1 + self.tolerance))
 
         return ResonanceResult(
             best_resonance=best_resonance,
             best_error=best_error,
             all_resonances=results,
-            is_natural=is_natural
+            is_natural=is_natural,
+            optimal_lambda=float(optimal_lambda),
+            optimal_error=float(optimal_error)
         )
 
+    def _grid(self, lambda_range: Tuple[float, float], resolution: int) -> Tuple[List[str], np.ndarray]:
+        """Constant names and the λ grid with the constants appended"""
+        names = list(self.resonance_constants)
+        grid = np.linspace(lambda_range[0], lambda_range[1], resolution)
+        constants = np.array([self.resonance_constants[name] for name in names])
+        return names, np.concatenate([grid, constants])
+
+    def detect_with_landscape(
+        self,
+        trajectory: SE3Trajectory,
+        lambda_range: Tuple[float, float] = (0.1, 10.0),
+        resolution: int = 200
+    ) -> Tuple[ResonanceResult, ReturnLandscape]:
+        """
+        Single-pass resonance detection from one shared batched evaluation.
+
+        The λ grid and the resonance constants are evaluated together in one
+        batched call. The constants are read off that evaluation, and the
+        optimum is refined only inside the grid bracket of the lowest grid
+        point. Unlike detect_natural_scaling, the comparison is therefore
+        against the global optimum on the grid, not whichever local minimum
+        a bounded search happens to reach.
+
+        Args:
+            trajectory: SE(3) trajectory to analyze
+            lambda_range: Interval (λ_min, λ_max) searched for the optimum
+            resolution: Grid points in the shared landscape
+
+        Returns:
+            (ResonanceResult, ReturnLandscape over lambda_range)
+        """
+        plan = self._return_plan(trajectory)
+        names, lambdas = self._grid(lambda_range, resolution)
+        # Array arguments bypass the memo: one batched call on the compiled plan
+        errors = plan.error(lambdas)
+        landscape = ReturnLandscape.from_errors(lambdas[:resolution], errors[:resolution])
+        results = {name: float(error) for name, error in zip(names, errors[resolution:])}
+
+        index = int(np.argmin(landscape.errors))
+        refined = minimize_scalar(plan.error, bounds=landscape.bracket(index), method='bounded')
+        if refined.fun <= landscape.errors[index]:
+            optimum = (float(refined.x), float(refined.fun))
+        else:
+            optimum = (float(landscape.lambdas[index]), float(landscape.errors[index]))
+
+        return self._resonance_result(results, *optimum), landscape
+
+    def detect_many(
+        self,
+        trajectories: Union[Sequence[SE3Trajectory], SE3TrajectoryBatch],
+        lambda_range: Tuple[float, float] = (0.1, 10.0),
+        resolution: int = 200,
+        xatol: float = 1e-5
+    ) -> List[Tuple[ResonanceResult, ReturnLandscape]]:
+        """
+        Batch counterpart of detect_with_landscape.
+
+        All N landscapes are evaluated as one (N, resolution + constants)
+        batch and the N bracket refinements run as one lockstep Brent search.
+
+        Args:
+            trajectories: N trajectories (any lengths), or an SE3TrajectoryBatch
+            lambda_range: Interval (λ_min, λ_max) searched for the optimum
+            resolution: Grid points per landscape
+            xatol: Absolute λ tolerance of the refinement
+
+        Returns:
+            (ResonanceResult, ReturnLandscape) per trajectory, in input order
+        """
+        plan = self._batch_return_plan(trajectories)
+        n = len(plan)
+        names, lambdas = self._grid(lambda_range, resolution)
+        errors = plan.error(np.broadcast_to(lambdas, (n, len(lambdas))))
+
+        indices = np.argmin(errors[:, :resolution], axis=1)
+        grid = lambdas[:resolution]
+        lower = grid[np.maximum(indices - 1, 0)]
+        upper = grid[np.minimum(indices + 1, resolution - 1)]
+        refined = minimize_scalar_bounded_batch(plan.error, n, (lower, upper), xatol=xatol)
+
+        detections = []
+        for k in range(n):
+            landscape = ReturnLandscape.from_errors(grid, errors[k, :resolution])
+            results = {name: float(error) for name, error in zip(names, errors[k, resolution:])}
+            grid_error = errors[k, indices[k]]
+            if refined.fun[k] <= grid_error:
+                optimum = (refined.x[k], refined.fun[k])
+            else:
+                optimum = (grid[indices[k]], grid_error)
+            detections.append((self._resonance_result(results, *optimum), landscape))
+        return detections
+
     def find_nearest_resonance(self, lambda_value: float) -> Tuple[str, float, float]:
         """
         Find nearest mathematical constant to given λ value.
@@ -178,6 +363,34 @@ class ResonanceDetector:
         return nearest_name, nearest_value, distance
 
 
+def robustness_noise(
+    num_trials: int,
+    T: int,
+    antithetic: bool = False,
+    rng: RandomSource = None
+) -> np.ndarray:
+    """
+    Standard normal noise block for VerificationCascade.verify_noise_robustness.
+
+    Draw it once and pass it to several calls to score trajectories under
+    common random numbers.
+
+    Args:
+        num_trials: Number of noise trials
+        T: Trajectory length
+        antithetic: Return pairs (ε, -ε); an odd trial count keeps one unpaired draw
+        rng: Generator or seed for the draw
+
+    Returns:
+        (num_trials, 2, T, 3) array: rotation and translation noise per trial
+    """
+    rng = as_generator(rng)
+    if not antithetic:
+        return rng.standard_normal((num_trials, 2, T, 3))
+    half = rng.standard_normal(((num_trials + 1) // 2, 2, T, 3))
+    return np.concatenate([half, -half])[:num_trials]
+
+
 @dataclass
 class VerificationResult:
     """Multi-level verification result for regenerative protocols"""
@@ -185,6 +398,76 @@ class VerificationResult:
     verifications: Dict[str, float]
     token_award: float
     passed: bool
+    levels_run: List[str] = field(default_factory=list)  # In evaluation order
+    levels_skipped: List[str] = field(default_factory=list)  # Short-circuited (fail-fast)
+
+
+VERIFICATION_LEVELS = ("topological", "energetic", "temporal", "spatial", "stochastic")
+
+# Static cost rank of each level (array work per call: one norm pass for
+# spatial, one log pass for temporal, log + exp for energetic, a plan
+# evaluation for topological, one per noise trial for stochastic). Fail-fast
+# runs cheapest first; calibrate_costs replaces the ranks with measured times.
+DEFAULT_LEVEL_COSTS = {
+    "spatial": 1,
+    "temporal": 2,
+    "energetic": 3,
+    "topological": 4,
+    "stochastic": 5
+}
+
+
+# ============================================================================
+# Array level kernels (shared by the single and batched cascades)
+# ============================================================================
+
+def _energy_imbalance(rot_vecs: np.ndarray, translations: np.ndarray, lambdas: np.ndarray) -> np.ndarray:
+    """
+    Average transformation magnitude of the doubled, scaled trajectories.
+
+    The doubled sequence repeats the scaled one, so its average work equals
+    the average over a single scaled pass.
+
+    Args:
+        rot_vecs: (K, T, 3) rotation vectors
+        translations: (K, T, 3) translations
+        lambdas: (K,) scaling factors
+
+    Returns:
+        (K,) average work per pose
+    """
+    scaled_rot_vecs = so3_log(so3_exp(lambdas[:, None, None] * rot_vecs))
+    work = (np.linalg.norm(scaled_rot_vecs, axis=-1)
+            + np.abs(lambdas)[:, None] * np.linalg.norm(translations, axis=-1))
+    return work.mean(axis=1)
+
+
+def _timing_variation(rot_vecs: np.ndarray, translations: np.ndarray) -> np.ndarray:
+    """
+    Coefficient of variation of pose-to-pose distances.
+
+    Args:
+        rot_vecs: (K, T, 3) rotation vectors
+        translations: (K, T, 3) translations
+
+    Returns:
+        (K,) std / mean of step sizes (0 for T < 2 or vanishing steps)
+    """
+    K, T = translations.shape[:2]
+    variation = np.zeros(K)
+    if T > 1:
+        steps = (np.linalg.norm(np.diff(rot_vecs, axis=1), axis=-1)
+                 + np.linalg.norm(np.diff(translations, axis=1), axis=-1))
+        mean_step = steps.mean(axis=1)
+        regular = mean_step >= 1e-10
+        variation[regular] = steps[regular].std(axis=1) / mean_step[regular]
+    return variation
+
+
+def _within_bounds(translations: np.ndarray, bounded: np.ndarray, r_max: np.ndarray) -> np.ndarray:
+    """(K,) True where every translation is within r_max (unbounded always passes)"""
+    inside = np.all(np.linalg.norm(translations, axis=-1) <= r_max[:, None], axis=1)
+    return ~bounded | inside
 
 
 class VerificationCascade:
@@ -200,6 +483,10 @@ class VerificationCascade:
 
     Each level weighted by importance for regenerative systems.
     Overall score determines REGEN token award.
+
+    In fail-fast mode levels run in ascending order of level_costs (static
+    ranks by default, measured times after calibrate_costs) and evaluation
+    stops at the first failed threshold, since `passed` can no longer be true.
     """
 
     def __init__(
@@ -230,6 +517,8 @@ class VerificationCascade:
             "stochastic": 0.8  # Noise robustness > 80%
         }
 
+        self.level_costs = dict(DEFAULT_LEVEL_COSTS)
+
     def verify_return_quality(
         self,
         trajectory: SE3Trajectory,
@@ -241,7 +530,7 @@ class VerificationCascade:
         Returns:
             Error value (lower is better, < threshold is good)
         """
-        return compute_return_error(trajectory, lambda_opt, double=True)
+        return get_return_cache().error(trajectory, lambda_opt, double=True)
 
     def verify_energy_conservation(
         self,
@@ -257,22 +546,14 @@ class VerificationCascade:
         Returns:
             Relative energy imbalance (0 = perfect conservation)
         """
-        scaled = scale_trajectory(trajectory, lambda_opt)
-        doubled = double_trajectory(scaled)
-
-        # Compute "work" as sum of transformation magnitudes
-        total_work = 0.0
-        for pose in doubled.poses:
-            rot_work = np.linalg.norm(pose.to_rotation_vector())
-            trans_work = np.linalg.norm(pose.translation)
-            total_work += rot_work + trans_work
-
-        # For perfect return, work should sum to zero (cancellation)
-        # Normalize by trajectory length
-        avg_work = total_work / len(doubled)
-
-        # Return relative imbalance
-        return avg_work
+        # "Work" is the sum of transformation magnitudes; for perfect return
+        # it would cancel. Normalized by trajectory length.
+        if len(trajectory) == 0:
+            return float('nan')
+        return float(_energy_imbalance(
+            so3_log(trajectory.rotations)[None], trajectory.translations[None],
+            np.array([float(lambda_opt)])
+        )[0])
 
     def verify_timing_consistency(
         self,
@@ -288,31 +569,10 @@ class VerificationCascade:
         Returns:
             Coefficient of variation in step sizes (0 = perfectly uniform)
         """
-        # Compute step sizes (pose-to-pose distances)
-        step_sizes = []
-        for i in range(len(trajectory) - 1):
-            pose1 = trajectory[i]
-            pose2 = trajectory[i + 1]
-
-            # Distance = rotation + translation change
-            rot_dist = np.linalg.norm(
-                pose2.to_rotation_vector() - pose1.to_rotation_vector()
-            )
-            trans_dist = np.linalg.norm(pose2.translation - pose1.translation)
-
-            step_sizes.append(rot_dist + trans_dist)
-
-        if len(step_sizes) == 0:
-            return 0.0
-
-        # Coefficient of variation (std / mean)
-        mean_step = np.mean(step_sizes)
-        std_step = np.std(step_sizes)
-
-        if mean_step < 1e-10:
-            return 0.0
-
-        return std_step / mean_step
+        # Step size = rotation + translation change between consecutive poses
+        return float(_timing_variation(
+            so3_log(trajectory.rotations)[None], trajectory.translations[None]
+        )[0])
 
     def verify_bounded_domain(
         self,
@@ -324,64 +584,67 @@ class VerificationCascade:
         Returns:
             True if all translations within r_max, False otherwise
         """
-        if not trajectory.bounded:
-            return True  # Unbounded trajectory, no constraint
-
-        for pose in trajectory.poses:
-            if np.linalg.norm(pose.translation) > trajectory.r_max:
-                return False
-
-        return True
+        return bool(_within_bounds(
+            trajectory.translations[None],
+            np.array([trajectory.bounded]),
+            np.array([float(trajectory.r_max)])
+        )[0])
 
     def verify_noise_robustness(
         self,
         trajectory: SE3Trajectory,
         lambda_opt: float,
         num_trials: int = 10,
-        noise_level: float = 0.05
+        noise_level: float = 0.05,
+        rng: RandomSource = None,
+        antithetic: bool = False,
+        standard_noise: Optional[np.ndarray] = None
     ) -> float:
         """
         Verify robustness to stochastic perturbations.
 
         Adds Gaussian noise to trajectory and checks if return quality degrades.
+        All trials are perturbed as one (trials, T) block and scored in a
+        single batched return-error evaluation.
+
+        Variance reduction:
+        - antithetic: trials come in pairs (ε, -ε), cancelling the odd part
+          of the error response to noise
+        - standard_noise: a fixed N(0, 1) block from robustness_noise, reused
+          across calls (common random numbers) so that scores for different
+          trajectories or λ differ only through the trajectories themselves
 
         Args:
             trajectory: Original trajectory
             lambda_opt: Optimal scaling factor
-            num_trials: Number of noise trials
+            num_trials: Number of noise trials (ignored with standard_noise)
             noise_level: Standard deviation of Gaussian noise
+            rng: Generator or seed for the noise draws
+            antithetic: Use antithetic pairs (ignored with standard_noise)
+            standard_noise: Pre-drawn (trials, 2, T, 3) standard normal block
 
         Returns:
             Robustness score ∈ [0, 1], higher = more robust
         """
-        baseline_error = compute_return_error(trajectory, lambda_opt, double=True)
-
-        noisy_errors = []
-        for _ in range(num_trials):
-            # Add noise to each pose
-            noisy_poses = []
-            for pose in trajectory.poses:
-                # Noise on rotation (small random rotation)
-                noise_rot = np.random.normal(0, noise_level, 3)
-                noisy_rotvec = pose.to_rotation_vector() + noise_rot
-
-                # Noise on translation
-                noise_trans = np.random.normal(0, noise_level, 3)
-                noisy_translation = pose.translation + noise_trans
-
-                noisy_poses.append(
-                    SE3Pose.from_rotation_vector(noisy_rotvec, noisy_translation)
-                )
-
-            noisy_trajectory = SE3Trajectory(
-                noisy_poses,
-                trajectory.bounded,
-                trajectory.r_max
-            )
-
-            # Compute error with noise
-            noisy_error = compute_return_error(noisy_trajectory, lambda_opt, double=True)
-            noisy_errors.append(noisy_error)
+        baseline_error = get_return_cache().error(trajectory, lambda_opt, double=True)
+
+        # Rotation logs do not depend on the noise draw: compute them once
+        rot_vecs = so3_log(trajectory.rotations)
+
+        if standard_noise is None:
+            standard_noise = robustness_noise(num_trials, len(trajectory), antithetic, rng)
+        assert standard_noise.ndim == 4 and standard_noise.shape[1:] == (2,) + rot_vecs.shape, \
+            "standard_noise must have shape (trials, 2, T, 3)"
+        noise = noise_level * standard_noise
+
+        # Noise on rotation (small random rotations) and translation; re-log
+        # the perturbed rotations so each trial matches compute_return_error
+        plan = BatchReturnPlan.from_rotation_vectors(
+            so3_log(so3_exp(rot_vecs + noise[:, 0])),
+            trajectory.translations + noise[:, 1],
+            double=True
+        )
+        noisy_errors = plan.error(np.full(len(plan), float(lambda_opt)))
 
         # Robustness = 1 - (mean_noisy_error - baseline_error) / baseline_error
         # Clamp to [0, 1]
@@ -399,7 +662,9 @@ class VerificationCascade:
         self,
         trajectory: SE3Trajectory,
         lambda_opt: float,
-        base_token_amount: float = 100.0
+        base_token_amount: float = 100.0,
+        rng: RandomSource = None,
+        fail_fast: bool = False
     ) -> VerificationResult:
         """
         Multi-level verification for token generation [Opus insight]
@@ -408,26 +673,102 @@ class VerificationCascade:
             trajectory: SE(3) trajectory to verify
             lambda_opt: Optimized scaling factor
             base_token_amount: Base REGEN token amount (scaled by score)
+            rng: Generator or seed for the stochastic level
+            fail_fast: Run levels cheapest first and stop at the first failed
+                threshold; skipped levels score 0, so the award is a lower bound
 
         Returns:
             VerificationResult with overall score and token award
         """
-        # Run all verification levels
-        verifications = {
-            "topological": self.verify_return_quality(trajectory, lambda_opt),
-            "energetic": self.verify_energy_conservation(trajectory, lambda_opt),
-            "temporal": self.verify_timing_consistency(trajectory, lambda_opt),
-            "spatial": float(self.verify_bounded_domain(trajectory)),
-            "stochastic": self.verify_noise_robustness(trajectory, lambda_opt)
-        }
+        levels = (sorted(VERIFICATION_LEVELS, key=lambda level: self.level_costs[level])
+                  if fail_fast else VERIFICATION_LEVELS)
 
-        # Normalize to [0, 1] where 1 is best
-        normalized = {}
-        normalized["topological"] = max(0.0, 1.0 - verifications["topological"] / 2.0)
-        normalized["energetic"] = max(0.0, 1.0 - verifications["energetic"] / 0.5)
-        normalized["temporal"] = max(0.0, 1.0 - verifications["temporal"] / 1.0)
-        normalized["spatial"] = verifications["spatial"]  # Already 0 or 1
-        normalized["stochastic"] = verifications["stochastic"]  # Already [0, 1]
+        verifications = {}
+        for level in levels:
+            verifications[level] = self._run_level(level, trajectory, lambda_opt, rng)
+            if fail_fast and not self._level_passes(level, verifications[level]):
+                break
+
+        return self._score(verifications, base_token_amount)
+
+    def _run_level(
+        self,
+        level: str,
+        trajectory: SE3Trajectory,
+        lambda_opt: float,
+        rng: RandomSource = None
+    ) -> float:
+        """Raw value of one verification level"""
+        if level == "topological":
+            return self.verify_return_quality(trajectory, lambda_opt)
+        if level == "energetic":
+            return self.verify_energy_conservation(trajectory, lambda_opt)
+        if level == "temporal":
+            return self.verify_timing_consistency(trajectory, lambda_opt)
+        if level == "spatial":
+            return float(self.verify_bounded_domain(trajectory))
+        if level == "stochastic":
+            return self.verify_noise_robustness(trajectory, lambda_opt, rng=rng)
+        raise ValueError(f"Unknown verification level '{level}'")
+
+    def _level_passes(self, level: str, value: float) -> bool:
+        """Whether a raw level value meets its threshold"""
+        if level == "spatial":
+            return value == 1.0
+        if level == "stochastic":
+            return value >= self.thresholds[level]
+        return value <= self.thresholds[level]
+
+    def calibrate_costs(
+        self,
+        trajectory: SE3Trajectory,
+        lambda_opt: float,
+        repeats: int = 20,
+        rng: RandomSource = None
+    ) -> Dict[str, float]:
+        """
+        Measure the per-call cost of each level on a representative trajectory.
+
+        Updates level_costs, which sets the fail-fast evaluation order. The
+        calls run under a non-storing return cache, so every repeat pays the
+        cold cost and the shared cache is left untouched.
+
+        Args:
+            trajectory: Representative submission
+            lambda_opt: Its scaling factor
+            repeats: Timed calls per level
+            rng: Generator or seed for the stochastic level
+
+        Returns:
+            Mean cost per level in ms
+        """
+        rng = as_generator(rng)
+        with return_cache_scope(ReturnErrorCache(maxsize=0, plan_maxbytes=0)):
+            for level in VERIFICATION_LEVELS:
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    self._run_level(level, trajectory, lambda_opt, rng)
+                self.level_costs[level] = 1e3 * (time.perf_counter() - start) / repeats
+        return dict(self.level_costs)
+
+    def _score(
+        self,
+        verifications: Dict[str, float],
+        base_token_amount: float
+    ) -> VerificationResult:
+        """Normalize level values, weight them and apply pass/fail thresholds"""
+        # Normalize to [0, 1] where 1 is best; skipped levels score 0
+        normalized = dict.fromkeys(VERIFICATION_LEVELS, 0.0)
+        if "topological" in verifications:
+            normalized["topological"] = max(0.0, 1.0 - verifications["topological"] / 2.0)
+        if "energetic" in verifications:
+            normalized["energetic"] = max(0.0, 1.0 - verifications["energetic"] / 0.5)
+        if "temporal" in verifications:
+            normalized["temporal"] = max(0.0, 1.0 - verifications["temporal"] / 1.0)
+        if "spatial" in verifications:
+            normalized["spatial"] = verifications["spatial"]  # Already 0 or 1
+        if "stochastic" in verifications:
+            normalized["stochastic"] = verifications["stochastic"]  # Already [0, 1]
 
         # Weighted overall score
         overall_score = sum(
@@ -435,12 +776,11 @@ class VerificationCascade:
             for key in self.weights.keys()
         )
 
-        # Check if passed all thresholds
-        passed = all(
-            (verifications[key] <= self.thresholds[key] if key != "stochastic"
-             else verifications[key] >= self.thresholds[key])
-            for key in verifications.keys() if key != "spatial"
-        ) and verifications["spatial"] == 1.0
+        # Check if passed all thresholds (a skipped level never passes)
+        skipped = [level for level in VERIFICATION_LEVELS if level not in verifications]
+        passed = not skipped and all(
+            self._level_passes(key, value) for key, value in verifications.items()
+        )
 
         # Token award scales with overall score
         token_award = overall_score * base_token_amount
@@ -449,9 +789,156 @@ class VerificationCascade:
             overall_score=overall_score,
             verifications=verifications,
             token_award=token_award,
-            passed=passed
+            passed=passed,
+            levels_run=list(verifications),
+            levels_skipped=skipped
         )
 
+    def verify_many(
+        self,
+        trajectories: Union[Sequence[SE3Trajectory], SE3TrajectoryBatch],
+        lambdas: np.ndarray,
+        base_token_amount: float = 100.0,
+        num_trials: int = 10,
+        noise_level: float = 0.05,
+        antithetic: bool = False,
+        rng: RandomSource = None,
+        workers: int = 1
+    ) -> List[VerificationResult]:
+        """
+        Verify a batch of submissions on array kernels (settlement throughput)
+
+        Submissions are grouped by trajectory length and each group is
+        stacked into (K, T) blocks. The rotation logarithms and the scaled
+        rotations are computed once per group and shared by the
+        topological, energetic and stochastic levels.
+
+        The stochastic level uses common random numbers: one noise block
+        per trajectory length, drawn here, is applied to every submission
+        of that length, so all farms face identical perturbations and
+        results do not depend on `workers`.
+
+        Args:
+            trajectories: N trajectories (mixed lengths allowed), or an SE3TrajectoryBatch
+            lambdas: (N,) optimized scaling factor per trajectory
+            base_token_amount: Base REGEN token amount (scaled by score)
+            num_trials: Noise trials per submission for the stochastic level
+            noise_level: Standard deviation of the stochastic-level noise
+            antithetic: Use antithetic noise pairs
+            rng: Generator or seed for the noise blocks
+            workers: Number of processes (1 runs in this process)
+
+        Returns:
+            VerificationResult per submission, in input order
+        """
+        lambdas = np.asarray(lambdas, dtype=float).reshape(-1)
+        assert len(lambdas) == len(trajectories), "Need one λ per trajectory"
+        assert workers >= 1, "workers must be a positive integer"
+
+        if isinstance(trajectories, SE3TrajectoryBatch):
+            n = len(trajectories)
+            groups = {trajectories.rotations.shape[1]: (
+                np.arange(n), trajectories.rotations, trajectories.translations,
+                np.full(n, trajectories.bounded), np.full(n, float(trajectories.r_max)))}
+        else:
+            groups = {}
+            lengths = np.array([len(trajectory) for trajectory in trajectories])
+            for T in np.unique(lengths):
+                members = np.flatnonzero(lengths == T)
+                groups[int(T)] = (
+                    members,
+                    np.stack([trajectories[k].rotations for k in members]),
+                    np.stack([trajectories[k].translations for k in members]),
+                    np.array([trajectories[k].bounded for k in members]),
+                    np.array([trajectories[k].r_max for k in members], dtype=float)
+                )
+
+        # Common random numbers: one block per length, drawn in length order
+        rng = as_generator(rng)
+        noise = {T: robustness_noise(num_trials, T, antithetic, rng) for T in sorted(groups)}
+
+        tasks = []
+        for T in sorted(groups):
+            members, rotations, translations, bounded, r_max = groups[T]
+            for chunk in np.array_split(np.arange(len(members)), workers):
+                if len(chunk):
+                    tasks.append((members[chunk], (
+                        rotations[chunk], translations[chunk], bounded[chunk],
+                        r_max[chunk], lambdas[members[chunk]], noise[T] * noise_level)))
+
+        if workers == 1 or len(tasks) <= 1:
+            blocks = [self._verify_block(*args) for _, args in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                blocks = list(executor.map(
+                    _verify_block, [self] * len(tasks), [args for _, args in tasks]))
+
+        results: List[Optional[VerificationResult]] = [None] * len(lambdas)
+        for (members, _), block in zip(tasks, blocks):
+            for j, k in enumerate(members):
+                verifications = {key: float(values[j]) for key, values in block.items()}
+                results[k] = self._score(verifications, base_token_amount)
+        return results
+
+    def _verify_block(
+        self,
+        rotations: np.ndarray,
+        translations: np.ndarray,
+        bounded: np.ndarray,
+        r_max: np.ndarray,
+        lambdas: np.ndarray,
+        noise: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Raw level values for K equal-length trajectories.
+
+        Args:
+            rotations: (K, T, 3, 3) rotations
+            translations: (K, T, 3) translations
+            bounded: (K,) bounded flags
+            r_max: (K,) translation bounds
+            lambdas: (K,) scaling factors
+            noise: (trials, 2, T, 3) scaled rotation/translation noise
+
+        Returns:
+            Dictionary of (K,) arrays keyed like verify_regeneration's levels
+        """
+        K, T = translations.shape[:2]
+        rot_vecs = so3_log(rotations)
+
+        # Topological: closure error of the doubled, scaled trajectory
+        topological = BatchReturnPlan.from_rotation_vectors(rot_vecs, translations).error(lambdas)
+
+        # Energetic, temporal and spatial share the single-trajectory kernels
+        energetic = _energy_imbalance(rot_vecs, translations, lambdas)
+        temporal = _timing_variation(rot_vecs, translations)
+        spatial = _within_bounds(translations, bounded, r_max).astype(float)
+
+        # Stochastic: all K × trials perturbed trajectories in one plan
+        trials = noise.shape[0]
+        noisy = BatchReturnPlan.from_rotation_vectors(
+            so3_log(so3_exp(rot_vecs[:, None] + noise[None, :, 0])).reshape(K * trials, T, 3),
+            (translations[:, None] + noise[None, :, 1]).reshape(K * trials, T, 3)
+        )
+        mean_noisy = noisy.error(np.repeat(lambdas, trials)).reshape(K, trials).mean(axis=1)
+        perfect = topological < 1e-10
+        with np.errstate(divide='ignore', invalid='ignore'):
+            degradation = (mean_noisy - topological) / topological
+        stochastic = np.where(perfect, 0.5, np.clip(1.0 - degradation, 0.0, 1.0))
+
+        return {
+            "topological": topological,
+            "energetic": energetic,
+            "temporal": temporal,
+            "spatial": spatial,
+            "stochastic": stochastic
+        }
+
+
+def _verify_block(cascade: VerificationCascade, args: Tuple) -> Dict[str, np.ndarray]:
+    """Process-pool entry point for VerificationCascade.verify_many"""
+    return cascade._verify_block(*args)
+
 
 class NarrativeQualityMetric:
     """
@@ -620,9 +1107,9 @@ class ResonanceAwareOptimizer:
             initial_guess = 1.0
             bounds = (0.1, 10.0)
 
-        # Define cost function
-        def cost(lam: float) -> float:
-            return compute_return_error(trajectory, lam, double=True)
+        # Define cost function (compiled once, memoized across entry points)
+        plan = get_return_cache().plan(trajectory, double=True)
+        cost = plan.error
 
         # Try local optimization first (around resonance)
         result_local = minimize_scalar(
@@ -633,12 +1120,8 @@ class ResonanceAwareOptimizer:
 
         # If local optimization fails (high error), try global search
         if result_local.fun > 1.0 and bias_to_golden:
-            # Fall back to global optimization
-            result_global = minimize_scalar(
-                cost,
-                bounds=(0.1, 10.0),
-                method='bounded'
-            )
+            # Fall back to global optimization (scan + top-k basin refinement)
+            result_global = global_scaling_search(plan, (0.1, 10.0))
 
             # Use whichever is better
             if result_global.fun < result_local.fun:
@@ -648,29 +1131,65 @@ class ResonanceAwareOptimizer:
 
     def multi_resonance_search(
         self,
-        trajectory: SE3Trajectory
+        trajectory: SE3Trajectory,
+        resolution: int = 400,
+        surrogate: Optional[LandscapeSurrogate] = None
     ) -> Dict[str, Tuple[float, float]]:
         """
         Test all natural resonances and return results.
 
+        The neighbourhoods (0.7·ratio, 1.4·ratio) overlap, so one batched
+        landscape over their union is scanned first. Each resonance then
+        refines only the grid bracket around its best point in the window.
+
+        With a prebuilt surrogate (build_landscape_surrogate covering every
+        window) each window is answered from the fit alone, to about the
+        surrogate's error_estimate.
+
         Args:
             trajectory: SE(3) trajectory to optimize
+            resolution: Grid points in the shared landscape scan (≥ 2, else
+                ValueError). A window without grid points is refined over
+                the whole window.
+            surrogate: Optional LandscapeSurrogate of this trajectory's E(λ)
 
         Returns:
             Dictionary mapping resonance names to (lambda, error) tuples
         """
         detector = ResonanceDetector()
-        results = {}
+        windows = {
+            name: (ratio * 0.7, ratio * 1.4)
+            for name, ratio in detector.resonance_constants.items()
+        }
+        if surrogate is not None:
+            return {name: surrogate.minimum(lo, hi) for name, (lo, hi) in windows.items()}
 
-        for name, ratio in detector.resonance_constants.items():
-            # Optimize in neighborhood of each resonance
-            bounds = (ratio * 0.7, ratio * 1.4)
+        if resolution < 2:
+            raise ValueError(f"multi_resonance_search needs resolution >= 2, got {resolution}")
 
-            def cost(lam: float) -> float:
-                return compute_return_error(trajectory, lam, double=True)
+        plan = get_return_cache().plan(trajectory, double=True)
+        landscape = scan_return_landscape(
+            plan,
+            (min(lo for lo, _ in windows.values()), max(hi for _, hi in windows.values())),
+            resolution=resolution
+        )
+        results = {}
 
-            result = minimize_scalar(cost, bounds=bounds, method='bounded')
-            results[name] = (result.x, result.fun)
+        for name, (lo, hi) in windows.items():
+            # Refine the best grid bracket inside this resonance's neighborhood
+            index = landscape.window_argmin(lo, hi)
+            bracket_lo, bracket_hi = landscape.bracket(index)
+            result = minimize_scalar(
+                plan.error,
+                bounds=(max(bracket_lo, lo), min(bracket_hi, hi)),
+                method='bounded'
+            )
+            # The grid point may lie outside a window too narrow for the grid
+            in_window = lo <= landscape.lambdas[index] <= hi
+            if result.fun <= landscape.errors[index] or not in_window:
+                results[name] = (float(result.x), float(result.fun))
+            else:
+                results[name] = (float(landscape.lambdas[index]), float(landscape.errors[index]))
 
         return results
 
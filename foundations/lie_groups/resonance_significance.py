@@ -0,0 +1,456 @@
+"""
+Statistical Significance of Resonance Claims
+
+VALIDATION_METHODOLOGY.md Phase 1 requires p < 0.01 against a uniform null
+(λ ~ U[0.1, 2.0]) before field trials, with confidence intervals that
+exclude the null. This module provides the tests for λ samples produced by
+optimize_scaling_factor / ResonanceDetector:
+
+- uniform_null_test: Monte Carlo test of the attractor frequency near a
+  constant against λ drawn uniformly from the search bounds
+- permutation_test: two-sample test (e.g. SE(3) vs. a control group, or two
+  noise levels) on the attractor frequency or the mean λ
+- bootstrap_interval: percentile confidence interval for the attractor
+  frequency, mean or median
+- goodness_of_fit: chi-square and Kolmogorov-Smirnov tests of uniformity
+
+Resampling is vectorized in batches. Whenever the resampled statistic has a
+closed-form law it is drawn directly: the null and bootstrap counts of
+values near a constant are binomial, and the permuted count of one group is
+hypergeometric. A resample therefore costs O(1) instead of O(N). General
+statistics resample indices as (batch, N) blocks.
+
+Sequential early stopping: after every batch the Monte Carlo p-value's
+Clopper-Pearson interval is compared with alpha, and sampling stops once
+the decision can no longer change (at confidence 1 - stop_error).
+
+Reproducibility: batch i draws from SeedSequence(root, spawn_key=(i,)), and
+batches are consumed in order, so results do not depend on `workers`.
+"""
+
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from scipy import stats
+
+from se3_double_scale import RandomSource, as_generator
+from resonance_aware import ResonanceDetector
+from attractor_statistics import classify_attractors
+
+
+@dataclass
+class SignificanceResult:
+    """
+    Outcome of a resampling test.
+
+    Attributes:
+        statistic: Observed value of the test statistic
+        p_value: Monte Carlo p-value (1 + exceedances) / (1 + resamples)
+        n_resamples: Resamples actually drawn
+        stopped_early: True when sequential stopping ended the run
+        null_mean: Mean of the statistic over the resamples
+    """
+    statistic: float
+    p_value: float
+    n_resamples: int
+    stopped_early: bool
+    null_mean: float
+
+    def significant(self, alpha: float = 0.01) -> bool:
+        return self.p_value < alpha
+
+
+@dataclass
+class BootstrapInterval:
+    """
+    Percentile bootstrap confidence interval.
+
+    Attributes:
+        statistic: Statistic on the original sample
+        lower: Lower confidence bound
+        upper: Upper confidence bound
+        confidence: Confidence level
+        standard_error: Bootstrap standard deviation of the statistic
+        n_resamples: Number of bootstrap resamples
+    """
+    statistic: float
+    lower: float
+    upper: float
+    confidence: float
+    standard_error: float
+    n_resamples: int
+
+    def excludes(self, value: float) -> bool:
+        return not self.lower <= value <= self.upper
+
+
+# ============================================================================
+# Attractor frequency
+# ============================================================================
+
+def _constant_index(detector: ResonanceDetector, constant: str) -> int:
+    names = list(detector.resonance_constants)
+    assert constant in names, f"Unknown resonance constant '{constant}'"
+    return names.index(constant)
+
+
+def attractor_frequency(
+    lambdas: np.ndarray,
+    constant: str = 'golden_ratio',
+    detector: Optional[ResonanceDetector] = None
+) -> float:
+    """Fraction of λ attributed to `constant` (nearest constant within tolerance)"""
+    detector = detector if detector is not None else ResonanceDetector()
+    lambdas = np.asarray(lambdas, dtype=float).reshape(-1)
+    hits = classify_attractors(lambdas, detector) == _constant_index(detector, constant)
+    return float(hits.mean()) if len(lambdas) else 0.0
+
+
+def attractor_window(
+    constant: str = 'golden_ratio',
+    detector: Optional[ResonanceDetector] = None
+) -> Tuple[float, float]:
+    """
+    λ interval attributed to `constant`: its tolerance band clipped to its
+    nearest-constant cell (midpoints to the neighbouring constants).
+    """
+    detector = detector if detector is not None else ResonanceDetector()
+    c = detector.resonance_constants[constant]
+    others = np.array([v for name, v in detector.resonance_constants.items() if name != constant])
+    below, above = others[others < c], others[others > c]
+    lower = max(c * (1 - detector.tolerance), 0.5 * (c + below.max()) if len(below) else -np.inf)
+    upper = min(c * (1 + detector.tolerance), 0.5 * (c + above.min()) if len(above) else np.inf)
+    return float(lower), float(upper)
+
+
+# ============================================================================
+# Resampling engine
+# ============================================================================
+
+def _draw_batch(kind: str, args: Tuple, root: int, index: int, size: int) -> np.ndarray:
+    """One batch of resampled statistics (process-pool entry point)"""
+    rng = np.random.default_rng(np.random.SeedSequence(root, spawn_key=(index,)))
+
+    if kind == 'binomial':
+        n, p = args
+        return rng.binomial(n, p, size) / n
+    if kind == 'hypergeometric':
+        hits, n_sample, n_control = args
+        drawn = rng.hypergeometric(hits, n_sample + n_control - hits, n_sample, size)
+        return drawn / n_sample - (hits - drawn) / n_control
+    if kind == 'permutation_mean':
+        pooled, n_sample = args
+        keys = rng.random((size, len(pooled)))
+        chosen = np.argpartition(keys, n_sample - 1, axis=1)[:, :n_sample]
+        sample_sum = pooled[chosen].sum(axis=1)
+        return sample_sum / n_sample - (pooled.sum() - sample_sum) / (len(pooled) - n_sample)
+    if kind in ('bootstrap_mean', 'bootstrap_median'):
+        (data,) = args
+        resampled = data[rng.integers(0, len(data), (size, len(data)))]
+        return resampled.mean(axis=1) if kind == 'bootstrap_mean' else np.median(resampled, axis=1)
+    raise ValueError(f"Unknown resampling kind '{kind}'")
+
+
+def _batch_size(n: int, kind: str, requested: Optional[int]) -> int:
+    """Default batch: 1000 resamples, index resampling capped at 2²³ entries"""
+    if requested is not None:
+        return max(1, int(requested))
+    if kind in ('binomial', 'hypergeometric'):
+        return 1000
+    return max(1, min(1000, 2 ** 23 // max(n, 1)))
+
+
+def _resample(
+    kind: str,
+    args: Tuple,
+    n_resamples: int,
+    batch_size: int,
+    workers: int,
+    rng: RandomSource,
+    stop: Optional[Callable[[np.ndarray], bool]] = None
+) -> Tuple[np.ndarray, bool]:
+    """
+    Draw up to n_resamples statistics in ordered batches.
+
+    Returns:
+        (resampled statistics, whether `stop` ended the run early)
+    """
+    assert workers >= 1, "workers must be a positive integer"
+    root = int(as_generator(rng).integers(2 ** 63))
+    sizes = [min(batch_size, n_resamples - start) for start in range(0, n_resamples, batch_size)]
+
+    drawn: List[np.ndarray] = []
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for round_start in range(0, len(sizes), workers):
+            indices = range(round_start, min(round_start + workers, len(sizes)))
+            if executor is None:
+                batches = [_draw_batch(kind, args, root, i, sizes[i]) for i in indices]
+            else:
+                batches = list(executor.map(
+                    _draw_batch, [kind] * len(indices), [args] * len(indices),
+                    [root] * len(indices), indices, [sizes[i] for i in indices]))
+
+            # Consume in batch order so stopping does not depend on `workers`
+            for batch in batches:
+                drawn.append(batch)
+                if stop is not None and sum(map(len, drawn)) < n_resamples:
+                    values = np.concatenate(drawn)
+                    if stop(values):
+                        return values, True
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return (np.concatenate(drawn) if drawn else np.zeros(0)), False
+
+
+def _decided(exceedances: int, resamples: int, alpha: float, stop_error: float) -> bool:
+    """Whether the Clopper-Pearson interval of the p-value excludes alpha"""
+    lower = stats.beta.ppf(stop_error / 2, exceedances, resamples - exceedances + 1) \
+        if exceedances > 0 else 0.0
+    upper = stats.beta.ppf(1 - stop_error / 2, exceedances + 1, resamples - exceedances) \
+        if exceedances < resamples else 1.0
+    return upper < alpha or lower > alpha
+
+
+def _p_value_test(
+    observed: float,
+    kind: str,
+    args: Tuple,
+    center: float,
+    alternative: str,
+    n_resamples: int,
+    alpha: float,
+    sequential: bool,
+    stop_error: float,
+    batch_size: int,
+    workers: int,
+    rng: RandomSource
+) -> SignificanceResult:
+    """Monte Carlo p-value of `observed` against resampled null statistics"""
+    assert alternative in ('greater', 'less', 'two-sided'), f"Unknown alternative '{alternative}'"
+
+    def exceeds(null: np.ndarray) -> np.ndarray:
+        # Small slack so ties with the observed value count as exceedances
+        slack = 1e-12 * max(1.0, abs(observed))
+        if alternative == 'greater':
+            return null >= observed - slack
+        if alternative == 'less':
+            return null <= observed + slack
+        return np.abs(null - center) >= abs(observed - center) - slack
+
+    stop = (lambda null: _decided(int(exceeds(null).sum()), len(null), alpha, stop_error)) \
+        if sequential else None
+    null, stopped = _resample(kind, args, n_resamples, batch_size, workers, rng, stop)
+    exceedances = int(exceeds(null).sum())
+
+    return SignificanceResult(
+        statistic=float(observed),
+        p_value=(1.0 + exceedances) / (1.0 + len(null)),
+        n_resamples=len(null),
+        stopped_early=stopped,
+        null_mean=float(null.mean()) if len(null) else float('nan')
+    )
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def uniform_null_test(
+    lambdas: np.ndarray,
+    constant: str = 'golden_ratio',
+    lambda_bounds: Tuple[float, float] = (0.1, 2.0),
+    detector: Optional[ResonanceDetector] = None,
+    n_resamples: int = 10000,
+    alpha: float = 0.01,
+    sequential: bool = True,
+    stop_error: float = 1e-3,
+    batch_size: Optional[int] = None,
+    workers: int = 1,
+    rng: RandomSource = None
+) -> SignificanceResult:
+    """
+    Test λ clustering near a constant against the uniform null (Phase 1).
+
+    Under H0 each λ is U[lambda_bounds], so the number attributed to
+    `constant` is Binomial(N, p0) with p0 the window's share of the bounds;
+    the null frequencies are drawn from that law directly.
+
+    Args:
+        lambdas: (N,) optimized λ values
+        constant: Resonance constant tested (default: golden ratio)
+        lambda_bounds: Support of the uniform null (the optimizer's bounds)
+        detector: Supplies constants and tolerance (default: ResonanceDetector())
+        n_resamples: Maximum null resamples
+        alpha: Significance level used by sequential stopping
+        sequential: Stop once the decision at alpha is settled
+        stop_error: Error probability allowed for the stopping decision
+        batch_size: Resamples per batch (default: chosen by resampling kind)
+        workers: Processes drawing batches (1 runs in this process)
+        rng: Generator or seed for the root seed stream
+
+    Returns:
+        SignificanceResult for the one-sided alternative "more λ near the constant"
+    """
+    detector = detector if detector is not None else ResonanceDetector()
+    lambdas = np.asarray(lambdas, dtype=float).reshape(-1)
+    assert len(lambdas), "Need at least one value"
+    lower, upper = lambda_bounds
+    window_lo, window_hi = attractor_window(constant, detector)
+    p0 = max(0.0, min(window_hi, upper) - max(window_lo, lower)) / (upper - lower)
+
+    return _p_value_test(
+        attractor_frequency(lambdas, constant, detector),
+        'binomial', (len(lambdas), p0), p0, 'greater',
+        n_resamples, alpha, sequential, stop_error,
+        _batch_size(len(lambdas), 'binomial', batch_size), workers, rng
+    )
+
+
+def permutation_test(
+    sample: np.ndarray,
+    control: np.ndarray,
+    statistic: str = 'frequency',
+    constant: str = 'golden_ratio',
+    detector: Optional[ResonanceDetector] = None,
+    alternative: str = 'two-sided',
+    n_resamples: int = 10000,
+    alpha: float = 0.01,
+    sequential: bool = True,
+    stop_error: float = 1e-3,
+    batch_size: Optional[int] = None,
+    workers: int = 1,
+    rng: RandomSource = None
+) -> SignificanceResult:
+    """
+    Two-sample permutation test of sample vs. control λ values.
+
+    The statistic is the difference sample - control of either the
+    attractor frequency near `constant` (permuted counts are drawn from their
+    hypergeometric law) or the mean λ (random splits of the pooled values).
+
+    Args:
+        sample: λ values of the condition under test
+        control: λ values of the control condition
+        statistic: 'frequency' or 'mean'
+        constant: Resonance constant for the frequency statistic
+        detector: Supplies constants and tolerance (default: ResonanceDetector())
+        alternative: 'greater', 'less' or 'two-sided'
+        n_resamples: Maximum permutations
+        alpha: Significance level used by sequential stopping
+        sequential: Stop once the decision at alpha is settled
+        stop_error: Error probability allowed for the stopping decision
+        batch_size: Permutations per batch (default: chosen by statistic)
+        workers: Processes drawing batches (1 runs in this process)
+        rng: Generator or seed for the root seed stream
+
+    Returns:
+        SignificanceResult for the difference sample - control
+    """
+    sample = np.asarray(sample, dtype=float).reshape(-1)
+    control = np.asarray(control, dtype=float).reshape(-1)
+    assert len(sample) and len(control), "Both groups need at least one value"
+
+    if statistic == 'frequency':
+        detector = detector if detector is not None else ResonanceDetector()
+        index = _constant_index(detector, constant)
+        sample_hits = int(np.sum(classify_attractors(sample, detector) == index))
+        control_hits = int(np.sum(classify_attractors(control, detector) == index))
+        observed = sample_hits / len(sample) - control_hits / len(control)
+        kind, args = 'hypergeometric', (sample_hits + control_hits, len(sample), len(control))
+    elif statistic == 'mean':
+        observed = sample.mean() - control.mean()
+        kind, args = 'permutation_mean', (np.concatenate([sample, control]), len(sample))
+    else:
+        raise ValueError(f"Unknown statistic '{statistic}', expected 'frequency' or 'mean'")
+
+    return _p_value_test(
+        observed, kind, args, 0.0, alternative,
+        n_resamples, alpha, sequential, stop_error,
+        _batch_size(len(sample) + len(control), kind, batch_size), workers, rng
+    )
+
+
+def bootstrap_interval(
+    lambdas: np.ndarray,
+    statistic: str = 'frequency',
+    confidence: float = 0.99,
+    constant: str = 'golden_ratio',
+    detector: Optional[ResonanceDetector] = None,
+    n_resamples: int = 10000,
+    batch_size: Optional[int] = None,
+    workers: int = 1,
+    rng: RandomSource = None
+) -> BootstrapInterval:
+    """
+    Percentile bootstrap confidence interval.
+
+    Args:
+        lambdas: (N,) optimized λ values
+        statistic: 'frequency' (near `constant`), 'mean' or 'median'
+        confidence: Confidence level (Phase 1 reports 0.99)
+        constant: Resonance constant for the frequency statistic
+        detector: Supplies constants and tolerance (default: ResonanceDetector())
+        n_resamples: Bootstrap resamples
+        batch_size: Resamples per batch (default: chosen by statistic)
+        workers: Processes drawing batches (1 runs in this process)
+        rng: Generator or seed for the root seed stream
+
+    Returns:
+        BootstrapInterval
+    """
+    lambdas = np.asarray(lambdas, dtype=float).reshape(-1)
+    assert len(lambdas), "Need at least one value"
+    assert 0 < confidence < 1, "confidence must lie in (0, 1)"
+
+    if statistic == 'frequency':
+        observed = attractor_frequency(lambdas, constant, detector)
+        kind, args = 'binomial', (len(lambdas), observed)
+    elif statistic in ('mean', 'median'):
+        observed = float(np.mean(lambdas) if statistic == 'mean' else np.median(lambdas))
+        kind, args = f'bootstrap_{statistic}', (lambdas,)
+    else:
+        raise ValueError(f"Unknown statistic '{statistic}', expected 'frequency', 'mean' or 'median'")
+
+    resampled, _ = _resample(kind, args, n_resamples,
+                             _batch_size(len(lambdas), kind, batch_size), workers, rng)
+    lower, upper = np.quantile(resampled, [(1 - confidence) / 2, (1 + confidence) / 2])
+
+    return BootstrapInterval(
+        statistic=float(observed),
+        lower=float(lower),
+        upper=float(upper),
+        confidence=confidence,
+        standard_error=float(resampled.std(ddof=1)) if len(resampled) > 1 else 0.0,
+        n_resamples=len(resampled)
+    )
+
+
+def goodness_of_fit(
+    lambdas: np.ndarray,
+    lambda_bounds: Tuple[float, float] = (0.1, 2.0),
+    bins: int = 20
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Chi-square and Kolmogorov-Smirnov tests of λ ~ U[lambda_bounds].
+
+    Args:
+        lambdas: (N,) optimized λ values
+        lambda_bounds: Support of the uniform null
+        bins: Equal-width bins for the chi-square test
+
+    Returns:
+        {'chi_square': (statistic, p), 'kolmogorov_smirnov': (statistic, p)}
+    """
+    lambdas = np.asarray(lambdas, dtype=float).reshape(-1)
+    lower, upper = lambda_bounds
+    counts, _ = np.histogram(np.clip(lambdas, lower, upper), bins=bins, range=(lower, upper))
+    chi_square = stats.chisquare(counts)
+    ks = stats.kstest(lambdas, 'uniform', args=(lower, upper - lower))
+    return {
+        'chi_square': (float(chi_square.statistic), float(chi_square.pvalue)),
+        'kolmogorov_smirnov': (float(ks.statistic), float(ks.pvalue))
+    }
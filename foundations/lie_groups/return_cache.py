@@ -0,0 +1,302 @@
+"""
+Shared Memoization of Return-Error Evaluations
+
+A full analysis of one trajectory asks for the same (trajectory, λ) error
+many times: ResonanceDetector.detect_natural_scaling, the
+ResonanceAwareOptimizer searches and the VerificationCascade all evaluate
+overlapping λ values on the same walk. This module keeps one bounded LRU of
+return errors that all of these entry points share.
+
+Keys:
+- Trajectories are identified by a content hash of their rotation and
+  translation arrays, so equal walks share entries across objects and an
+  edited trajectory is never served stale results
+- Errors are keyed by (content hash, n_fold, λ)
+- Only scalar λ queries (the optimizers' probes) are memoized; array
+  arguments (grids, landscapes) go straight to the compiled plan, so one-off
+  grid points neither pay per-element lookups nor flood the LRU
+- Compiled plans are bounded by their total array size, not their count
+
+Scope:
+- One cache per process by default (get_return_cache, set_return_cache)
+- `return_cache_scope()` installs a fresh (or given) cache for a block of
+  code in the current context (a contextvars.ContextVar) and restores the
+  previous one afterwards, so overlapping scopes in different threads or
+  asyncio tasks do not see each other's caches
+- A cache is safe to share between threads (one lock guards its tables)
+
+Example:
+    >>> with return_cache_scope() as cache:
+    ...     detector.detect_natural_scaling(trajectory)
+    ...     optimizer.multi_resonance_search(trajectory)
+    >>> print(cache.stats.hit_rate)
+"""
+
+import hashlib
+import threading
+import contextvars
+import numpy as np
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple, Union
+
+from se3_double_scale import SE3Trajectory, ReturnPlan, _fold_count
+
+
+@dataclass
+class CacheStats:
+    """Counters of a ReturnErrorCache"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    maxsize: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of λ lookups served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def trajectory_digest(trajectory: SE3Trajectory) -> bytes:
+    """
+    Content hash of a trajectory's rotation and translation arrays.
+
+    Args:
+        trajectory: SE(3) trajectory
+
+    Returns:
+        16-byte BLAKE2b digest (equal for trajectories with equal arrays)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(trajectory.rotations, dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(trajectory.translations, dtype=float).tobytes())
+    return digest.digest()
+
+
+def _plan_nbytes(plan: ReturnPlan) -> int:
+    """Bytes held by a compiled plan's arrays"""
+    return sum(value.nbytes for value in vars(plan).values() if isinstance(value, np.ndarray))
+
+
+class _LRU:
+    """
+    Least-recently-used mapping bounded by the total weight of its entries
+    (weight 1 per entry by default, i.e. a count bound).
+
+    Not synchronized; ReturnErrorCache holds its lock around every call.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries: OrderedDict = OrderedDict()
+        self.weights = {}
+        self.total = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable):
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value, weight: int = 1):
+        if weight > self.maxsize:
+            return
+        if key in self.entries:
+            self.total -= self.weights[key]
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        self.weights[key] = weight
+        self.total += weight
+        while self.total > self.maxsize:
+            evicted, _ = self.entries.popitem(last=False)
+            self.total -= self.weights.pop(evicted)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class CachedReturnPlan:
+    """
+    ReturnPlan whose scalar error(λ) consults a ReturnErrorCache first.
+
+    Array arguments are evaluated by the compiled plan in one batched call
+    and are not memoized.
+    """
+
+    def __init__(self, cache: 'ReturnErrorCache', key: Tuple[bytes, int], plan: ReturnPlan):
+        self.cache = cache
+        self.key = key
+        self.plan = plan
+
+    @property
+    def n_fold(self) -> int:
+        return self.plan.n_fold
+
+    def __len__(self) -> int:
+        return len(self.plan)
+
+    def error(self, lambda_scale: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Return error ||G_λ^n - I||_F, memoized for scalar λ.
+
+        Args:
+            lambda_scale: Scaling factor to test, or an array of factors
+
+        Returns:
+            Same as ReturnPlan.error
+        """
+        if np.ndim(lambda_scale):
+            return self.plan.error(lambda_scale)
+
+        key = self.key + (float(lambda_scale),)
+        cached = self.cache._lookup(key)
+        if cached is None:
+            cached = float(self.plan.error(float(lambda_scale)))
+            self.cache._store(key, cached)
+        return cached
+
+
+class ReturnErrorCache:
+    """
+    Bounded LRU of return errors keyed by trajectory content and λ.
+
+    Compiled ReturnPlans are kept in a second LRU, bounded by their total
+    array size, so that repeated analyses of one trajectory also skip the
+    rotation logarithms without pinning many long trajectories.
+    """
+
+    def __init__(self, maxsize: int = 65536, plan_maxbytes: int = 64 * 2 ** 20):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of stored (trajectory, n_fold, λ) errors
+                (0 disables storage; lookups then always miss)
+            plan_maxbytes: Maximum total bytes of stored compiled plans
+                (48 bytes per trajectory step; larger plans are not kept)
+        """
+        self._errors = _LRU(maxsize)
+        self._plans = _LRU(plan_maxbytes)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def plan(
+        self,
+        trajectory: SE3Trajectory,
+        double: bool = True,
+        n_fold: Optional[int] = None
+    ) -> CachedReturnPlan:
+        """
+        Memoizing plan for a trajectory (hashes the trajectory's current contents).
+
+        Args:
+            trajectory: SE(3) trajectory
+            double: Whether the error is measured after doubling
+            n_fold: Number of traversals k (overrides double)
+
+        Returns:
+            CachedReturnPlan sharing this cache
+        """
+        key = (trajectory_digest(trajectory), _fold_count(double, n_fold))
+        with self._lock:
+            plan = self._plans.get(key)
+        if plan is None:
+            # Compile outside the lock; a concurrent duplicate is harmless
+            plan = ReturnPlan(trajectory, n_fold=key[1])
+            with self._lock:
+                self._plans.put(key, plan, _plan_nbytes(plan))
+        return CachedReturnPlan(self, key, plan)
+
+    def error(
+        self,
+        trajectory: SE3Trajectory,
+        lambda_scale: Union[float, np.ndarray],
+        double: bool = True
+    ) -> Union[float, np.ndarray]:
+        """Memoized compute_return_error(trajectory, λ, double)"""
+        return self.plan(trajectory, double).error(lambda_scale)
+
+    def _lookup(self, key: Tuple) -> Optional[float]:
+        with self._lock:
+            value = self._errors.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def _store(self, key: Tuple, value: float):
+        with self._lock:
+            self._errors.put(key, value)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of hit/miss/eviction counters"""
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self._errors.evictions,
+                size=len(self._errors),
+                maxsize=self._errors.maxsize
+            )
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._errors = _LRU(self._errors.maxsize)
+            self._plans = _LRU(self._plans.maxsize)
+            self.hits = 0
+            self.misses = 0
+
+
+_process_cache = ReturnErrorCache()
+
+# Cache installed by return_cache_scope in the current context (None: process cache)
+_scoped_cache: contextvars.ContextVar = contextvars.ContextVar('return_cache', default=None)
+
+
+def get_return_cache() -> ReturnErrorCache:
+    """Cache currently shared by the return-error entry points"""
+    cache = _scoped_cache.get()
+    return cache if cache is not None else _process_cache
+
+
+def set_return_cache(cache: ReturnErrorCache) -> ReturnErrorCache:
+    """
+    Install the process-wide cache (used wherever no scope is active).
+
+    Returns:
+        The previous process-wide cache
+    """
+    global _process_cache
+    previous = _process_cache
+    _process_cache = cache
+    return previous
+
+
+@contextmanager
+def return_cache_scope(cache: Optional[ReturnErrorCache] = None):
+    """
+    Use a fresh (or the given) cache for the duration of a block.
+
+    The cache is bound to the current context only: other threads and
+    asyncio tasks keep their own active cache.
+
+    Example:
+        >>> with return_cache_scope() as cache:
+        ...     cascade.verify_regeneration(trajectory, lambda_opt)
+        >>> print(cache.stats)
+    """
+    cache = cache if cache is not None else ReturnErrorCache()
+    token = _scoped_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _scoped_cache.reset(token)
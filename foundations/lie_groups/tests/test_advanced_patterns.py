@@ -0,0 +1,69 @@
+"""
+Test Suite for Advanced Patterns
+
+Covers the Ornstein-Uhlenbeck process on SE(3): single-path stepping and
+the vectorized ensemble with exact discretization.
+"""
+
+import pytest
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from se3_double_scale import SE3Pose
+from advanced_patterns import OrnsteinUhlenbeckProcess
+
+
+TARGET = SE3Pose.from_rotation_vector(np.array([1.0, 0.5, 0.0]), np.array([1.0, 2.0, 3.0]))
+
+
+class TestOrnsteinUhlenbeckEnsemble:
+    """Test batched OU simulation"""
+
+    def test_stationary_start_matches_stationary_law(self):
+        """Stationary paths keep mean μ and per-axis std σ/√(2θ) at any dt"""
+        ou = OrnsteinUhlenbeckProcess(TARGET, reversion_strength=0.5,
+                                      noise_amplitude=0.2, dt=2.0, rng=0)
+        rotations, translations = ou.simulate_ensemble(4000, 50, stationary_start=True)
+
+        assert rotations.shape == (4000, 50, 3, 3)
+        samples = translations.reshape(-1, 3)
+        assert np.allclose(samples.mean(axis=0), TARGET.translation, atol=0.01)
+        assert np.allclose(samples.std(axis=0), ou.stationary_std(), rtol=0.02)
+
+    def test_exact_agrees_with_euler_for_small_dt(self):
+        """Exact and Euler-Maruyama ensembles share the same transient law"""
+        ou = OrnsteinUhlenbeckProcess(TARGET, reversion_strength=0.5,
+                                      noise_amplitude=0.2, dt=0.01, rng=1)
+        _, euler = ou.simulate_ensemble(2000, 300, exact=False)
+        _, exact = ou.simulate_ensemble(2000, 300, exact=True)
+
+        expected_mean = (1 - np.exp(-0.5 * 3.0)) * TARGET.translation
+        assert np.allclose(euler[:, -1].mean(axis=0), expected_mean, atol=0.03)
+        assert np.allclose(exact[:, -1].mean(axis=0), expected_mean, atol=0.03)
+
+    def test_noise_free_exact_rotation_contracts_geodesically(self):
+        """Without noise the rotation deviation decays exactly as e^{-θt}"""
+        ou = OrnsteinUhlenbeckProcess(TARGET, reversion_strength=0.8,
+                                      noise_amplitude=0.0, dt=0.5, rng=2)
+        rotations, _ = ou.simulate_ensemble(1, 4, exact=True)
+        decay = np.exp(-0.8 * 2.0)
+        expected = TARGET.rotation @ SE3Pose.from_rotation_vector(
+            -decay * TARGET.to_rotation_vector(), np.zeros(3)).rotation
+
+        assert np.allclose(rotations[0, -1], expected)
+
+    def test_fills_preallocated_output(self):
+        """Results are written into caller-provided arrays"""
+        ou = OrnsteinUhlenbeckProcess(TARGET, rng=3)
+        out = (np.zeros((5, 7, 3, 3)), np.zeros((5, 7, 3)))
+        rotations, translations = ou.simulate_ensemble(5, 7, out=out)
+
+        assert rotations is out[0] and translations is out[1]
+        assert not np.allclose(translations, 0.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,88 @@
+"""
+Test Suite for Streaming λ-Attractor Statistics
+
+Checks resonance counting, exact merging and histogram quantiles against
+in-memory reference computations.
+"""
+
+import pytest
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from resonance_aware import ResonanceDetector
+from attractor_statistics import AttractorStatistics, classify_attractors
+from validation_runner import MonteCarloConfig, run_monte_carlo
+
+
+class TestAttractorStatistics:
+    """Test streaming aggregation"""
+
+    def test_classification_matches_nearest_resonance(self):
+        """Each λ is attributed like ResonanceDetector.find_nearest_resonance"""
+        detector = ResonanceDetector(tolerance=0.05)
+        lambdas = np.random.default_rng(0).uniform(0.3, 3.0, 500)
+        names = list(detector.resonance_constants)
+
+        for lam, index in zip(lambdas, classify_attractors(lambdas, detector)):
+            name, value, distance = detector.find_nearest_resonance(lam)
+            expected = names.index(name) if distance <= detector.tolerance * value else -1
+            assert index == expected
+
+    def test_streamed_batches_equal_single_pass(self):
+        """Updating in batches and merging shards are exact"""
+        lambdas = np.random.default_rng(1).lognormal(-0.4, 0.4, 20000)
+        whole = AttractorStatistics().update(lambdas)
+
+        streamed = AttractorStatistics()
+        for batch in np.array_split(lambdas[:10000], 7):
+            streamed.update(batch)
+        streamed.merge(AttractorStatistics().update(lambdas[10000:]))
+
+        assert np.array_equal(streamed.histogram, whole.histogram)
+        assert streamed.frequencies() == whole.frequencies()
+        assert streamed.count == 20000
+        assert streamed.mean == pytest.approx(lambdas.mean())
+        assert streamed.std == pytest.approx(lambdas.std())
+
+    def test_quantiles_within_bin_resolution(self):
+        """Histogram quantiles are accurate to one geometric bin"""
+        lambdas = np.random.default_rng(2).lognormal(0.0, 0.6, 50000)
+        stats = AttractorStatistics(n_bins=4096).update(lambdas)
+        levels = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+        ratio = stats.bin_edges[1] / stats.bin_edges[0]
+
+        estimates = stats.quantile(levels)
+        assert np.allclose(estimates, np.quantile(lambdas, levels), rtol=ratio - 1)
+        assert stats.quantile(0.0) == lambdas.min()
+        assert stats.quantile(1.0) == lambdas.max()
+
+    def test_acceptance_and_incompatible_merge(self):
+        """The ≥40%-near-φ criterion reads off the counts; mismatched bins refuse to merge"""
+        stats = AttractorStatistics().update([0.62, 0.61, 0.60, 1.5, 7.0])
+        assert stats.meets_acceptance('golden_ratio', 0.4)
+        assert not stats.meets_acceptance('octave', 0.4)
+
+        with pytest.raises(AssertionError):
+            stats.merge(AttractorStatistics(n_bins=16))
+
+
+class TestRunnerIntegration:
+    """Test the Monte Carlo runner's streaming mode"""
+
+    def test_streaming_report_without_records(self):
+        """keep_records=False keeps the same frequencies with no per-trial records"""
+        kept = run_monte_carlo(MonteCarloConfig(n_trials=10, seed=3), workers=1)
+        streamed = run_monte_carlo(MonteCarloConfig(n_trials=10, seed=3, keep_records=False), workers=1)
+
+        assert streamed.records == [] and len(streamed) == 10
+        assert streamed.attractor_frequencies == kept.attractor_frequencies
+        assert streamed.natural_fraction == kept.natural_fraction
+        assert streamed.statistics.quantile(0.5) == pytest.approx(
+            np.median(kept.lambdas), rel=1e-2)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,135 @@
+"""
+Test Suite for Lockstep Batch Optimization
+
+Checks that the vectorized bounded Brent search reproduces scipy's
+minimize_scalar(method='bounded') member by member.
+"""
+
+import pytest
+import numpy as np
+from scipy.optimize import minimize_scalar
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from se3_double_scale import (
+    BatchReturnPlan,
+    ReturnPlan,
+    generate_random_trajectory,
+    generate_random_trajectories,
+    optimize_scaling_factor
+)
+
+from batch_optimize import (
+    BatchOptimizeResult,
+    minimize_scalar_bounded_batch,
+    optimize_scaling_factors
+)
+
+
+class TestBatchReturnPlan:
+    """Test stacked return-error evaluation"""
+
+    def test_ragged_lengths_padded_with_identity(self):
+        """Padding must not change any member's error"""
+        np.random.seed(0)
+        trajectories = [generate_random_trajectory(T=T, r_max=3.0) for T in (4, 9, 6)]
+        plan = BatchReturnPlan(trajectories)
+        lambdas = np.array([0.5, 1.1, 1.9])
+
+        errors = plan.error(lambdas)
+        for k, trajectory in enumerate(trajectories):
+            assert np.isclose(errors[k], ReturnPlan(trajectory).error(lambdas[k]), atol=1e-12)
+
+    def test_member_subset_and_sweeps(self):
+        """Selected members can be evaluated on their own λ sweeps"""
+        np.random.seed(1)
+        trajectories = [generate_random_trajectory(T=8, r_max=2.0) for _ in range(4)]
+        plan = BatchReturnPlan(trajectories)
+        sweeps = np.array([[0.3, 0.6, 0.9], [1.2, 1.5, 1.8]])
+
+        errors = plan.error(sweeps, members=np.array([3, 1]))
+        assert errors.shape == (2, 3)
+        assert np.allclose(errors[0], ReturnPlan(trajectories[3]).error(sweeps[0]))
+        assert np.allclose(errors[1], ReturnPlan(trajectories[1]).error(sweeps[1]))
+
+
+class TestVectorizedBrent:
+    """Test the masked port of scipy's bounded Brent method"""
+
+    def test_matches_scipy_on_multimodal_functions(self):
+        """Each member should follow scipy's iterates exactly"""
+        centers = np.linspace(0.0, 1.0, 40)
+
+        def cost(x, members):
+            return (x - centers[members]) ** 2 + 0.1 * np.cos(7.0 * x)
+
+        batch = minimize_scalar_bounded_batch(cost, len(centers), (-1.0, 2.0))
+
+        for k, c in enumerate(centers):
+            ref = minimize_scalar(
+                lambda x: (x - c) ** 2 + 0.1 * np.cos(7.0 * x),
+                bounds=(-1.0, 2.0),
+                method='bounded'
+            )
+            assert batch.x[k] == pytest.approx(ref.x, abs=1e-12)
+            assert batch.nfev[k] == ref.nfev
+        assert batch.converged.all()
+
+    def test_per_member_bounds(self):
+        """Bounds may differ per member"""
+        lower = np.array([0.0, 2.0, -3.0])
+        upper = np.array([1.0, 5.0, -1.0])
+
+        batch = minimize_scalar_bounded_batch(lambda x, m: x ** 2, 3, (lower, upper))
+        assert np.allclose(batch.x, [0.0, 2.0, -1.0], atol=1e-4)
+
+    def test_maxiter_stops_unconverged_members(self):
+        """Members hitting maxiter are reported as not converged"""
+        batch = minimize_scalar_bounded_batch(
+            lambda x, m: (x - 0.3) ** 2, 5, (-1.0, 2.0), maxiter=4
+        )
+        assert np.all(batch.nfev == 4)
+        assert not batch.converged.any()
+
+
+class TestOptimizeScalingFactors:
+    """Test the batch counterpart of optimize_scaling_factor"""
+
+    def test_matches_sequential_optimization(self):
+        """Batch λ_opt should equal N sequential optimize_scaling_factor calls"""
+        np.random.seed(2)
+        trajectories = [generate_random_trajectory(T=10, r_max=2.0) for _ in range(25)]
+
+        batch = optimize_scaling_factors(trajectories, lambda_bounds=(0.1, 10.0))
+        assert isinstance(batch, BatchOptimizeResult)
+        assert len(batch) == 25
+
+        for k, trajectory in enumerate(trajectories):
+            ref = optimize_scaling_factor(trajectory, lambda_bounds=(0.1, 10.0))
+            assert batch.x[k] == pytest.approx(ref.x, abs=1e-6)
+            assert batch.fun[k] == pytest.approx(ref.fun, abs=1e-9)
+
+    def test_compiled_plan_input(self):
+        """A precompiled BatchReturnPlan can be optimized repeatedly"""
+        np.random.seed(3)
+        plan = BatchReturnPlan([generate_random_trajectory(T=6, r_max=2.0) for _ in range(5)])
+
+        narrow = optimize_scaling_factors(plan, lambda_bounds=(0.5, 0.7))
+        wide = optimize_scaling_factors(plan, lambda_bounds=(0.1, 2.0))
+        assert np.all((narrow.x >= 0.5) & (narrow.x <= 0.7))
+        assert np.all(narrow.nit >= 1)
+        assert np.allclose(wide.fun, plan.error(wide.x))
+
+    def test_trajectory_batch_input(self):
+        """An SE3TrajectoryBatch is optimized without unpacking its members"""
+        batch = generate_random_trajectories(8, T=6, r_max=2.0, rng=4)
+        result = optimize_scaling_factors(batch)
+        members = optimize_scaling_factors([batch[k] for k in range(8)])
+
+        assert np.allclose(result.x, members.x)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,104 @@
+"""
+Test Suite for the Chebyshev Landscape Surrogate
+
+Checks the estimated accuracy of the fit and the minimum, window and
+threshold queries against direct return-error evaluations.
+"""
+
+import pytest
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from se3_double_scale import ReturnPlan, generate_random_trajectory
+from landscape_surrogate import LandscapeSurrogate, build_landscape_surrogate
+from resonance_aware import ResonanceAwareOptimizer
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    trajectory = generate_random_trajectory(T=10, rng=1)
+    plan = ReturnPlan(trajectory)
+    return plan, build_landscape_surrogate(plan, (0.1, 10.0))
+
+
+class TestSurrogateAccuracy:
+    """Test the a-posteriori error estimate"""
+
+    def test_error_estimate_on_dense_grid(self, fitted):
+        """|E - S| stays within error_estimate far from the fitting nodes (this fit)"""
+        plan, surrogate = fitted
+        lambdas = np.linspace(0.1, 10.0, 20001)
+
+        assert isinstance(surrogate, LandscapeSurrogate)
+        assert surrogate.error_estimate < 1e-6
+        assert np.max(np.abs(surrogate(lambdas) - plan.error(lambdas))) <= surrogate.error_estimate + 1e-12
+        assert surrogate(0.5) == pytest.approx(plan.error(0.5), abs=surrogate.error_estimate + 1e-12)
+
+    def test_outside_interval_rejected(self, fitted):
+        """Queries outside the fitted interval are refused"""
+        _, surrogate = fitted
+        with pytest.raises(AssertionError):
+            surrogate(12.0)
+
+
+class TestSurrogateQueries:
+    """Test minimum, window and threshold queries"""
+
+    def test_window_minimum_matches_dense_search(self, fitted):
+        """Window minima agree with a fine grid search"""
+        plan, surrogate = fitted
+        for lower, upper in [(0.1, 10.0), (0.43, 0.87), (1.0, 3.0)]:
+            grid = np.linspace(lower, upper, 20001)
+            errors = plan.error(grid)
+            lam, value = surrogate.minimum(lower, upper)
+
+            assert lower <= lam <= upper
+            assert value <= errors.min() + surrogate.error_estimate
+            assert plan.error(lam) == pytest.approx(value, abs=surrogate.error_estimate + 1e-12)
+            assert surrogate.argmin(lower, upper) == lam
+
+    def test_piece_ranges_include_own_endpoints(self, fitted):
+        """Each piece's range and the minimum see both of its own end values"""
+        _, surrogate = fitted
+        left_limits = np.array([
+            np.polynomial.chebyshev.chebval(1.0, c) for c in surrogate.coefficients
+        ])
+
+        assert np.allclose(surrogate.endpoint_errors[:, 1], left_limits)
+        assert np.all(surrogate.piece_min <= surrogate.endpoint_errors.min(axis=1))
+        assert np.all(surrogate.piece_max >= surrogate.endpoint_errors.max(axis=1))
+        assert surrogate.minimum()[1] <= surrogate.endpoint_errors.min()
+
+    def test_intervals_below_threshold(self, fitted):
+        """Threshold intervals bracket exactly the grid points with E ≤ threshold"""
+        plan, surrogate = fitted
+        threshold = float(np.quantile(plan.error(np.linspace(0.1, 10.0, 500)), 0.3))
+        intervals = surrogate.intervals_below(threshold)
+
+        grid = np.linspace(0.1, 10.0, 5001)
+        inside = np.zeros(grid.shape, dtype=bool)
+        for start, end in intervals:
+            inside |= (grid >= start) & (grid <= end)
+        errors = plan.error(grid)
+        clear = np.abs(errors - threshold) > 1e-6
+
+        assert intervals and all(start < end for start, end in intervals)
+        assert np.array_equal(inside[clear], (errors <= threshold)[clear])
+
+    def test_multi_resonance_search_from_surrogate(self, fitted):
+        """Window answers from the surrogate match the evaluated search"""
+        _, surrogate = fitted
+        trajectory = generate_random_trajectory(T=10, rng=1)
+        optimizer = ResonanceAwareOptimizer()
+        direct = optimizer.multi_resonance_search(trajectory)
+        fast = optimizer.multi_resonance_search(trajectory, surrogate=surrogate)
+
+        for name, (_, error) in direct.items():
+            assert fast[name][1] <= error + 1e-6
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,131 @@
+"""
+Test Suite for Batched Lie-Algebra Kernels
+
+Checks the closed-form so(3)/se(3) maps against scipy and matrix
+exponentials, including the small-angle and near-π branches.
+"""
+
+import pytest
+import numpy as np
+from scipy.linalg import expm
+from scipy.spatial.transform import Rotation as R
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lie_kernels import (
+    hat,
+    vee,
+    so3_exp,
+    so3_log,
+    so3_left_jacobian,
+    so3_left_jacobian_inverse,
+    se3_hat,
+    se3_vee,
+    se3_exp,
+    se3_log
+)
+
+
+class TestHatVee:
+    """Test skew-symmetric maps on stacks"""
+
+    def test_hat_is_cross_product(self):
+        """[v]× w should equal v × w for every pair in the batch"""
+        rng = np.random.default_rng(0)
+        v = rng.normal(size=(50, 3))
+        w = rng.normal(size=(50, 3))
+
+        assert np.allclose(np.einsum('nij,nj->ni', hat(v), w), np.cross(v, w))
+
+    def test_vee_inverts_hat(self):
+        """vee(hat(v)) should recover v for arbitrary batch shapes"""
+        v = np.random.default_rng(1).normal(size=(4, 5, 3))
+        assert np.allclose(vee(hat(v)), v)
+
+
+class TestSO3ExpLog:
+    """Test Rodrigues exponential and logarithm"""
+
+    def test_exp_matches_scipy(self):
+        """Batched exp should agree with scipy for large and small angles"""
+        rng = np.random.default_rng(2)
+        v = np.concatenate([rng.normal(size=(200, 3)) * 2.0,
+                            rng.normal(size=(200, 3)) * 1e-6])
+
+        assert np.allclose(so3_exp(v), R.from_rotvec(v).as_matrix(), atol=1e-12)
+
+    def test_log_matches_scipy_on_haar_rotations(self):
+        """Batched log should agree with scipy on Haar-random rotations"""
+        rotations = R.random(2000, random_state=3)
+
+        assert np.allclose(so3_log(rotations.as_matrix()), rotations.as_rotvec(), atol=1e-10)
+
+    def test_log_exp_roundtrip_small_angles(self):
+        """Taylor branch should round-trip tiny rotations without loss"""
+        for scale in [0.0, 1e-12, 1e-8, 1e-5]:
+            v = scale * np.array([0.3, -0.5, 0.8])
+            assert np.allclose(so3_log(so3_exp(v)), v, atol=1e-15)
+
+    @pytest.mark.parametrize("gap", [1e-9, 1e-6, 1e-4, 5e-4])
+    def test_log_near_pi(self, gap):
+        """Near θ = π the axis should come from the symmetric part"""
+        axis = np.array([1.0, -2.0, 0.5])
+        axis /= np.linalg.norm(axis)
+        v = (np.pi - gap) * axis
+
+        assert np.allclose(so3_log(so3_exp(v)), v, atol=1e-8)
+
+    def test_single_matrix_shape(self):
+        """Unbatched inputs should keep unbatched shapes"""
+        assert so3_exp(np.array([0.1, 0.2, 0.3])).shape == (3, 3)
+        assert so3_log(np.eye(3)).shape == (3,)
+
+
+class TestJacobians:
+    """Test SO(3) left Jacobian and its inverse"""
+
+    def test_left_jacobian_first_order(self):
+        """exp(v + δ) ≈ exp(J(v) δ) exp(v) to first order"""
+        rng = np.random.default_rng(4)
+        v = rng.normal(size=3)
+        delta = 1e-6 * rng.normal(size=3)
+
+        lhs = so3_exp(v + delta)
+        rhs = so3_exp(so3_left_jacobian(v) @ delta) @ so3_exp(v)
+        assert np.allclose(lhs, rhs, atol=1e-11)
+
+    def test_inverse_jacobian(self):
+        """J⁻¹(v) J(v) = I, including the small-angle branch"""
+        rng = np.random.default_rng(5)
+        v = np.concatenate([rng.normal(size=(20, 3)), 1e-7 * rng.normal(size=(5, 3))])
+
+        products = so3_left_jacobian_inverse(v) @ so3_left_jacobian(v)
+        assert np.allclose(products, np.eye(3), atol=1e-12)
+
+
+class TestSE3Maps:
+    """Test se(3) exponential and logarithm"""
+
+    def test_exp_matches_matrix_exponential(self):
+        """se3_exp should equal expm of the 4x4 twist matrix"""
+        xi = np.random.default_rng(6).normal(size=(10, 6))
+        rotations, translations = se3_exp(xi)
+
+        for k in range(len(xi)):
+            g = expm(se3_hat(xi[k]))
+            assert np.allclose(g[:3, :3], rotations[k])
+            assert np.allclose(g[:3, 3], translations[k])
+
+    def test_log_inverts_exp(self):
+        """se3_log(se3_exp(ξ)) = ξ for |ω| < π"""
+        xi = np.random.default_rng(7).normal(size=(10, 6))
+        rotations, translations = se3_exp(xi)
+
+        assert np.allclose(se3_log(rotations, translations), xi)
+        assert np.allclose(se3_vee(se3_hat(xi)), xi)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -19,9 +19,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from se3_double_scale import (
     SE3Pose,
     SE3Trajectory,
+    compute_return_error,
     generate_random_trajectory,
+    generate_random_trajectories,
     optimize_scaling_factor
 )
+from lie_kernels import so3_exp, so3_log
 
 from resonance_aware import (
     ResonanceDetector,
@@ -29,8 +32,10 @@ from resonance_aware import (
     VerificationCascade,
     VerificationResult,
     NarrativeQualityMetric,
-    ResonanceAwareOptimizer
+    ResonanceAwareOptimizer,
+    robustness_noise
 )
+from return_cache import return_cache_scope
 
 
 class TestResonanceDetector:
@@ -118,6 +123,76 @@ class TestResonanceDetector:
         # Major third = 5:4 = 1.25
         assert abs(detector.MAJOR_THIRD - 1.25) < 1e-10
 
+    @pytest.mark.parametrize("method", ["bounded", "global"])
+    def test_overridden_test_scaling_is_used(self, method):
+        """A subclass's test_scaling drives detect_natural_scaling"""
+        class OffsetDetector(ResonanceDetector):
+            def test_scaling(self, trajectory, lambda_test):
+                return abs(lambda_test - self.OCTAVE)
+
+        result = OffsetDetector().detect_natural_scaling(
+            generate_random_trajectory(T=5, rng=0), method=method)
+        assert result.best_resonance == 'octave'
+        assert result.optimal_lambda == pytest.approx(2.0, abs=1e-4)
+
+
+class TestSinglePassDetector:
+    """Test landscape-based and batched resonance detection"""
+
+    def test_single_pass_reads_constants_off_landscape(self):
+        """Constant errors match the classic detector; the optimum is global"""
+        detector = ResonanceDetector()
+        trajectory = generate_random_trajectory(T=10, r_max=1.0, rng=0)
+        classic = detector.detect_natural_scaling(trajectory)
+        result, landscape = detector.detect_with_landscape(trajectory, resolution=150)
+
+        assert len(landscape.lambdas) == 150
+        for name, error in classic.all_resonances.items():
+            assert result.all_resonances[name] == pytest.approx(error)
+        assert result.optimal_error <= landscape.errors.min()
+        assert result.optimal_error <= classic.optimal_error + 1e-9
+        assert compute_return_error(trajectory, result.optimal_lambda) == pytest.approx(result.optimal_error)
+
+    def test_global_method(self):
+        """Global detection compares against an optimum at least as good as Brent's"""
+        detector = ResonanceDetector()
+        trajectory = generate_random_trajectory(T=10, r_max=1.0, rng=5)
+        bounded = detector.detect_natural_scaling(trajectory)
+        global_result = detector.detect_natural_scaling(trajectory, method='global')
+
+        assert global_result.optimal_error <= bounded.optimal_error + 1e-9
+        assert global_result.all_resonances == bounded.all_resonances
+
+    def test_overridden_test_scaling_is_used(self):
+        """Single-pass and batch detection honour a subclass's test_scaling"""
+        class OffsetDetector(ResonanceDetector):
+            def test_scaling(self, trajectory, lambda_test):
+                return abs(lambda_test - self.OCTAVE)
+
+        detector = OffsetDetector()
+        trajectories = generate_random_trajectories(3, T=5, rng=1)
+        single = [detector.detect_with_landscape(t, resolution=40) for t in trajectories]
+        batch = detector.detect_many(trajectories, resolution=40)
+
+        for (result, landscape), (batch_result, batch_landscape) in zip(single, batch):
+            assert result.best_resonance == batch_result.best_resonance == 'octave'
+            assert result.optimal_lambda == pytest.approx(2.0, abs=1e-4)
+            assert batch_result.optimal_lambda == pytest.approx(2.0, abs=1e-4)
+            assert np.allclose(landscape.errors, np.abs(landscape.lambdas - 2.0))
+            assert np.allclose(batch_landscape.errors, landscape.errors)
+
+    def test_batch_matches_single(self):
+        """detect_many agrees with detect_with_landscape member by member"""
+        detector = ResonanceDetector()
+        trajectories = [generate_random_trajectory(T=T, r_max=1.0, rng=T) for T in (4, 7, 10)]
+        batch = detector.detect_many(trajectories, resolution=120)
+
+        for trajectory, (result, landscape) in zip(trajectories, batch):
+            single, single_landscape = detector.detect_with_landscape(trajectory, resolution=120)
+            assert np.allclose(landscape.errors, single_landscape.errors)
+            assert result.best_resonance == single.best_resonance
+            assert result.optimal_error == pytest.approx(single.optimal_error, abs=1e-8)
+            assert result.is_natural == single.is_natural
 
 class TestVerificationCascade:
     """Test multi-level verification for EHDC token generation"""
@@ -187,6 +262,43 @@ class TestVerificationCascade:
 
         assert 0.0 <= robustness <= 1.0
 
+    def test_noise_robustness_seeded(self):
+        """A seeded rng should make the stochastic level reproducible"""
+        cascade = VerificationCascade()
+        trajectory = generate_random_trajectory(T=5, r_max=1.0, rng=0)
+
+        scores = [
+            cascade.verify_noise_robustness(trajectory, 0.8, num_trials=5, rng=11)
+            for _ in range(2)
+        ]
+        assert scores[0] == scores[1]
+
+    def test_noise_robustness_matches_per_trial_errors(self):
+        """The batched score equals the mean of per-trial compute_return_error"""
+        cascade = VerificationCascade()
+        trajectory = generate_random_trajectory(T=6, r_max=2.0, rng=1)
+        baseline = compute_return_error(trajectory, 0.9)
+        noise = robustness_noise(7, len(trajectory), rng=2)
+
+        errors = [
+            compute_return_error(SE3Trajectory.from_arrays(
+                so3_exp(so3_log(trajectory.rotations) + 0.05 * rot),
+                trajectory.translations + 0.05 * trans, bounded=False), 0.9)
+            for rot, trans in noise
+        ]
+        expected = max(0.0, min(1.0, 1.0 - (np.mean(errors) - baseline) / baseline))
+        score = cascade.verify_noise_robustness(trajectory, 0.9, standard_noise=noise)
+
+        assert score == pytest.approx(expected)
+
+    def test_antithetic_noise(self):
+        """Antithetic blocks pair every draw with its negation"""
+        noise = robustness_noise(6, 4, antithetic=True, rng=3)
+
+        assert noise.shape == (6, 2, 4, 3)
+        assert np.array_equal(noise[3:], -noise[:3])
+        assert robustness_noise(5, 4, antithetic=True, rng=3).shape[0] == 5
+
     def test_full_verification_cascade(self):
         """Full verification should produce valid result"""
         cascade = VerificationCascade()
@@ -245,6 +357,95 @@ class TestVerificationCascade:
         assert verification.token_award > 0
 
 
+
+
+class TestFailFastCascade:
+    """Test cost-ordered, short-circuiting verification"""
+
+    def test_out_of_bounds_stops_after_spatial(self):
+        """A bounds violation is caught by the cheapest level alone"""
+        cascade = VerificationCascade()
+        trajectory = generate_random_trajectory(T=6, r_max=1.0, rng=0)
+        trajectory.translations[2] = [2.0, 0.0, 0.0]
+
+        result = cascade.verify_regeneration(trajectory, 0.8, fail_fast=True, rng=1)
+
+        assert result.levels_run == ["spatial"]
+        assert set(result.levels_skipped) == {"topological", "energetic", "temporal", "stochastic"}
+        assert not result.passed
+        assert result.verifications == {"spatial": 0.0}
+
+    def test_agrees_with_full_run_when_passing(self):
+        """Without failures fail-fast runs every level and gives the same verdict"""
+        cascade = VerificationCascade(thresholds={
+            "topological": 10.0, "energetic": 10.0, "temporal": 10.0,
+            "spatial": 1.0, "stochastic": 0.0
+        })
+        trajectory = generate_random_trajectory(T=6, r_max=1.0, rng=2)
+
+        full = cascade.verify_regeneration(trajectory, 0.8, rng=3)
+        fast = cascade.verify_regeneration(trajectory, 0.8, rng=3, fail_fast=True)
+
+        assert full.passed and fast.passed
+        assert fast.levels_skipped == [] and full.levels_skipped == []
+        assert fast.levels_run[0] == "spatial"
+        assert fast.overall_score == pytest.approx(full.overall_score)
+
+    def test_calibrated_costs_set_order(self):
+        """calibrate_costs measures cold costs and leaves the shared cache alone"""
+        cascade = VerificationCascade()
+        trajectory = generate_random_trajectory(T=4, r_max=1.0, rng=4)
+        with return_cache_scope() as cache:
+            costs = cascade.calibrate_costs(trajectory, 0.8, repeats=5, rng=5)
+
+        assert set(costs) == {"topological", "energetic", "temporal", "spatial", "stochastic"}
+        assert all(cost > 0 for cost in costs.values())
+        assert costs["topological"] > costs["spatial"]
+        assert cache.stats.size == 0 and cache.stats.hits == 0
+
+
+class TestVerifyMany:
+    """Test the batched verification API"""
+
+    def _submissions(self):
+        trajectories = [generate_random_trajectory(T=T, r_max=1.0, rng=seed)
+                        for seed, T in enumerate([6, 4, 6, 5, 4, 6])]
+        lambdas = np.linspace(0.5, 1.2, len(trajectories))
+        return trajectories, lambdas
+
+    def test_matches_per_submission_levels(self):
+        """Every level agrees with the single-trajectory methods"""
+        cascade = VerificationCascade()
+        trajectories, lambdas = self._submissions()
+        results = cascade.verify_many(trajectories, lambdas, rng=7)
+
+        noise_rng = np.random.default_rng(7)
+        noise = {T: robustness_noise(10, T, rng=noise_rng) for T in (4, 5, 6)}
+        for trajectory, lam, result in zip(trajectories, lambdas, results):
+            expected = {
+                "topological": cascade.verify_return_quality(trajectory, lam),
+                "energetic": cascade.verify_energy_conservation(trajectory, lam),
+                "temporal": cascade.verify_timing_consistency(trajectory, lam),
+                "spatial": float(cascade.verify_bounded_domain(trajectory)),
+                "stochastic": cascade.verify_noise_robustness(
+                    trajectory, lam, standard_noise=noise[len(trajectory)])
+            }
+            for key, value in expected.items():
+                assert result.verifications[key] == pytest.approx(value), key
+            assert result == cascade._score(result.verifications, 100.0)
+
+    def test_process_pool_and_batch_input(self):
+        """Pooled runs and SE3TrajectoryBatch input give identical results"""
+        cascade = VerificationCascade()
+        trajectories, lambdas = self._submissions()
+        serial = cascade.verify_many(trajectories, lambdas, rng=3)
+        assert cascade.verify_many(trajectories, lambdas, rng=3, workers=2) == serial
+
+        batch = generate_random_trajectories(5, T=6, rng=4)
+        from_batch = cascade.verify_many(batch, np.full(5, 0.8), rng=5)
+        from_list = cascade.verify_many([batch[k] for k in range(5)], np.full(5, 0.8), rng=5)
+        assert from_batch == from_list
+
 class TestNarrativeQualityMetric:
     """Test narrative structure quantification"""
 
@@ -422,6 +623,30 @@ class TestResonanceAwareOptimizer:
             assert lambda_val > 0
             assert error >= 0
 
+    def test_multi_resonance_search_coarse_grid(self):
+        """Windows between grid points are refined; resolution < 2 is rejected"""
+        optimizer = ResonanceAwareOptimizer()
+        trajectory = generate_random_trajectory(T=6, r_max=1.0, rng=3)
+
+        results = optimizer.multi_resonance_search(trajectory, resolution=2)
+        for name, ratio in ResonanceDetector().resonance_constants.items():
+            lambda_val, error = results[name]
+            assert ratio * 0.7 <= lambda_val <= ratio * 1.4
+            assert error == pytest.approx(compute_return_error(trajectory, lambda_val))
+
+        with pytest.raises(ValueError):
+            optimizer.multi_resonance_search(trajectory, resolution=1)
+
+        # Landscape refinement should match or beat per-window Brent
+        from scipy.optimize import minimize_scalar
+        from se3_double_scale import ReturnPlan
+        cost = ReturnPlan(trajectory).error
+        for name, ratio in ResonanceDetector().resonance_constants.items():
+            lambda_val, error = results[name]
+            assert ratio * 0.7 <= lambda_val <= ratio * 1.4
+            brent = minimize_scalar(cost, bounds=(ratio * 0.7, ratio * 1.4), method='bounded')
+            assert error <= brent.fun + 1e-4
+
         # Find best resonance
         best_resonance = min(results.items(), key=lambda x: x[1][1])
         print(f"Best resonance: {best_resonance[0]}")
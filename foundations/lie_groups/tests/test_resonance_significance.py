@@ -0,0 +1,102 @@
+"""
+Test Suite for Resonance Significance Tests
+
+Checks the uniform-null, permutation and bootstrap tests against clustered
+and uniform λ samples, sequential stopping and worker-count independence.
+"""
+
+import pytest
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from resonance_aware import ResonanceDetector
+from resonance_significance import (
+    attractor_frequency, attractor_window, uniform_null_test,
+    permutation_test, bootstrap_interval, goodness_of_fit
+)
+
+
+PHI_INVERSE = 2 / (1 + np.sqrt(5))
+
+
+@pytest.fixture(scope="module")
+def clustered():
+    rng = np.random.default_rng(0)
+    return np.concatenate([rng.uniform(0.1, 2.0, 7000), rng.normal(PHI_INVERSE, 0.01, 3000)])
+
+
+@pytest.fixture(scope="module")
+def uniform():
+    return np.random.default_rng(1).uniform(0.1, 2.0, 10000)
+
+
+class TestUniformNull:
+    """Test the Phase 1 uniform-null test"""
+
+    def test_window_matches_classification(self):
+        """Points inside the window are exactly those attributed to φ"""
+        detector = ResonanceDetector()
+        lower, upper = attractor_window('golden_ratio', detector)
+        lambdas = np.linspace(0.1, 2.0, 20001)
+        inside = (lambdas >= lower) & (lambdas <= upper)
+        assert attractor_frequency(lambdas, 'golden_ratio', detector) == pytest.approx(inside.mean())
+
+    def test_clustered_sample_rejects_and_stops_early(self, clustered):
+        """A φ cluster is significant and the run stops after the first batch"""
+        result = uniform_null_test(clustered, n_resamples=10000, rng=2)
+        assert result.significant(0.01)
+        assert result.stopped_early and result.n_resamples < 10000
+
+    def test_uniform_sample_not_rejected(self, uniform):
+        """Uniform λ gives a p-value well above alpha"""
+        result = uniform_null_test(uniform, rng=3)
+        assert not result.significant(0.01)
+        assert result.null_mean == pytest.approx(result.statistic, abs=0.01)
+
+    def test_empty_sample_rejected(self):
+        """An empty λ sample fails instead of returning NaN"""
+        with pytest.raises(AssertionError):
+            uniform_null_test(np.array([]), rng=0)
+
+    def test_results_independent_of_workers(self, clustered):
+        """Same root seed gives identical results with a process pool"""
+        serial = uniform_null_test(clustered, rng=4, sequential=False, n_resamples=3000)
+        pooled = uniform_null_test(clustered, rng=4, sequential=False, n_resamples=3000, workers=2)
+        assert serial == pooled
+
+
+class TestTwoSampleAndBootstrap:
+    """Test permutation tests, bootstrap intervals and goodness of fit"""
+
+    @pytest.mark.parametrize("statistic", ["frequency", "mean"])
+    def test_permutation_detects_difference(self, clustered, uniform, statistic):
+        """Clustered vs. uniform differs; a sample vs. itself does not"""
+        assert permutation_test(clustered, uniform, statistic, rng=5).significant(0.01)
+        assert not permutation_test(uniform[:5000], uniform[5000:], statistic, rng=6).significant(0.01)
+
+    def test_bootstrap_interval_covers_and_excludes(self, clustered):
+        """Frequency CI covers the sample value and excludes the uniform share"""
+        interval = bootstrap_interval(clustered, 'frequency', confidence=0.99, rng=7)
+        p0 = np.diff(attractor_window())[0] / 1.9
+
+        assert interval.lower <= interval.statistic <= interval.upper
+        assert interval.excludes(p0)
+        assert interval.standard_error == pytest.approx(
+            np.sqrt(interval.statistic * (1 - interval.statistic) / len(clustered)), rel=0.1)
+
+    def test_bootstrap_mean_matches_standard_error(self, uniform):
+        """Bootstrap SE of the mean agrees with σ/√N"""
+        interval = bootstrap_interval(uniform[:2000], 'mean', n_resamples=2000, rng=8)
+        assert interval.standard_error == pytest.approx(uniform[:2000].std() / np.sqrt(2000), rel=0.1)
+
+    def test_goodness_of_fit(self, clustered, uniform):
+        """Chi-square and KS reject the cluster and accept uniform λ"""
+        assert all(p < 0.01 for _, p in goodness_of_fit(clustered).values())
+        assert all(p > 0.01 for _, p in goodness_of_fit(uniform).values())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,159 @@
+"""
+Test Suite for the Shared Return-Error Cache
+
+Checks content-hash keying, LRU bounds, statistics and scoping, and that
+the resonance entry points share one cache.
+"""
+
+import pytest
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from se3_double_scale import compute_return_error, generate_random_trajectory
+from resonance_aware import ResonanceDetector, ResonanceAwareOptimizer, VerificationCascade
+from return_cache import (
+    ReturnErrorCache,
+    get_return_cache,
+    return_cache_scope,
+    trajectory_digest
+)
+
+
+class TestReturnErrorCache:
+    """Test keying, eviction and statistics"""
+
+    def test_values_match_uncached(self):
+        """Cached errors equal compute_return_error; only scalar λ are memoized"""
+        cache = ReturnErrorCache()
+        trajectory = generate_random_trajectory(T=6, rng=0)
+        lambdas = np.array([0.5, 0.8, 1.3])
+
+        assert np.allclose(cache.error(trajectory, lambdas), compute_return_error(trajectory, lambdas))
+        assert cache.stats.size == 0 and cache.stats.misses == 0
+
+        assert cache.error(trajectory, 0.8) == pytest.approx(compute_return_error(trajectory, 0.8))
+        assert cache.error(trajectory, 0.8) == pytest.approx(compute_return_error(trajectory, 0.8))
+        assert cache.stats.hits == 1 and cache.stats.misses == 1
+
+    def test_content_hash_keys(self):
+        """Equal arrays share entries; edited trajectories are not served stale values"""
+        cache = ReturnErrorCache()
+        trajectory = generate_random_trajectory(T=5, rng=1)
+        copy = generate_random_trajectory(T=5, rng=1)
+        assert trajectory_digest(trajectory) == trajectory_digest(copy)
+
+        cache.error(trajectory, 0.7)
+        cache.error(copy, 0.7)
+        assert cache.stats.hits == 1
+
+        copy.translations[0] += 0.01
+        assert cache.error(copy, 0.7) == pytest.approx(compute_return_error(copy, 0.7))
+        assert cache.stats.misses == 2
+
+    def test_lru_bound(self):
+        """The error table never exceeds maxsize and counts evictions"""
+        cache = ReturnErrorCache(maxsize=4)
+        trajectory = generate_random_trajectory(T=4, rng=2)
+        for lam in np.linspace(0.5, 1.5, 10):
+            cache.error(trajectory, lam)
+
+        assert cache.stats.size == 4
+        assert cache.stats.evictions == 6
+        cache.error(trajectory, 1.5)
+        assert cache.stats.hits == 1
+
+    def test_plan_table_bounded_by_bytes(self):
+        """Compiled plans are evicted by total array size, not count"""
+        cache = ReturnErrorCache(plan_maxbytes=2 * 48 * 100)
+        for seed in range(5):
+            cache.plan(generate_random_trajectory(T=100, rng=seed))
+        assert len(cache._plans) == 2 and cache._plans.total <= 2 * 48 * 100
+
+        cache.plan(generate_random_trajectory(T=1000, rng=9))
+        assert len(cache._plans) == 2
+
+    def test_thread_safe_sharing(self):
+        """Concurrent scalar queries with constant eviction do not raise"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = ReturnErrorCache(maxsize=8)
+        trajectory = generate_random_trajectory(T=5, rng=4)
+        lambdas = np.random.default_rng(5).uniform(0.5, 1.5, 4000)
+
+        def query(chunk):
+            return [cache.error(trajectory, lam) for lam in chunk]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = np.concatenate(list(executor.map(query, np.array_split(lambdas, 8))))
+
+        assert np.allclose(results, compute_return_error(trajectory, lambdas))
+        assert cache.stats.hits + cache.stats.misses == len(lambdas)
+
+
+class TestSharedScope:
+    """Test sharing across the resonance entry points"""
+
+    def test_scope_restores_previous_cache(self):
+        """return_cache_scope installs a fresh cache and restores the old one"""
+        outer = get_return_cache()
+        with return_cache_scope() as cache:
+            assert get_return_cache() is cache and cache is not outer
+        assert get_return_cache() is outer
+
+    def test_overlapping_scopes_in_threads(self):
+        """Scopes that overlap in two threads neither clobber nor misrestore"""
+        import threading
+
+        outer = get_return_cache()
+        a_in, b_in, a_out, b_out = (threading.Event() for _ in range(4))
+        seen = {}
+
+        def first():
+            with return_cache_scope() as cache:
+                a_in.set()
+                b_in.wait()
+                seen['a'] = get_return_cache() is cache
+            a_out.set()
+            b_out.wait()
+            seen['a_after'] = get_return_cache() is outer
+
+        def second():
+            a_in.wait()
+            with return_cache_scope() as cache:
+                b_in.set()
+                a_out.wait()
+                seen['b'] = get_return_cache() is cache
+            b_out.set()
+            seen['b_after'] = get_return_cache() is outer
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert seen == {'a': True, 'b': True, 'a_after': True, 'b_after': True}
+        assert get_return_cache() is outer
+
+    def test_entry_points_share_evaluations(self):
+        """Repeated analyses of one trajectory are served from the cache"""
+        trajectory = generate_random_trajectory(T=6, rng=3)
+        with return_cache_scope() as cache:
+            ResonanceDetector().detect_natural_scaling(trajectory)
+            misses = cache.stats.misses
+            ResonanceDetector().detect_natural_scaling(trajectory)
+            assert cache.stats.hits == misses and cache.stats.misses == misses
+
+            VerificationCascade().verify_return_quality(trajectory, ResonanceDetector.GOLDEN_RATIO)
+            ResonanceDetector().test_scaling(trajectory, ResonanceDetector.GOLDEN_RATIO)
+            ResonanceAwareOptimizer().optimize_with_bias(trajectory)
+
+        assert cache.stats.misses > misses
+        assert cache.stats.hits >= misses + 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -24,11 +24,25 @@ from se3_double_scale import (
     double_trajectory,
     frobenius_distance_to_identity,
     compute_return_error,
+    compute_n_fold_return_error,
+    n_fold_return_curve,
+    se3_power,
     optimize_scaling_factor,
     generate_random_trajectory,
+    generate_random_trajectories,
+    SE3TrajectoryBatch,
     verify_approximate_return,
+    ReturnPlan,
+    scan_return_landscape,
+    global_scaling_search,
     TetheredSE3Walker,
-    predict_intervention_interference
+    predict_intervention_interference,
+    validation_policy,
+    get_validation_policy,
+    ValidationMode,
+    as_generator,
+    IntegratorType,
+    lie_group_step
 )
 
 
@@ -102,6 +116,122 @@ class TestSE3Basics:
             SE3Trajectory(invalid_poses, bounded=True, r_max=r_max)
 
 
+class TestValidationPolicy:
+    """Test configurable SO(3) validation"""
+
+    BAD_ROTATION = np.diag([1.0, 1.0, 2.0])
+
+    def test_validate_rejects_invalid_rotation(self):
+        """Default policy should reject non-orthogonal matrices"""
+        assert get_validation_policy() is ValidationMode.VALIDATE
+        with pytest.raises(AssertionError):
+            SE3Pose(rotation=self.BAD_ROTATION, translation=np.zeros(3))
+
+    def test_off_skips_checks_and_restores(self):
+        """'off' should skip SO(3) checks inside the context only"""
+        with validation_policy('off'):
+            SE3Pose(rotation=self.BAD_ROTATION, translation=np.zeros(3))
+            SE3Trajectory.from_arrays(self.BAD_ROTATION[None], np.zeros((1, 3)))
+        assert get_validation_policy() is ValidationMode.VALIDATE
+
+        with pytest.raises(AssertionError):
+            SE3Pose(rotation=self.BAD_ROTATION, translation=np.zeros(3))
+
+    def test_shape_checks_always_run(self):
+        """Shape checks are not governed by the policy"""
+        with validation_policy('off'):
+            with pytest.raises(AssertionError):
+                SE3Pose(rotation=np.eye(2), translation=np.zeros(3))
+
+    def test_debug_sample_checks_one_in_n(self):
+        """'debug-sample' should validate the first of every N constructions"""
+        failures = 0
+        with validation_policy('debug-sample', sample_every=4):
+            for _ in range(12):
+                try:
+                    SE3Pose(rotation=self.BAD_ROTATION, translation=np.zeros(3))
+                except AssertionError:
+                    failures += 1
+        assert failures == 3
+
+    def test_trusted_poses_are_slotted(self):
+        """Group operations return compact poses without a __dict__"""
+        pose = compose_se3(SE3Pose.identity(), SE3Pose.identity())
+
+        assert not hasattr(pose, '__dict__')
+        assert np.allclose(pose.rotation, np.eye(3))
+
+
+class TestArrayBackedTrajectory:
+    """Test contiguous (T,3,3)/(T,3) trajectory storage"""
+
+    def test_arrays_match_poses(self):
+        """Array blocks should hold exactly the poses passed in"""
+        trajectory = generate_random_trajectory(T=7, r_max=1.0)
+
+        assert trajectory.rotations.shape == (7, 3, 3)
+        assert trajectory.translations.shape == (7, 3)
+        for i, pose in enumerate(trajectory.poses):
+            assert np.allclose(pose.rotation, trajectory.rotations[i])
+            assert np.allclose(pose.translation, trajectory.translations[i])
+
+    def test_pose_views_share_memory(self):
+        """Indexing should hand out views into the array blocks"""
+        trajectory = generate_random_trajectory(T=3, r_max=1.0)
+
+        pose = trajectory[1]
+        assert np.shares_memory(pose.rotation, trajectory.rotations)
+        assert np.shares_memory(pose.translation, trajectory.translations)
+
+    def test_from_arrays_roundtrip(self):
+        """from_arrays should produce the same composition as the pose list"""
+        trajectory = generate_random_trajectory(T=12, r_max=1.0)
+        rebuilt = SE3Trajectory.from_arrays(
+            trajectory.rotations.copy(),
+            trajectory.translations.copy(),
+            bounded=True,
+            r_max=1.0
+        )
+
+        assert len(rebuilt) == len(trajectory)
+        total = compose_trajectory(rebuilt)
+        expected = SE3Pose.identity()
+        for pose in trajectory.poses:
+            expected = compose_se3(expected, pose)
+        assert np.allclose(total.rotation, expected.rotation)
+        assert np.allclose(total.translation, expected.translation)
+
+    def test_from_arrays_rejects_non_rotations(self):
+        """Array construction should still enforce SO(3) constraints"""
+        rotations = np.stack([np.eye(3), 2.0 * np.eye(3)])
+        with pytest.raises(AssertionError):
+            SE3Trajectory.from_arrays(rotations, np.zeros((2, 3)))
+
+    def test_poses_read_only_and_setter_validated(self):
+        """Legacy list edits fail loudly; assigning poses keeps the bounds check"""
+        trajectory = generate_random_trajectory(T=4, r_max=1.0)
+        with pytest.raises(AttributeError):
+            trajectory.poses.append(SE3Pose.identity())
+        with pytest.raises(TypeError):
+            trajectory.poses[0] = SE3Pose.identity()
+
+        trajectory.poses = [SE3Pose.identity()] * 3
+        assert len(trajectory) == 3
+        with pytest.raises(AssertionError):
+            trajectory.poses = [SE3Pose(np.eye(3), np.array([50.0, 0.0, 0.0]))]
+        assert len(trajectory) == 3
+
+    def test_scale_matches_per_pose_scaling(self):
+        """Batched scaling should agree with scaling poses one at a time"""
+        trajectory = generate_random_trajectory(T=6, r_max=1.0)
+        scaled = scale_trajectory(trajectory, 0.618)
+
+        for original, pose in zip(trajectory.poses, scaled.poses):
+            expected = scale_se3_pose(original, 0.618)
+            assert np.allclose(pose.rotation, expected.rotation)
+            assert np.allclose(pose.translation, expected.translation)
+
+
 class TestDoubleAndScaleCore:
     """Test core double-and-scale mechanism"""
 
@@ -187,6 +317,278 @@ class TestDoubleAndScaleCore:
         assert error_optimized <= error_unscaled
 
 
+class TestTreeComposition:
+    """Test tree-reduction and prefix composition"""
+
+    @staticmethod
+    def _random(T, seed=0):
+        rng = np.random.default_rng(seed)
+        poses = [SE3Pose.from_rotation_vector(rng.normal(size=3), rng.normal(size=3))
+                 for _ in range(T)]
+        return SE3Trajectory(poses, bounded=False)
+
+    @staticmethod
+    def _sequential(trajectory):
+        total = SE3Pose.identity()
+        prefixes = []
+        for pose in trajectory.poses:
+            total = compose_se3(total, pose)
+            prefixes.append(total)
+        return total, prefixes
+
+    @pytest.mark.parametrize("T", [1, 2, 3, 7, 16, 33])
+    def test_tree_matches_sequential_fold(self, T):
+        """Tree reduction should agree with the left-to-right fold for any length"""
+        trajectory = self._random(T)
+        expected, _ = self._sequential(trajectory)
+        total = compose_trajectory(trajectory)
+
+        assert np.allclose(total.rotation, expected.rotation, atol=1e-12)
+        assert np.allclose(total.translation, expected.translation, atol=1e-12)
+
+    @pytest.mark.parametrize("T", [1, 2, 5, 8, 13])
+    def test_cumulative_prefixes(self, T):
+        """cumulative=True should return every prefix product"""
+        trajectory = self._random(T)
+        _, expected = self._sequential(trajectory)
+        prefixes = compose_trajectory(trajectory, cumulative=True)
+
+        assert len(prefixes) == T
+        for pose, reference in zip(prefixes.poses, expected):
+            assert np.allclose(pose.rotation, reference.rotation, atol=1e-12)
+            assert np.allclose(pose.translation, reference.translation, atol=1e-12)
+
+    def test_identity_padding_is_exact(self):
+        """Appending identity poses must not change the composed result"""
+        trajectory = self._random(11)
+        padded = SE3Trajectory(list(trajectory.poses) + [SE3Pose.identity()] * 6, bounded=False)
+
+        assert np.array_equal(compose_trajectory(padded).rotation,
+                              compose_trajectory(trajectory).rotation)
+        assert np.array_equal(compose_trajectory(padded).translation,
+                              compose_trajectory(trajectory).translation)
+
+
+class TestReturnPlan:
+    """Test precompiled return-error evaluation"""
+
+    def test_plan_matches_scale_double_compose(self):
+        """Plan error should equal the explicit scale → double → compose chain"""
+        trajectory = generate_random_trajectory(T=10, r_max=1.0)
+        plan = ReturnPlan(trajectory, double=True)
+
+        for lam in [0.3, 0.618, 1.0, 1.7]:
+            explicit = frobenius_distance_to_identity(
+                compose_trajectory(double_trajectory(scale_trajectory(trajectory, lam)))
+            )
+            assert np.isclose(plan.error(lam), explicit, atol=1e-12)
+
+    def test_single_pass_plan(self):
+        """double=False should measure the single traversal"""
+        trajectory = generate_random_trajectory(T=8, r_max=1.0)
+        plan = ReturnPlan(trajectory, double=False)
+
+        explicit = frobenius_distance_to_identity(
+            compose_trajectory(scale_trajectory(trajectory, 0.8))
+        )
+        assert np.isclose(plan.error(0.8), explicit, atol=1e-12)
+
+    def test_from_rotation_vectors(self):
+        """Plans built from Lie-algebra coordinates should agree"""
+        trajectory = generate_random_trajectory(T=5, r_max=1.0)
+        plan = ReturnPlan(trajectory)
+        rebuilt = ReturnPlan.from_rotation_vectors(
+            plan.rotation_vectors, trajectory.translations, double=True
+        )
+
+        assert rebuilt.error(0.9) == plan.error(0.9)
+
+    def test_optimizer_uses_same_cost(self):
+        """compute_return_error at λ_opt should reproduce result.fun exactly"""
+        trajectory = generate_random_trajectory(T=10, r_max=1.0)
+        result = optimize_scaling_factor(trajectory, double=True)
+
+        assert compute_return_error(trajectory, result.x, double=True) == result.fun
+
+
+class TestNFoldReturns:
+    """Test k-fold returns via repeated squaring"""
+
+    def test_se3_power_matches_repeated_composition(self):
+        """g^k by squaring should equal k sequential compositions"""
+        pose = SE3Pose.from_rotation_vector(np.array([0.3, -0.2, 0.5]), np.array([0.1, 0.4, -0.2]))
+
+        expected = SE3Pose.identity()
+        for k in range(1, 10):
+            expected = compose_se3(expected, pose)
+            power = se3_power(pose, k)
+            assert np.allclose(power.rotation, expected.rotation, atol=1e-12)
+            assert np.allclose(power.translation, expected.translation, atol=1e-12)
+
+    def test_double_fold_matches_double_trajectory(self):
+        """n_fold=2 should agree with the explicit doubled trajectory"""
+        trajectory = generate_random_trajectory(T=10, r_max=1.0)
+
+        for lam in [0.4, 0.9, 1.3]:
+            assert np.isclose(
+                compute_n_fold_return_error(trajectory, lam, n_fold=2),
+                compute_return_error(trajectory, lam, double=True),
+                atol=1e-12
+            )
+
+    def test_k_fold_matches_explicit_concatenation(self):
+        """k-fold error should equal composing k copies of the scaled trajectory"""
+        trajectory = generate_random_trajectory(T=6, r_max=1.0)
+        scaled = scale_trajectory(trajectory, 0.7)
+
+        for k in [3, 4, 8]:
+            repeated = SE3Trajectory(scaled.poses * k, bounded=False)
+            explicit = frobenius_distance_to_identity(compose_trajectory(repeated))
+            assert np.isclose(compute_n_fold_return_error(trajectory, 0.7, n_fold=k), explicit)
+
+    def test_error_curve(self):
+        """Curve entries should match per-k errors, batched over λ"""
+        trajectory = generate_random_trajectory(T=8, r_max=1.0)
+        lambdas = np.array([0.5, 1.0, 1.5])
+        curve = n_fold_return_curve(trajectory, lambdas, max_fold=8)
+
+        assert curve.shape == (3, 8)
+        for k in range(1, 9):
+            assert np.allclose(curve[:, k - 1], compute_n_fold_return_error(trajectory, lambdas, n_fold=k))
+
+    def test_optimize_n_fold(self):
+        """Optimizer result.fun should equal the k-fold error at result.x"""
+        trajectory = generate_random_trajectory(T=8, r_max=1.0)
+        result = optimize_scaling_factor(trajectory, n_fold=4)
+
+        assert compute_n_fold_return_error(trajectory, result.x, n_fold=4) == result.fun
+
+
+
+class TestGlobalSearch:
+    """Test the scan + top-k basin global λ search"""
+
+    def test_never_worse_than_dense_grid(self):
+        """Global mode reaches the best basin that Brent can miss"""
+        for seed in range(5):
+            trajectory = generate_random_trajectory(T=10, rng=seed)
+            dense = ReturnPlan(trajectory).error(np.linspace(0.1, 10.0, 50001)).min()
+            result = optimize_scaling_factor(trajectory, (0.1, 10.0), method='global')
+
+            assert result.fun <= dense + 1e-7
+            assert compute_return_error(trajectory, result.x) == result.fun
+
+    def test_fixed_budget_and_basins(self):
+        """Evaluation count is bounded by resolution + top_k · maxiter"""
+        plan = ReturnPlan(generate_random_trajectory(T=8, rng=9))
+        result = global_scaling_search(plan, (0.1, 10.0), resolution=100, top_k=3, maxiter=20)
+
+        assert result.nfev <= 100 + 3 * 20
+        assert 1 <= len(result.basins) <= 3
+        assert np.all(np.diff(result.basins[:, 1]) >= 0)
+        assert (result.x, result.fun) == tuple(result.basins[0])
+
+class TestReturnDerivatives:
+    """Test analytic λ-derivatives and the Newton optimizer"""
+
+    @pytest.mark.parametrize("n_fold", [1, 2, 3])
+    def test_derivatives_match_finite_differences(self, n_fold):
+        """dE/dλ and d²E/dλ² should match central differences"""
+        np.random.seed(3)
+        trajectory = generate_random_trajectory(T=8, r_max=1.0, rotation_scale=0.5)
+        plan = ReturnPlan(trajectory, n_fold=n_fold)
+        eps = 1e-5
+
+        for lam in [0.3, 0.9, 1.6]:
+            value, first, second = plan.error_derivatives(lam)
+            up, mid, down = plan.error(lam + eps), plan.error(lam), plan.error(lam - eps)
+            assert np.isclose(value, mid, atol=1e-12)
+            assert np.isclose(first, (up - down) / (2 * eps), rtol=1e-6, atol=1e-7)
+            assert np.isclose(second, (up - 2 * mid + down) / eps ** 2, rtol=1e-3, atol=1e-3)
+
+    def test_compute_return_error_with_derivatives(self):
+        """return_derivatives=True should return batched (E, E', E'')"""
+        trajectory = generate_random_trajectory(T=6, r_max=1.0)
+        lambdas = np.array([[0.5, 1.0], [1.5, 2.0]])
+        value, first, second = compute_return_error(trajectory, lambdas, return_derivatives=True)
+
+        assert value.shape == first.shape == second.shape == (2, 2)
+        assert np.allclose(value, compute_return_error(trajectory, lambdas))
+
+    @pytest.mark.parametrize("seed", [0, 2, 7])
+    def test_newton_reaches_local_minimum(self, seed):
+        """Newton mode should land on a local minimum in a few iterations"""
+        np.random.seed(seed)
+        trajectory = generate_random_trajectory(T=6, r_max=0.01, rotation_scale=1.0)
+        plan = ReturnPlan(trajectory)
+        result = optimize_scaling_factor(trajectory, lambda_bounds=(0.1, 3.0), method='newton')
+
+        neighbourhood = np.linspace(max(result.x - 0.01, 0.1), min(result.x + 0.01, 3.0), 2001)
+        assert result.success
+        assert result.nit <= 10
+        assert result.fun <= plan.error(neighbourhood).min() + 1e-9
+        assert compute_return_error(trajectory, result.x) == result.fun
+
+    def test_newton_refines_narrow_kinked_basin(self):
+        """A kinked interior basin below the bound's value must not be lost to the bound"""
+        trajectory = generate_random_trajectory(T=10, rotation_scale=0.3, rng=183)
+        newton = optimize_scaling_factor(trajectory, method='newton')
+        bounded = optimize_scaling_factor(trajectory, method='bounded')
+
+        assert newton.fun <= bounded.fun + 1e-6
+        assert newton.x == pytest.approx(bounded.x, abs=1e-3)
+
+
+class TestVectorizedLandscape:
+    """Test batched λ evaluation and landscape scans"""
+
+    def test_array_lambda_matches_scalar_calls(self):
+        """An array of λ should give the same errors as one call per λ"""
+        trajectory = generate_random_trajectory(T=10, r_max=1.0)
+        lambdas = np.linspace(0.1, 5.0, 37)
+
+        batched = compute_return_error(trajectory, lambdas, double=True)
+        looped = [compute_return_error(trajectory, lam, double=True) for lam in lambdas]
+
+        assert batched.shape == lambdas.shape
+        assert np.allclose(batched, looped, atol=1e-12)
+
+    def test_chunked_evaluation(self):
+        """Sweeps larger than one chunk should be stitched back in order"""
+        trajectory = generate_random_trajectory(T=2000, r_max=1.0)
+        plan = ReturnPlan(trajectory)
+        lambdas = np.linspace(0.1, 2.0, 300)
+
+        errors = plan.error(lambdas)
+        assert np.isclose(errors[123], plan.error(lambdas[123]))
+        assert np.isclose(errors[-1], plan.error(lambdas[-1]))
+
+    def test_landscape_minima(self):
+        """Landscape minima should be local minima of the sampled errors"""
+        trajectory = generate_random_trajectory(T=10, r_max=1.0)
+        landscape = scan_return_landscape(trajectory, (0.1, 10.0), resolution=500)
+
+        assert len(landscape.lambdas) == 500
+        assert len(landscape.minima) >= 1
+        for i in landscape.minima:
+            if i > 0:
+                assert landscape.errors[i] < landscape.errors[i - 1]
+            if i < len(landscape.errors) - 1:
+                assert landscape.errors[i] <= landscape.errors[i + 1]
+
+        best_lambda, best_error = landscape.best()
+        assert best_error == landscape.errors.min()
+        assert best_error in landscape.minimum_errors
+
+    def test_landscape_bounds_optimizer(self):
+        """Bounded optimization cannot beat the grid by more than grid error"""
+        trajectory = generate_random_trajectory(T=10, r_max=1.0)
+        landscape = scan_return_landscape(trajectory, (0.1, 2.0), resolution=2000)
+        result = optimize_scaling_factor(trajectory, lambda_bounds=(0.1, 2.0))
+
+        assert result.fun >= landscape.errors.min() - 1e-3
+
+
 class TestApproximateReturns:
     """Test approximate return to identity mechanism"""
 
@@ -333,6 +735,204 @@ class TestTetheredWalker:
         assert max_distance < 5.0, \
             f"Tethered walk exceeded expected bounds: {max_distance}"
 
+    def test_walker_seed_reproducibility(self):
+        """Walkers with the same seed should follow the same path"""
+        first = TetheredSE3Walker(rng=7).walk(50)
+        second = TetheredSE3Walker(rng=7).walk(50)
+
+        assert len(first) == 50
+        assert np.array_equal(first.translations, second.translations)
+        assert np.array_equal(first.rotations, second.rotations)
+
+    def test_step_uses_private_stream(self):
+        """step() should draw from the walker's own generator only"""
+        np.random.seed(2)
+        before = np.random.get_state()[1].copy()
+        first = TetheredSE3Walker(rng=3).step(dt=0.1)
+        second = TetheredSE3Walker(rng=3).step(dt=0.1)
+
+        assert np.array_equal(first.translation, second.translation)
+        assert np.array_equal(np.random.get_state()[1], before)
+
+
+class TestLieGroupIntegrators:
+    """Test Lie–Euler, Crouch–Grossman and Munthe–Kaas schemes"""
+
+    K = 0.7
+    HOME = SE3Pose.from_rotation_vector(np.array([0.3, -0.2, 0.5]), np.array([1.0, 0.0, 0.0]))
+    START = SE3Pose.from_rotation_vector(np.array([1.5, 0.8, -1.0]), np.zeros(3))
+
+    def _errors(self, integrator, steps, t_end=2.0):
+        walker = TetheredSE3Walker(home=self.HOME, elastic_constant=self.K)
+        # Exact flow: geodesic contraction of log(H^T R) and p - p_H by e^{-kt}
+        decay = np.exp(-self.K * t_end)
+        deviation = SE3Pose(self.HOME.rotation.T @ self.START.rotation, np.zeros(3))
+        exact_rotation = self.HOME.rotation @ SE3Pose.from_rotation_vector(
+            decay * deviation.to_rotation_vector(), np.zeros(3)).rotation
+        exact_translation = self.HOME.translation + decay * (self.START.translation - self.HOME.translation)
+
+        errors = []
+        for n in steps:
+            rotation, translation = self.START.rotation, self.START.translation
+            for _ in range(n):
+                rotation, translation = lie_group_step(
+                    rotation, translation, walker.drift, t_end / n, integrator)
+            errors.append(np.linalg.norm(rotation - exact_rotation)
+                          + np.linalg.norm(translation - exact_translation))
+        return np.array(errors)
+
+    @pytest.mark.parametrize("integrator,order", [
+        (IntegratorType.EXPONENTIAL, 1),
+        (IntegratorType.CROUCH_GROSSMAN, 3),
+        (IntegratorType.MUNTHE_KAAS, 4),
+    ])
+    def test_convergence_order(self, integrator, order):
+        """Halving dt should divide the error by about 2^order"""
+        errors = self._errors(integrator, [8, 16, 32])
+        observed = np.log2(errors[:-1] / errors[1:])
+        assert np.all(observed > order - 0.2)
+
+    @pytest.mark.parametrize("integrator", list(IntegratorType))
+    def test_stays_on_group_for_large_steps(self, integrator):
+        """Rotations remain orthogonal even with dt far beyond Euler stability"""
+        walker = TetheredSE3Walker(elastic_constant=1.0)
+        rotations = np.broadcast_to(self.START.rotation, (5, 3, 3))
+        translations = np.ones((5, 3))
+        for _ in range(20):
+            rotations, translations = lie_group_step(
+                rotations, translations, walker.drift, 1.5, integrator)
+
+        assert rotations.shape == (5, 3, 3)
+        gram = rotations @ np.swapaxes(rotations, -1, -2)
+        assert np.allclose(gram, np.eye(3), atol=1e-12)
+
+    def test_walker_and_ensemble_accept_integrator(self):
+        """Noise-free walkers with an integrator follow the deterministic flow"""
+        walker = TetheredSE3Walker(home=self.HOME, elastic_constant=self.K,
+                                   translation_noise=0.0, rotation_noise=0.0,
+                                   integrator='munthe_kaas')
+        walker.current_position = self.START
+        for _ in range(16):
+            walker.step(dt=0.125)
+        ensemble = TetheredSE3Walker(home=self.HOME, elastic_constant=self.K,
+                                     translation_noise=0.0, rotation_noise=0.0)
+        ensemble.current_position = self.START
+        result = ensemble.simulate_ensemble(3, 16, dt=0.125, integrator='munthe_kaas')
+
+        assert np.allclose(result.final_rotations, walker.current_position.rotation)
+        assert self._errors(IntegratorType.MUNTHE_KAAS, [16])[0] < 1e-5
+
+
+class TestWalkerEnsemble:
+    """Test vectorized ensemble simulation of tethered walkers"""
+
+    def test_single_walker_matches_step(self):
+        """One ensemble member should follow step() given the same noise"""
+        home = SE3Pose.from_rotation_vector(np.array([0.2, 0.0, 0.1]), np.array([0.5, 0.0, 0.0]))
+        walker = TetheredSE3Walker(home=home, elastic_constant=0.3)
+        ensemble = walker.simulate_ensemble(1, 25, dt=0.1, rng=5)
+
+        rng = np.random.default_rng(5)
+        reference = TetheredSE3Walker(home=home, elastic_constant=0.3)
+        for _ in range(25):
+            noise = rng.standard_normal((2, 1, 3))
+            reference._advance(0.1, 0.05 * noise[0, 0], 0.1 * noise[1, 0])
+
+        assert np.allclose(ensemble.final_translations[0], reference.current_position.translation)
+        assert np.allclose(ensemble.final_rotations[0], reference.current_position.rotation)
+        assert np.allclose(walker.current_position.translation, np.zeros(3))
+
+    def test_full_paths_and_summaries(self):
+        """Full mode keeps (M, S) tensors consistent with the summaries"""
+        ensemble = TetheredSE3Walker(rng=0).simulate_ensemble(8, 40)
+
+        assert ensemble.rotations.shape == (8, 40, 3, 3)
+        assert ensemble.translations.shape == (8, 40, 3)
+        distances = np.linalg.norm(ensemble.translations, axis=2)
+        assert np.allclose(ensemble.max_distance, distances.max(axis=1))
+        assert np.allclose(ensemble.mean_distance, distances.mean(axis=1))
+        assert len(ensemble.trajectory(3)) == 40
+
+    def test_streamed_mode_and_per_walker_parameters(self):
+        """Summaries-only mode agrees with full mode; stiffer tethers stay closer"""
+        k = np.array([0.01, 0.01, 2.0, 2.0])
+        full = TetheredSE3Walker().simulate_ensemble(4, 300, elastic_constants=k, rng=1)
+        streamed = TetheredSE3Walker().simulate_ensemble(
+            4, 300, elastic_constants=k, store_paths=False, rng=1)
+
+        assert streamed.rotations is None
+        assert np.array_equal(full.mean_distance, streamed.mean_distance)
+        assert streamed.mean_distance[2:].max() < streamed.mean_distance[:2].min()
+
+
+class TestRandomGenerators:
+    """Test explicit Generator plumbing"""
+
+    def test_as_generator(self):
+        """Generators pass through; seeds spawn equal streams"""
+        rng = np.random.default_rng(0)
+        assert as_generator(rng) is rng
+        assert as_generator(5).random() == as_generator(5).random()
+
+    def test_trajectory_seed_reproducibility(self):
+        """Same seed gives the same trajectory without touching global state"""
+        np.random.seed(1)
+        before = np.random.get_state()[1].copy()
+        first = generate_random_trajectory(T=10, rng=42)
+        second = generate_random_trajectory(T=10, rng=np.random.default_rng(42))
+
+        assert np.array_equal(first.rotations, second.rotations)
+        assert np.array_equal(first.translations, second.translations)
+        assert np.array_equal(np.random.get_state()[1], before)
+
+    def test_legacy_global_seed(self):
+        """Without rng, np.random.seed still makes results reproducible"""
+        np.random.seed(9)
+        first = generate_random_trajectory(T=5)
+        np.random.seed(9)
+        second = generate_random_trajectory(T=5)
+
+        assert np.array_equal(first.translations, second.translations)
+
+
+class TestBatchTrajectoryGenerator:
+    """Test vectorized generation of K trajectories"""
+
+    @pytest.mark.parametrize("distribution", ['gaussian', 'uniform', 'haar', 'heavy_tailed'])
+    def test_shapes_and_bounds(self, distribution):
+        """Every distribution yields valid, bounded (K, T) blocks"""
+        batch = generate_random_trajectories(50, T=8, distribution=distribution, rng=0)
+
+        assert isinstance(batch, SE3TrajectoryBatch)
+        assert batch.rotations.shape == (50, 8, 3, 3)
+        assert batch.translations.shape == (50, 8, 3)
+        assert np.allclose(np.linalg.det(batch.rotations), 1.0)
+        assert np.all(np.linalg.norm(batch.translations, axis=-1) <= 1.0)
+        assert len(batch[3]) == 8
+
+    def test_haar_angle_distribution(self):
+        """Haar rotation angles follow P(ω) = (1 - cos ω)/π, mean π/2 + 2/π"""
+        batch = generate_random_trajectories(2000, T=10, distribution='haar', rng=1)
+        angles = np.linalg.norm(batch.rotation_vectors(), axis=-1)
+
+        assert angles.mean() == pytest.approx(np.pi / 2 + 2 / np.pi, abs=0.02)
+
+    def test_heavy_tails_exceed_gaussian(self):
+        """Student-t steps produce far larger extremes than Gaussian ones"""
+        gaussian = generate_random_trajectories(500, T=10, rng=2, bounded=False)
+        heavy = generate_random_trajectories(500, T=10, rng=2, bounded=False,
+                                             distribution='heavy_tailed', tail_df=1.5)
+
+        assert np.abs(heavy.translations).max() > 5 * np.abs(gaussian.translations).max()
+
+    def test_return_plan_matches_members(self):
+        """The batch plan reproduces per-trajectory return errors"""
+        batch = generate_random_trajectories(6, T=5, r_max=2.0, rng=3)
+        errors = batch.return_plan().error(np.full(6, 0.7))
+
+        for k in range(6):
+            assert errors[k] == pytest.approx(compute_return_error(batch[k], 0.7))
+
 
 class TestInterventionInterference:
     """Test interference prediction between interventions"""
@@ -0,0 +1,75 @@
+"""
+Test Suite for Quasi-Monte Carlo Trajectory Sampling
+
+Checks that every sampler keeps the Gaussian trajectory law, that QMC and
+stratification reduce replicate variance, and the replicated estimator.
+"""
+
+import pytest
+import numpy as np
+from scipy import stats
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from se3_double_scale import SE3TrajectoryBatch
+from trajectory_sampling import (
+    SAMPLING_METHODS, FrequencyEstimate,
+    generate_sampled_trajectories, estimate_attractor_frequencies
+)
+
+
+class TestSampledTrajectories:
+    """Test the sampling law of every method"""
+
+    @pytest.mark.parametrize("method", SAMPLING_METHODS)
+    def test_gaussian_marginals_and_bounds(self, method):
+        """Rotation vectors and translations are N(0, σ²) per axis and bounded"""
+        batch = generate_sampled_trajectories(1024, T=5, rotation_scale=0.3, method=method, rng=0)
+        assert isinstance(batch, SE3TrajectoryBatch) and len(batch) == 1024
+
+        rotation = batch.rotation_vectors()[..., 0].ravel() / 0.3
+        translation = batch.translations[..., 1].ravel() / (1.0 / 5)
+        assert stats.kstest(rotation, 'norm').pvalue > 1e-3
+        assert stats.kstest(translation, 'norm').pvalue > 1e-3
+        assert np.linalg.norm(batch.translations, axis=-1).max() <= 1.0
+
+    def test_variance_reduction_on_additive_statistic(self):
+        """Mean squared rotation angle varies far less across QMC/stratified replicates"""
+        def spread(method):
+            values = [
+                (np.linalg.norm(generate_sampled_trajectories(
+                    256, method=method, rotation_scale=0.5, rng=seed).rotation_vectors(), axis=-1) ** 2).mean()
+                for seed in range(16)
+            ]
+            return np.std(values)
+
+        baseline = spread('random')
+        for method in ('sobol', 'halton', 'stratified'):
+            assert spread(method) < baseline / 3
+
+    def test_unknown_method_rejected(self):
+        with pytest.raises(AssertionError):
+            generate_sampled_trajectories(8, method='lattice')
+
+
+class TestReplicatedEstimate:
+    """Test randomized-QMC attractor frequency estimates"""
+
+    def test_estimate_is_reproducible_and_normalized(self):
+        """Frequencies sum to one and a seed reproduces the estimate"""
+        first = estimate_attractor_frequencies(32, replicates=3, rotation_scale=1.0,
+                                               lambda_bounds=(0.1, 10.0), rng=1)
+        second = estimate_attractor_frequencies(32, replicates=3, rotation_scale=1.0,
+                                                lambda_bounds=(0.1, 10.0), rng=1)
+
+        assert isinstance(first, FrequencyEstimate)
+        assert first == second
+        assert sum(first.frequencies.values()) == pytest.approx(1.0)
+        assert all(error >= 0 for error in first.standard_errors.values())
+        assert 0.1 <= first.mean_lambda <= 10.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
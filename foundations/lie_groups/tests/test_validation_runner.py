@@ -0,0 +1,73 @@
+"""
+Test Suite for the Parallel Monte Carlo Runner
+
+Checks per-trial seed streams, worker-count independence and the
+λ-attractor aggregation.
+"""
+
+import pytest
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from resonance_aware import ResonanceDetector
+from validation_runner import (
+    MonteCarloConfig,
+    attractor_frequencies,
+    run_monte_carlo,
+    run_trial
+)
+
+
+class TestSeedStreams:
+    """Test reproducibility of individual trials"""
+
+    def test_trial_is_deterministic(self):
+        """The same (seed, trial) should reproduce the same record"""
+        config = MonteCarloConfig(n_trials=1, seed=11)
+        assert run_trial(config, 3) == run_trial(config, 3)
+
+    def test_trials_differ_and_global_state_untouched(self):
+        """Different trials use different streams; the global RNG is restored"""
+        config = MonteCarloConfig(n_trials=2, seed=11)
+        np.random.seed(123)
+        before = np.random.get_state()[1].copy()
+
+        assert run_trial(config, 0).return_error != run_trial(config, 1).return_error
+        assert np.array_equal(np.random.get_state()[1], before)
+
+
+class TestParallelRunner:
+    """Test process-pool sharding"""
+
+    def test_worker_count_does_not_change_results(self):
+        """Serial and pooled runs must be bit-identical"""
+        config = MonteCarloConfig(n_trials=12, seed=5)
+        serial = run_monte_carlo(config, workers=1)
+        pooled = run_monte_carlo(config, workers=3)
+
+        assert serial.records == pooled.records
+        assert serial.attractor_frequencies == pooled.attractor_frequencies
+        assert [record.trial for record in pooled.records] == list(range(12))
+
+
+class TestAttractorFrequencies:
+    """Test λ-attractor aggregation"""
+
+    def test_frequencies(self):
+        """Values are attributed to the nearest constant within tolerance"""
+        detector = ResonanceDetector(tolerance=0.05)
+        lambdas = np.array([0.62, 0.61, 1.5, 0.9, 2.01])
+        frequencies = attractor_frequencies(lambdas, detector)
+
+        assert frequencies['golden_ratio'] == pytest.approx(0.4)
+        assert frequencies['perfect_fifth'] == pytest.approx(0.2)
+        assert frequencies['octave'] == pytest.approx(0.2)
+        assert frequencies['none'] == pytest.approx(0.2)
+        assert sum(frequencies.values()) == pytest.approx(1.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
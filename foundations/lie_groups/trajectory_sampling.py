@@ -0,0 +1,218 @@
+"""
+Quasi-Monte Carlo and Stratified Trajectory Sampling
+
+Phase 1 estimates λ-attractor frequencies from pseudo-random trajectories,
+whose error shrinks as 1/√N. Every trajectory costs one
+optimize_scaling_factor call, so this module provides low-discrepancy and
+stratified samplers with the same distribution as
+generate_random_trajectories(distribution='gaussian'):
+
+- 'sobol' / 'halton': scrambled low-discrepancy points in [0, 1)^(6T),
+  mapped through the normal inverse CDF onto the 3 rotation-vector and 3
+  translation coordinates of every step
+- 'stratified': Latin hypercube over rotation magnitude. For each step, the
+  K rotation magnitudes take one value from each of K equal-probability
+  strata of rotation_scale · χ₃. Directions and translations are
+  pseudo-random.
+- 'random': plain pseudo-random draws (baseline, the draws of
+  generate_random_trajectories)
+
+Scrambled sequences are randomized QMC. Independent replicates are unbiased,
+and their spread gives an honest standard error (estimate_attractor_frequencies).
+
+Example:
+    >>> batch = generate_sampled_trajectories(1024, method='sobol', rng=0)
+    >>> estimate = estimate_attractor_frequencies(256, replicates=8, rng=0)
+    >>> print(estimate.frequencies['golden_ratio'], estimate.standard_errors['golden_ratio'])
+"""
+
+import numpy as np
+from typing import Dict, Optional, Tuple
+from dataclasses import dataclass
+from scipy import stats
+from scipy.stats import qmc
+
+from se3_double_scale import SE3TrajectoryBatch, RandomSource, as_generator
+from lie_kernels import so3_exp
+from batch_optimize import optimize_scaling_factors
+from resonance_aware import ResonanceDetector
+from attractor_statistics import AttractorStatistics
+
+
+SAMPLING_METHODS = ('random', 'sobol', 'halton', 'stratified')
+
+# Keep inverse-CDF inputs off 0 and 1 (unscrambled Sobol starts at the origin)
+_UNIT_EPS = 1e-12
+
+
+def _low_discrepancy_points(
+    method: str,
+    n: int,
+    d: int,
+    scramble: bool,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """(n, d) Sobol or Halton points, clipped into the open unit cube"""
+    engine = qmc.Sobol(d, scramble=scramble, seed=rng) if method == 'sobol' \
+        else qmc.Halton(d, scramble=scramble, seed=rng)
+    return np.clip(engine.random(n), _UNIT_EPS, 1.0 - _UNIT_EPS)
+
+
+def _stratified_magnitudes(rng: np.random.Generator, K: int, T: int) -> np.ndarray:
+    """
+    (K, T) χ₃ magnitudes, one per equal-probability stratum for every step,
+    with strata independently permuted across steps (Latin hypercube)
+    """
+    strata = np.argsort(rng.random((T, K)), axis=1).T
+    u = (strata + rng.random((K, T))) / K
+    return stats.chi.ppf(np.clip(u, _UNIT_EPS, 1.0 - _UNIT_EPS), df=3)
+
+
+def generate_sampled_trajectories(
+    K: int,
+    T: int = 10,
+    r_max: float = 1.0,
+    rotation_scale: float = 0.1,
+    bounded: bool = True,
+    method: str = 'sobol',
+    scramble: bool = True,
+    rng: RandomSource = None
+) -> SE3TrajectoryBatch:
+    """
+    Generate K Gaussian SE(3) trajectories with variance-reduced sampling [3.1, 4.1]
+
+    Every method has the law of generate_random_trajectories(distribution=
+    'gaussian'): rotation vectors N(0, rotation_scale²) and translations
+    N(0, (r_max/T)²) per axis. When bounded, the rare translation beyond
+    r_max is projected radially onto the r_max sphere.
+
+    Args:
+        K: Number of trajectories (a power of 2 keeps Sobol points balanced)
+        T: Number of steps per trajectory
+        r_max: Maximum translation radius
+        rotation_scale: Scale of random rotations (radians)
+        bounded: Whether to enforce bounds
+        method: One of SAMPLING_METHODS
+        scramble: Scramble Sobol/Halton points (required for unbiased replicates)
+        rng: Generator or seed (default: seeded from the global np.random state)
+
+    Returns:
+        SE3TrajectoryBatch with (K, T, 3, 3) rotations and (K, T, 3) translations
+    """
+    assert method in SAMPLING_METHODS, \
+        f"Unknown sampling method '{method}', expected one of {SAMPLING_METHODS}"
+    rng = as_generator(rng)
+    step_scale = r_max / T
+
+    if method == 'random':
+        rot_vecs = rng.standard_normal((K, T, 3)) * rotation_scale
+        translations = rng.standard_normal((K, T, 3)) * step_scale
+    elif method == 'stratified':
+        directions = rng.standard_normal((K, T, 3))
+        directions /= np.maximum(np.linalg.norm(directions, axis=-1, keepdims=True), 1e-300)
+        rot_vecs = directions * (_stratified_magnitudes(rng, K, T) * rotation_scale)[..., None]
+        translations = rng.standard_normal((K, T, 3)) * step_scale
+    else:
+        normal = stats.norm.ppf(_low_discrepancy_points(method, K, 6 * T, scramble, rng))
+        normal = normal.reshape(K, T, 6)
+        rot_vecs = normal[..., :3] * rotation_scale
+        translations = normal[..., 3:] * step_scale
+
+    if bounded:
+        # Shrink by one part in 10¹² so rounding cannot overshoot r_max
+        norms = np.linalg.norm(translations, axis=-1, keepdims=True)
+        translations *= np.minimum(1.0, r_max * (1.0 - 1e-12) / np.maximum(norms, 1e-300))
+
+    return SE3TrajectoryBatch(so3_exp(rot_vecs), translations, bounded=bounded, r_max=r_max)
+
+
+# ============================================================================
+# Replicated estimation
+# ============================================================================
+
+@dataclass
+class FrequencyEstimate:
+    """
+    λ-attractor frequencies averaged over independent sampling replicates.
+
+    Attributes:
+        frequencies: Mean frequency per constant (and 'none')
+        standard_errors: Replicate standard error per constant (and 'none')
+        mean_lambda: Mean λ_opt over all trajectories
+        mean_lambda_error: Replicate standard error of mean_lambda
+        n_trajectories: Trajectories per replicate
+        replicates: Number of independent replicates
+        method: Sampling method used
+    """
+    frequencies: Dict[str, float]
+    standard_errors: Dict[str, float]
+    mean_lambda: float
+    mean_lambda_error: float
+    n_trajectories: int
+    replicates: int
+    method: str
+
+
+def estimate_attractor_frequencies(
+    K: int,
+    replicates: int = 8,
+    method: str = 'sobol',
+    T: int = 10,
+    r_max: float = 1.0,
+    rotation_scale: float = 0.1,
+    bounded: bool = True,
+    lambda_bounds: Tuple[float, float] = (0.1, 2.0),
+    detector: Optional[ResonanceDetector] = None,
+    rng: RandomSource = None
+) -> FrequencyEstimate:
+    """
+    Estimate Phase 1 attractor frequencies with randomized (Q)MC replicates.
+
+    Each replicate samples K trajectories with `method`, optimizes their λ in
+    lockstep (optimize_scaling_factors) and classifies the optima. Replicates
+    are independent, so the standard error is the replicate standard
+    deviation over √replicates, for every method alike.
+
+    Args:
+        K: Trajectories per replicate
+        replicates: Independent replicates (≥ 2 for a standard error)
+        method: One of SAMPLING_METHODS
+        T: Steps per trajectory
+        r_max: Translation bound of the generated trajectories
+        rotation_scale: Scale of random rotations (radians)
+        bounded: Whether generated trajectories enforce r_max
+        lambda_bounds: Search bounds for λ_opt
+        detector: Supplies constants and tolerance (default: ResonanceDetector())
+        rng: Generator or seed for the replicate seed streams
+
+    Returns:
+        FrequencyEstimate
+    """
+    assert replicates >= 2, "Need at least two replicates for a standard error"
+    detector = detector if detector is not None else ResonanceDetector()
+    streams = np.random.SeedSequence(int(as_generator(rng).integers(2 ** 63))).spawn(replicates)
+
+    per_replicate = []
+    means = np.empty(replicates)
+    for r, stream in enumerate(streams):
+        batch = generate_sampled_trajectories(
+            K, T=T, r_max=r_max, rotation_scale=rotation_scale, bounded=bounded,
+            method=method, rng=stream
+        )
+        lambdas = optimize_scaling_factors(batch, lambda_bounds=lambda_bounds).x
+        per_replicate.append(AttractorStatistics(detector).update(lambdas).frequencies())
+        means[r] = lambdas.mean()
+
+    names = list(per_replicate[0])
+    table = np.array([[frequencies[name] for name in names] for frequencies in per_replicate])
+    errors = table.std(axis=0, ddof=1) / np.sqrt(replicates)
+
+    return FrequencyEstimate(
+        frequencies=dict(zip(names, table.mean(axis=0).tolist())),
+        standard_errors=dict(zip(names, errors.tolist())),
+        mean_lambda=float(means.mean()),
+        mean_lambda_error=float(means.std(ddof=1) / np.sqrt(replicates)),
+        n_trajectories=K,
+        replicates=replicates,
+        method=method
+    )
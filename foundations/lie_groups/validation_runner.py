@@ -0,0 +1,256 @@
+"""
+Parallel Monte Carlo Validation Runner
+
+VALIDATION_METHODOLOGY.md Phase 1 asks for N ≥ 1000 random trajectories, and
+VALIDATION_PROTOCOLS.md §5-7 sets a runtime budget of ≤ 1 hour per 1000
+iterations with every seed logged. This module runs the Phase 1 pipeline
+
+    generate_random_trajectory → optimize_scaling_factor
+                               → ResonanceDetector.detect_natural_scaling
+
+for each trial, with trials sharded across a process pool.
+
+Reproducibility:
+- Trial i draws from its own seed stream SeedSequence(seed, spawn_key=(i,)),
+  so a trial's randomness depends only on (seed, i)
+- Shards are reassembled in trial order, so results are bit-identical for
+  any worker count (including the in-process serial path, workers=1)
+
+The report aggregates λ-attractor frequencies: the fraction of trials whose
+optimal λ falls within the detector tolerance of each mathematical constant.
+Each shard streams its λ values into an AttractorStatistics aggregate and
+the parent merges them, so with keep_records=False memory stays constant in
+the number of trials.
+"""
+
+import os
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+
+from se3_double_scale import generate_random_trajectory, optimize_scaling_factor
+from resonance_aware import ResonanceDetector
+from attractor_statistics import AttractorStatistics
+
+
+@dataclass
+class MonteCarloConfig:
+    """
+    Parameters of a Phase 1 Monte Carlo run.
+
+    Attributes:
+        n_trials: Number of random trajectories (N ≥ 1000 for Phase 1)
+        seed: Root seed; trial i uses the stream SeedSequence(seed, spawn_key=(i,))
+        T: Steps per trajectory
+        r_max: Translation bound of the generated trajectories
+        rotation_scale: Scale of random rotations (radians)
+        bounded: Whether generated trajectories enforce r_max
+        lambda_bounds: Search bounds for λ_opt
+        tolerance: Relative resonance tolerance (ResonanceDetector)
+        keep_records: Keep every TrialRecord (False: streaming statistics only)
+    """
+    n_trials: int = 1000
+    seed: int = 0
+    T: int = 10
+    r_max: float = 1.0
+    rotation_scale: float = 0.1
+    bounded: bool = True
+    lambda_bounds: Tuple[float, float] = (0.1, 2.0)
+    tolerance: float = 0.1
+    keep_records: bool = True
+
+
+@dataclass
+class TrialRecord:
+    """Outcome of a single Monte Carlo trial"""
+    trial: int
+    lambda_opt: float
+    return_error: float
+    best_resonance: str
+    resonance_error: float
+    is_natural: bool
+    nearest_resonance: str
+    nearest_distance: float
+
+
+@dataclass
+class MonteCarloReport:
+    """
+    Aggregated Monte Carlo results.
+
+    Attributes:
+        config: Configuration the run was made with
+        records: Per-trial records in trial order (empty unless keep_records)
+        attractor_frequencies: Fraction of trials whose λ_opt lies within the
+            relative tolerance of each constant ('none' for the remainder)
+        natural_fraction: Fraction of trials the detector flagged as natural
+        statistics: Streaming aggregate of all λ_opt values
+    """
+    config: MonteCarloConfig
+    records: List[TrialRecord]
+    attractor_frequencies: Dict[str, float] = field(default_factory=dict)
+    natural_fraction: float = 0.0
+    statistics: Optional[AttractorStatistics] = None
+
+    @property
+    def lambdas(self) -> np.ndarray:
+        """(N,) optimal λ per trial"""
+        return np.array([record.lambda_opt for record in self.records])
+
+    @property
+    def errors(self) -> np.ndarray:
+        """(N,) return error at λ_opt per trial"""
+        return np.array([record.return_error for record in self.records])
+
+    def __len__(self) -> int:
+        return self.statistics.count if self.statistics is not None else len(self.records)
+
+
+def trial_seed_sequence(seed: int, trial: int) -> np.random.SeedSequence:
+    """Independent seed stream of one trial (independent of sharding)"""
+    return np.random.SeedSequence(entropy=seed, spawn_key=(trial,))
+
+
+def run_trial(config: MonteCarloConfig, trial: int) -> TrialRecord:
+    """
+    Run one trial of the Phase 1 pipeline on its own seed stream.
+
+    Args:
+        config: Monte Carlo configuration
+        trial: Trial index
+
+    Returns:
+        TrialRecord for this trial
+    """
+    trajectory = generate_random_trajectory(
+        T=config.T,
+        r_max=config.r_max,
+        rotation_scale=config.rotation_scale,
+        bounded=config.bounded,
+        rng=np.random.default_rng(trial_seed_sequence(config.seed, trial))
+    )
+
+    result = optimize_scaling_factor(trajectory, lambda_bounds=config.lambda_bounds)
+    detector = ResonanceDetector(tolerance=config.tolerance)
+    resonance = detector.detect_natural_scaling(trajectory)
+    nearest_name, _, distance = detector.find_nearest_resonance(float(result.x))
+
+    return TrialRecord(
+        trial=trial,
+        lambda_opt=float(result.x),
+        return_error=float(result.fun),
+        best_resonance=resonance.best_resonance,
+        resonance_error=resonance.best_error,
+        is_natural=resonance.is_natural,
+        nearest_resonance=nearest_name,
+        nearest_distance=float(distance)
+    )
+
+
+def _run_shard(
+    config: MonteCarloConfig,
+    trials: Sequence[int]
+) -> Tuple[List[TrialRecord], AttractorStatistics, int]:
+    """
+    Run a contiguous block of trials (one process-pool task).
+
+    Returns:
+        (records if kept, λ_opt aggregate, number of trials flagged natural)
+    """
+    statistics = AttractorStatistics(ResonanceDetector(tolerance=config.tolerance))
+    records = []
+    natural = 0
+    for trial in trials:
+        record = run_trial(config, int(trial))
+        statistics.update(record.lambda_opt)
+        natural += record.is_natural
+        if config.keep_records:
+            records.append(record)
+    return records, statistics, natural
+
+
+def attractor_frequencies(
+    lambdas: np.ndarray,
+    detector: Optional[ResonanceDetector] = None
+) -> Dict[str, float]:
+    """
+    Fraction of λ values lying within tolerance of each resonance constant.
+
+    A value counts toward a constant when |λ - c| ≤ tolerance · c; each value
+    is attributed to its nearest constant only. Values near no constant are
+    counted under 'none'. For streams too large to hold, feed batches to an
+    AttractorStatistics instead.
+
+    Args:
+        lambdas: (N,) optimal λ values
+        detector: Supplies constants and tolerance (default: ResonanceDetector())
+
+    Returns:
+        Dictionary mapping constant name (and 'none') to frequency
+    """
+    return AttractorStatistics(detector).update(lambdas).frequencies()
+
+
+def available_workers() -> int:
+    """Cores this process may run on (respects CPU affinity where supported)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def run_monte_carlo(
+    config: MonteCarloConfig,
+    workers: Optional[int] = None,
+    shards_per_worker: int = 4
+) -> MonteCarloReport:
+    """
+    Run a Monte Carlo validation across a process pool.
+
+    Args:
+        config: Monte Carlo configuration
+        workers: Number of processes (default: every available core;
+            1 runs serially in this process)
+        shards_per_worker: Trial blocks per worker (load balancing)
+
+    Returns:
+        MonteCarloReport; identical for any worker count
+
+    Example:
+        >>> report = run_monte_carlo(MonteCarloConfig(n_trials=1000, seed=42))
+        >>> print(report.attractor_frequencies['golden_ratio'])
+    """
+    workers = available_workers() if workers is None else workers
+    assert workers >= 1, "workers must be a positive integer"
+
+    trials = np.arange(config.n_trials)
+    if workers == 1 or config.n_trials <= 1:
+        results = [_run_shard(config, trials)]
+    else:
+        shards = [s for s in np.array_split(trials, workers * shards_per_worker) if len(s)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_run_shard, [config] * len(shards), shards))
+
+    records = [record for shard_records, _, _ in results for record in shard_records]
+    statistics = AttractorStatistics(ResonanceDetector(tolerance=config.tolerance))
+    natural = 0
+    for _, shard_statistics, shard_natural in results:
+        statistics.merge(shard_statistics)
+        natural += shard_natural
+
+    return MonteCarloReport(
+        config=config,
+        records=records,
+        attractor_frequencies=statistics.frequencies(),
+        natural_fraction=natural / statistics.count if statistics.count else 0.0,
+        statistics=statistics
+    )
+
+
+if __name__ == "__main__":
+    report = run_monte_carlo(MonteCarloConfig())
+    print(f"Trials: {len(report)}  workers: {available_workers()}")
+    for name, frequency in sorted(report.attractor_frequencies.items(), key=lambda kv: -kv[1]):
+        print(f"  {name:15s} {frequency:6.1%}")
+    print(f"Natural (detector): {report.natural_fraction:.1%}")
+    print(f"λ_opt median: {report.statistics.quantile(0.5):.4f}")